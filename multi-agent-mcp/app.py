@@ -1,5 +1,5 @@
 
-from flask import Flask, request, jsonify, send_from_directory, send_file, render_template, Response, session, redirect, make_response
+from flask import Flask, request, jsonify, send_from_directory, send_file, render_template, Response, session, redirect, make_response, g
 from flask_cors import CORS
 import time
 import sys
@@ -623,20 +623,21 @@ def apm_services_page():
 def api_statusmonitor():
     """API endpoint for status monitor dashboard data"""
     try:
-        from tools.status_monitor import status_monitor_dashboard
+        from tools.status_monitor import status_monitor_dashboard_snapshot
         
         data = request.get_json() or {}
         timerange = data.get('timerange', 1)
         environment = data.get('environment', None)  # Optional: specific environment
         force_refresh = bool(data.get('force_refresh') or data.get('forceRefresh'))
         
-        html_content = status_monitor_dashboard(
+        html_content, snapshot = status_monitor_dashboard_snapshot(
             timerange=timerange, environment=environment, force_refresh=force_refresh
         )
         
         return jsonify({
             'success': True,
-            'html': html_content
+            'html': html_content,
+            'snapshot': snapshot
         })
     except Exception as e:
         logging.error(f"Error in status monitor: {str(e)}")
@@ -679,16 +680,104 @@ def api_statusmonitor_partial():
         return jsonify({'success': False, 'error': str(e), 'part': (request.get_json(silent=True) or {}).get('part')}), 500
 
 
-@flask_app.route('/api/statusmonitor/hub-summary', methods=['POST'])
+@flask_app.route('/api/statusmonitor/stream', methods=['GET'])
+def api_statusmonitor_stream():
+    """
+    Server-Sent Events for /statusmonitor/<env>: every incremental fragment (meta, bootstrap, sidebar,
+    per-env APM, finalize) from one server-side computation. Query: timerange, environment, force_refresh.
+    """
+    from tools.status_monitor import status_monitor_incremental_stream
+
+    try:
+        timerange = int(request.args.get('timerange', 1))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'invalid timerange'}), 400
+    environment = request.args.get('environment') or None
+    force_refresh = (request.args.get('force_refresh') or '').strip().lower() in ('1', 'true', 'yes')
+    return Response(
+        status_monitor_incremental_stream(timerange=timerange, environment=environment, force_refresh=force_refresh),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@flask_app.before_request
+def _statusmonitor_perf_begin():
+    """
+    Collect per-phase timers for /api/statusmonitor/* (emitted as Server-Timing). SSE routes are
+    skipped: their headers go out before the stream produces anything, so there is nothing to report.
+    """
+    if request.path.startswith('/api/statusmonitor') and not request.path.endswith('/stream'):
+        from tools.status_monitor_timing import begin_request
+
+        g.sm_perf = (begin_request(), time.perf_counter())
+
+
+@flask_app.after_request
+def _statusmonitor_perf_end(response):
+    perf = g.pop('sm_perf', None)
+    if perf is not None:
+        from tools.status_monitor_timing import end_request, server_timing_header
+
+        token, t0 = perf
+        samples = end_request(token)
+        if response.mimetype != 'text/event-stream':
+            response.headers['Server-Timing'] = server_timing_header(samples, time.perf_counter() - t0)
+    return response
+
+
+@flask_app.teardown_request
+def _statusmonitor_perf_teardown(_exc):
+    # after_request is skipped on unhandled errors: never leave a collector on a pooled thread
+    perf = g.pop('sm_perf', None)
+    if perf is not None:
+        from tools.status_monitor_timing import end_request
+
+        end_request(perf[0])
+
+
+def _statusmonitor_view_params():
+    """View parameters: JSON body on POST, query string on GET (conditional polls)."""
+    if request.method == 'POST':
+        return request.get_json() or {}
+    data = request.args.to_dict()
+    for key in ('force_refresh', 'forceRefresh'):
+        if key in data:
+            data[key] = data[key].strip().lower() in ('1', 'true', 'yes')
+    return data
+
+
+def _statusmonitor_json_response(payload, memo_key):
+    """
+    JSON for polled status monitor views: ETag from the snapshot content and version (304 on
+    If-None-Match for GET polls only), body compressed with brotli/gzip when the client accepts it
+    (STATUS_MONITOR_HTTP_COMPRESS).
+    """
+    from tools.status_monitor_http import encode_body, etag_matches, json_body, pick_encoding, view_etag
+
+    etag = view_etag(payload, memo_key)
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+    if request.method in ('GET', 'HEAD') and etag_matches(request.headers.get('If-None-Match'), etag):
+        return Response(status=304, headers=headers)
+    body, encoding = encode_body(json_body(payload), pick_encoding(request.headers.get('Accept-Encoding')))
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return Response(body, status=200, mimetype='application/json', headers=headers)
+
+
+@flask_app.route('/api/statusmonitor/hub-summary', methods=['GET', 'POST'])
 def api_statusmonitor_hub_summary():
     """JSON summary for /statusmonitor hub (one row per environment, Datadog health)."""
     try:
         from tools.status_monitor import status_monitor_hub_summary
 
-        data = request.get_json() or {}
+        data = _statusmonitor_view_params()
         timerange = int(data.get('timerange', 1))
         force_refresh = bool(data.get('force_refresh') or data.get('forceRefresh'))
-        return jsonify(status_monitor_hub_summary(timerange=timerange, force_refresh=force_refresh))
+        return _statusmonitor_json_response(
+            status_monitor_hub_summary(timerange=timerange, force_refresh=force_refresh),
+            f"hub|{timerange}",
+        )
     except Exception as e:
         logging.error(f"Error in status monitor hub summary: {e}")
         import traceback
@@ -696,16 +785,19 @@ def api_statusmonitor_hub_summary():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-@flask_app.route('/api/statusmonitor/wall', methods=['POST'])
+@flask_app.route('/api/statusmonitor/wall', methods=['GET', 'POST'])
 def api_statusmonitor_wall():
     """JSON payload for /statuswall (grouped service tiles, same health logic as hub)."""
     try:
         from tools.status_monitor import status_monitor_wall_data
 
-        data = request.get_json() or {}
+        data = _statusmonitor_view_params()
         timerange = int(data.get('timerange', 1))
         force_refresh = bool(data.get('force_refresh') or data.get('forceRefresh'))
-        return jsonify(status_monitor_wall_data(timerange=timerange, force_refresh=force_refresh))
+        return _statusmonitor_json_response(
+            status_monitor_wall_data(timerange=timerange, force_refresh=force_refresh),
+            f"wall|{timerange}",
+        )
     except Exception as e:
         logging.error(f"Error in status monitor wall: {e}")
         import traceback
@@ -713,7 +805,7 @@ def api_statusmonitor_wall():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-@flask_app.route("/api/statusmonitor/software-catalog-wall", methods=["POST"])
+@flask_app.route("/api/statusmonitor/software-catalog-wall", methods=["GET", "POST"])
 def api_statusmonitor_software_catalog_wall():
     """
     JSON for /apm-services: APM Status Wall. Body: dd_env
@@ -726,7 +818,7 @@ def api_statusmonitor_software_catalog_wall():
             status_monitor_software_catalog_wall_data,
         )
 
-        data = request.get_json() or {}
+        data = _statusmonitor_view_params()
         timerange = int(data.get("timerange", 24))
         force_refresh = bool(
             data.get("force_refresh") or data.get("forceRefresh")
@@ -735,10 +827,11 @@ def api_statusmonitor_software_catalog_wall():
         dd_e = normalize_software_catalog_wall_dd_env(
             (raw_dd if raw_dd is not None and str(raw_dd).strip() else None)
         )
-        return jsonify(
+        return _statusmonitor_json_response(
             status_monitor_software_catalog_wall_data(
                 timerange=timerange, force_refresh=force_refresh, dd_env=dd_e
-            )
+            ),
+            f"apm|{timerange}|{dd_e}",
         )
     except Exception as e:
         logging.error(f"Error in software catalog wall: {e}")
@@ -748,6 +841,57 @@ def api_statusmonitor_software_catalog_wall():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@flask_app.route("/api/statusmonitor/wall/stream", methods=["GET"])
+def api_statusmonitor_wall_stream():
+    """
+    Server-Sent Events for /statuswall and /apm-services: full snapshot first, then per-tile deltas.
+    Query: view=wall|apm, timerange, envs=production,goldendev (apm), last_event_id (Last-Event-ID header wins).
+    Threaded workers hold the stream open (STATUS_MONITOR_WALL_STREAM_MAX_SECS); sync workers send the
+    catch-up delta and close so a TV never pins a worker — the browser reconnects after `retry`.
+    """
+    from tools.status_monitor import normalize_software_catalog_wall_dd_env, status_monitor_wall_stream
+
+    view = "apm" if (request.args.get("view") or "wall").strip().lower() == "apm" else "wall"
+    try:
+        timerange = int(request.args.get("timerange", 24 if view == "apm" else 1))
+    except ValueError:
+        return jsonify({"success": False, "error": "invalid timerange"}), 400
+    if view == "apm":
+        raw_envs = [e.strip() for e in (request.args.get("envs") or "all").split(",") if e.strip()]
+        channels = list(dict.fromkeys(normalize_software_catalog_wall_dd_env(e) for e in raw_envs))[:12]
+    else:
+        channels = ["wall"]
+    # EventSource reconnects send the newer Last-Event-ID header; the query param seeds the first connect
+    cursor = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+
+    hold_mode = (os.getenv("STATUS_MONITOR_WALL_STREAM_HOLD") or "auto").strip().lower()
+    if hold_mode in ("1", "true", "yes", "on"):
+        hold = True
+    elif hold_mode in ("0", "false", "no", "off"):
+        hold = False
+    else:
+        hold = bool(request.environ.get("wsgi.multithread"))
+    try:
+        max_secs = max(10, min(3600, int(os.getenv("STATUS_MONITOR_WALL_STREAM_MAX_SECS") or "300")))
+        poll_retry_ms = max(2000, min(600000, int(os.getenv("STATUS_MONITOR_WALL_STREAM_RETRY_MS") or "30000")))
+    except ValueError:
+        max_secs, poll_retry_ms = 300, 30000
+
+    gen = status_monitor_wall_stream(
+        view,
+        timerange,
+        channels,
+        cursor=cursor,
+        hold_secs=max_secs if hold else 0.0,
+        retry_ms=3000 if hold else poll_retry_ms,
+    )
+    return Response(
+        gen,
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ========================================
 # REST API Endpoints for Metrics & History
 # ========================================
@@ -1119,6 +1263,42 @@ def api_clear_cache():
         }), 500
 
 
+@flask_app.route('/api/statusmonitor/cache-stats', methods=['GET'])
+def api_statusmonitor_cache_stats():
+    """Snapshot cache backend, size and hit/miss counters (counters are per worker)."""
+    from tools.status_monitor import status_monitor_cache_stats
+
+    stats = status_monitor_cache_stats()
+    stats['pid'] = os.getpid()
+    stats['timestamp'] = datetime.utcnow().isoformat()
+    return jsonify(stats)
+
+
+@flask_app.route('/api/perf/status-monitor', methods=['GET'])
+def api_perf_status_monitor():
+    """Per-phase timing percentiles (ms) by environment for status monitor views (this worker)."""
+    from tools.status_monitor_timing import perf_stats
+
+    reset = (request.args.get('reset') or '').strip().lower() in ('1', 'true', 'yes')
+    stats = perf_stats(reset=reset)
+    stats['pid'] = os.getpid()
+    stats['timestamp'] = datetime.utcnow().isoformat()
+    return jsonify(stats)
+
+
+@flask_app.route('/api/datadog/http-stats', methods=['GET'])
+def api_datadog_http_stats():
+    """Per-endpoint Datadog request counters for this worker (shared keep-alive pool)."""
+    from tools.datadog_http import datadog_http_stats, reset_datadog_http_stats
+
+    stats = datadog_http_stats()
+    stats['pid'] = os.getpid()
+    stats['timestamp'] = datetime.utcnow().isoformat()
+    if (request.args.get('reset') or '').strip().lower() in ('1', 'true', 'yes'):
+        reset_datadog_http_stats()
+    return jsonify(stats)
+
+
 @flask_app.route('/api/tools')
 def api_tools():
     return jsonify([{'name': name, 'desc': desc} for name, desc in registered_tools])
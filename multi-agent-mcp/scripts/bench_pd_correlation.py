@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of PagerDuty incident → wall service correlation.
+
+Compares the per-incident scan of every service name (the matching the wall did before
+tools/pagerduty_service_index) with the ServiceIndex lookups on synthetic data, checks that both
+give the same services for every incident, and times _sm_apply_pagerduty_correlation end to end.
+
+Service names are hyphenated, backend-* style names built from a small vocabulary (so parts are
+shared, like the real APM lists); ~30% of titles name a service, others mention Savant / smart
+notifications / streaming or are noise. Deterministic per --seed.
+
+  python scripts/bench_pd_correlation.py
+  python scripts/bench_pd_correlation.py --services 3000 --incidents 5000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+_WORDS = (
+    "hmsnotification notifications savant cvr adt samsung comcast cat geo video recording stream "
+    "webrtc device oauth registration billing payments user profile mqtt broker arlo automation "
+    "gateway scheduler media upload thumbnail alerts locator presence history firmware ota kurento "
+    "mediamtx transcoder search partner"
+).split()
+_NOISE = list(_WORDS) + ["error", "latency", "high", "5xx", "timeout"]
+_ENVS = ["production", "goldendev", "goldenqa", "samsung_prod", "adt_prod"]
+_EPS = ["savant-ep", "cvr-oncall", "adt ep", "core", "comcast-ep", "cat-ep"]
+
+
+def _synthetic(n_services: int, n_incidents: int, seed: int) -> tuple[list, list]:
+    rng = random.Random(seed)
+    services: set[str] = set()
+    while len(services) < n_services:
+        parts = [
+            rng.choice(_WORDS) + (str(rng.randint(1, 99)) if rng.random() < 0.4 else "")
+            for _ in range(rng.choice((1, 2, 2, 3)))
+        ]
+        services.add(rng.choice(("backend-", "", "hms", "svc-")) + "-".join(parts))
+    svc_list = sorted(services)
+    created = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    incidents = []
+    for i in range(n_incidents):
+        r = rng.random()
+        noise = " ".join(rng.choice(_NOISE) for _ in range(rng.randint(2, 6)))
+        if r < 0.3:
+            title = f"[{rng.choice(('prod', 'dev', 'qa', 'samsung'))}] {rng.choice(svc_list)} {noise}"
+        elif r < 0.45:
+            title = f"Smart Notifications degraded {noise}"
+        elif r < 0.55:
+            title = f"P0_Streaming live stream failures {noise}"
+        else:
+            title = noise
+        incidents.append(
+            {
+                "id": f"P{i}",
+                "status": rng.choice(("triggered", "acknowledged")),
+                "created_at": created,
+                "title": title,
+                "html_url": f"https://pagerduty.example/incidents/P{i}",
+                "service": {"summary": f"{rng.choice(svc_list + ['Platform', 'Streaming'])} {rng.choice(_ENVS)}"},
+                "escalation_policy": {"id": "E", "summary": rng.choice(_EPS)},
+                "description": noise,
+            }
+        )
+    return svc_list, incidents
+
+
+def _texts(sm, incident: dict) -> tuple[str, str, str, str]:
+    title = (incident.get("title") or "").lower()
+    service_summary = ((incident.get("service") or {}).get("summary") or "").lower()
+    return title, service_summary, sm._sm_pd_incident_search_blob(incident), sm._sm_pd_escalation_policy_summary(incident)
+
+
+def _scan_matches(sm, incident: dict, services: list) -> list:
+    """Reference: every service name / part / rule checked against the incident text."""
+    from tools.pagerduty_service_index import PD_FUZZY_PART_BLOCKLIST, PD_STREAMING_EP_SVC_RULES
+
+    title, service_summary, blob, ep_summary = _texts(sm, incident)
+    matched = [s for s in services if s.lower() in title or s.lower() in service_summary]
+    for s in services:
+        if s not in matched and any(
+            len(p) > 4 and p not in PD_FUZZY_PART_BLOCKLIST and p in title for p in s.lower().split("-")
+        ):
+            matched.append(s)
+    if not matched:
+        low = blob.lower()
+        if any(t in low for t in ("smart notification", "smart-notification", "savant")):
+            for m in re.finditer(r"\b(backend-[a-z0-9-]+|[a-z][a-z0-9]*-[a-z0-9-]{2,}[a-z0-9]*)\b", blob, re.I):
+                tok = m.group(1).lower()
+                matched += [s for s in services if s not in matched and (s.lower() == tok or s.lower().startswith(tok + "-"))]
+            if "savant" in low:
+                matched += [s for s in services if s not in matched and "savant" in s.lower()]
+            if "smart notification" in low or "smart-notification" in low:
+                subs = ("hmsnotification", "partner-notifications", "notificationservice")
+                matched += [s for s in services if s not in matched and any(x in s.lower() for x in subs)]
+    if ep_summary and sm._sm_pd_incident_looks_streaming(title, service_summary, blob):
+        esl = ep_summary.lower().strip()
+        for ep_sub, svc_sub in PD_STREAMING_EP_SVC_RULES:
+            found = [s for s in services if svc_sub in s.lower()] if ep_sub in esl else []
+            if found:
+                matched += [s for s in found if s not in matched]
+                break
+    return matched
+
+
+def _indexed_matches(sm, incident: dict, index) -> list:
+    title, service_summary, blob, ep_summary = _texts(sm, incident)
+    matched = index.name_matches(title, service_summary)
+    named = set(matched)
+    matched += [s for s in index.part_matches(title) if s not in named]
+    if not matched:
+        matched = sm._sm_pd_resolve_fuzzy_pd_services(blob, index)
+    if ep_summary and sm._sm_pd_incident_looks_streaming(title, service_summary, blob):
+        matched += [s for s in sm._sm_pd_streaming_ep_team_services(ep_summary, index) if s not in matched]
+    return matched
+
+
+def _best(fn, repeat: int) -> tuple[float, object]:
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--services", type=int, default=1000)
+    ap.add_argument("--incidents", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    ap.add_argument("--seed", type=int, default=3)
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_pd_corr_")
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        import tools.metrics_persistence as mp
+
+        mp.DB_PATH = os.path.join(tmp, "metrics_history.db")
+        mp.init_database()
+        import tools.status_monitor as sm
+        from tools.pagerduty_service_index import ServiceIndex
+
+    services, incidents = _synthetic(args.services, args.incidents, args.seed)
+    print(f"{len(incidents)} incidents × {len(services)} services (best of {args.repeat})")
+
+    scan_s, scan = _best(lambda: [_scan_matches(sm, i, services) for i in incidents], args.repeat)
+    build_s, index = _best(lambda: ServiceIndex(services), args.repeat)
+    idx_s, indexed = _best(lambda: [_indexed_matches(sm, i, index) for i in incidents], args.repeat)
+    diff = sum(1 for a, b in zip(scan, indexed) if a != b)
+    hits = sum(1 for m in indexed if m)
+    print(f"  scan every service      {scan_s * 1000:9.1f} ms")
+    print(f"  build ServiceIndex      {build_s * 1000:9.1f} ms")
+    print(f"  indexed lookups         {idx_s * 1000:9.1f} ms   ({scan_s / max(idx_s, 1e-9):.0f}× faster)")
+    print(f"  incidents with matches  {hits}   mismatches vs scan: {diff}")
+
+    statuses = [{"service": s, "environment": e, "status": "healthy"} for s in services for e in _ENVS]
+
+    def _wall():
+        rows = [dict(r) for r in statuses]
+        sm._sm_apply_pagerduty_correlation(rows, services, _ENVS, "", incidents, silent=True)
+        return rows
+
+    wall_s, rows = _best(_wall, args.repeat)
+    flagged = sum(1 for r in rows if r.get("pd_incident"))
+    print(f"  _sm_apply_pagerduty_correlation {wall_s * 1000:9.1f} ms   ({flagged} service/env rows flagged)")
+    return 1 if diff else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,606 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of the status monitor views against a local Datadog / PagerDuty stub.
+
+A threaded HTTP stub answers /api/v1/query (per-service, grouped and EKS queries),
+/api/v1/monitor/search, /api/v2/apm/services, /api/v2/catalog/entity and PagerDuty /incidents,
+with a fixed added latency and an optional per-bucket rate limit (429 + X-RateLimit-* headers,
+like Datadog). Each (size, view) runs in a fresh child process with an empty temporary SQLite
+DB, whose requests to api.datadoghq.com / api.pagerduty.com / status.arlo.com are routed to the
+stub. Two passes per child:
+
+  cold  — empty process and DB (first request after a deploy)
+  warm  — view snapshots dropped, SQLite API cache and in-process indexes kept (SWR refresh)
+
+Reported per pass: wall time, upstream calls by endpoint, 429s served; per child: peak RSS.
+
+Synthetic data is deterministic per service name: ~5% dormant (no APM data), a few warning /
+critical error rates, Alert monitors on those, a handful of active PagerDuty incidents. The
+APM services list returns --services names for every env (SOFTWARE_CATALOG_WALL_DD_APM_LIST=1);
+envs outside the APM wall (goldendev, goldenqa, qa) keep their bundled lists.
+
+Recorded responses: with --fixtures DIR, a request for <host>/<path> is answered from
+DIR/<host>/<path>.json when present — a JSON object keyed by the ``query`` parameter (metrics,
+monitor search), ``filter[env]`` (APM services) or "*" — and synthesized otherwise.
+
+  python scripts/bench_status_monitor_offline.py --sizes 50,127,500,2000 --latency-ms 40
+  python scripts/bench_status_monitor_offline.py --sizes 500 --views wall --rate-limit 100
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+_SIZES = (50, 127, 500, 2000)
+_VIEWS = ("wall", "hub", "apm")
+_STUB_HOSTS = ("api.datadoghq.com", "api.pagerduty.com", "status.arlo.com")
+_FAMILIES = (("trace.servlet", 70), ("trace.http", 20), ("trace.web", 10))
+_TEAMS = ("platform", "video", "devices", "identity", "payments", "partner")
+_RESULT_PREFIX = "BENCH_RESULT "
+
+_QUERY_RE = re.compile(r"^(\w+):([\w.]+)\{([^}]*)\}(?:\s*by\s*\{([^}]*)\})?")
+_MONITOR_SERVICE_RE = re.compile(r'service:"?([^"\s]+)"?')
+_MONITOR_ENV_RE = re.compile(r"env:(\S+)")
+
+
+# --- synthetic upstream -----------------------------------------------------------------------
+
+
+def _profile(service: str) -> dict:
+    """Deterministic traffic profile for one service name."""
+    h = hashlib.blake2b(service.lower().encode("utf-8"), digest_size=8).digest()
+    u = int.from_bytes(h[:4], "big") / 2**32
+    v = int.from_bytes(h[4:], "big") / 2**32
+    if u < 0.05:
+        return {"dormant": True}
+    pick = v * 100
+    for family, weight in _FAMILIES:
+        if pick < weight:
+            break
+        pick -= weight
+    if u > 0.97:
+        err_rate = 0.12
+    elif u > 0.92:
+        err_rate = 0.03
+    else:
+        err_rate = 0.001
+    hits_per_hour = int(1000 + v * 200000)
+    return {
+        "dormant": False,
+        "family": family,
+        "hits_per_hour": hits_per_hour,
+        "err_rate": err_rate,
+        "p95_secs": 0.02 + v * 0.4,
+        "clusters": [f"eks-{1 + int(v * 3)}", f"eks-{1 + int(u * 3)}"],
+        "owner": _TEAMS[int(v * len(_TEAMS)) % len(_TEAMS)],
+    }
+
+
+def _pointlist(total: float, from_t: int, to_t: int, n: int = 6) -> list:
+    step = max(1, (to_t - from_t) // n)
+    return [[(from_t + i * step) * 1000, total / n] for i in range(n)]
+
+
+def _parse_tags(raw: str) -> dict:
+    out = {}
+    for part in (raw or "").split(","):
+        k, _, v = part.strip().partition(":")
+        if k and v:
+            out[k] = v
+    return out
+
+
+class _Upstream:
+    """Synthetic Datadog + PagerDuty state shared by all stub handler threads."""
+
+    def __init__(self, services: list[str], extra_names: list[str], latency_ms: float, rate_limit: float, fixtures: str | None):
+        self.catalog = list(services)
+        # Grouped queries answer for every service Datadog knows in the env, not only the wall list
+        self.universe = sorted(set(services) | set(extra_names), key=str.lower)
+        self.profiles = {s.lower(): _profile(s) for s in self.universe}
+        self.latency = max(0.0, latency_ms) / 1000.0
+        self.rate_limit = max(0.0, rate_limit)
+        self.fixtures = fixtures
+        self.lock = threading.Lock()
+        self.calls: Counter = Counter()
+        self.throttled: Counter = Counter()
+        self._buckets: dict[str, list] = {}
+        self._memo: dict[tuple, bytes] = {}
+
+    def profile(self, service: str) -> dict:
+        p = self.profiles.get(service.lower())
+        if p is None:
+            p = self.profiles[service.lower()] = _profile(service)
+        return p
+
+    def stats(self, reset: bool = False) -> dict:
+        with self.lock:
+            out = {"calls": dict(self.calls), "throttled": dict(self.throttled)}
+            if reset:
+                self.calls.clear()
+                self.throttled.clear()
+        return out
+
+    def admit(self, bucket: str) -> tuple[bool, dict]:
+        """Token bucket per rate-limit name; (allowed, X-RateLimit-* headers)."""
+        if self.rate_limit <= 0:
+            return True, {}
+        now = time.monotonic()
+        with self.lock:
+            b = self._buckets.setdefault(bucket, [self.rate_limit, now])
+            b[0] = min(self.rate_limit, b[0] + (now - b[1]) * self.rate_limit)
+            b[1] = now
+            allowed = b[0] >= 1.0
+            if allowed:
+                b[0] -= 1.0
+            remaining = int(b[0])
+            reset = 0 if allowed and remaining else max(1, int((1.0 - b[0]) / self.rate_limit + 0.999))
+        return allowed, {
+            "X-RateLimit-Name": bucket,
+            "X-RateLimit-Limit": str(int(self.rate_limit)),
+            "X-RateLimit-Period": "1",
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset),
+        }
+
+    def fixture(self, host: str, path: str, key: str) -> bytes | None:
+        if not self.fixtures:
+            return None
+        fp = os.path.join(self.fixtures, host, path.strip("/") + ".json")
+        try:
+            with open(fp, encoding="utf-8") as f:
+                table = json.load(f)
+        except (OSError, ValueError):
+            return None
+        body = table.get(key, table.get("*")) if isinstance(table, dict) else None
+        return None if body is None else json.dumps(body).encode("utf-8")
+
+    # Datadog -----------------------------------------------------------------------------
+
+    def metric_query(self, query: str, from_t: int, to_t: int) -> bytes:
+        key = (query, (to_t - from_t) // 600)
+        with self.lock:
+            hit = self._memo.get(key)
+        if hit is not None:
+            return hit
+        body = json.dumps({"status": "ok", "series": self._series(query, from_t, to_t)}).encode("utf-8")
+        with self.lock:
+            if len(self._memo) > 4096:
+                self._memo.clear()
+            self._memo[key] = body
+        return body
+
+    def _series(self, query: str, from_t: int, to_t: int) -> list:
+        m = _QUERY_RE.match(query.strip())
+        if not m:
+            return []
+        metric, tags, by = m.group(2), _parse_tags(m.group(3)), m.group(4)
+        hours = max(1.0, (to_t - from_t) / 3600.0)
+        group_tags = [t.strip() for t in (by or "").split(",") if t.strip()]
+        env = tags.get("env", "")
+
+        def _value(p: dict) -> float | None:
+            if p["dormant"]:
+                return None
+            if metric.startswith("trace."):
+                if not metric.startswith(p["family"] + "."):
+                    return None
+                if metric.endswith(".hits") or metric in (p["family"] + ".request",):
+                    return p["hits_per_hour"] * hours
+                if metric.endswith(".errors"):
+                    return p["hits_per_hour"] * hours * p["err_rate"]
+                if ".duration." in metric:
+                    return p["p95_secs"]
+                return None
+            if metric.startswith(("kubernetes", "container.", "docker.", "system.")):
+                return 1.0
+            return None
+
+        filter_svc = tags.get("service") or tags.get("kube_service") or tags.get("container_name")
+        candidates = [filter_svc] if filter_svc else self.universe
+        series = []
+        for svc in candidates:
+            p = self.profile(svc)
+            val = _value(p)
+            if val is None:
+                continue
+            svc_tag = next((t for t in group_tags if t != "kube_cluster_name"), "service")
+            if "kube_cluster_name" in group_tags:
+                for cluster in dict.fromkeys(p["clusters"]):
+                    tag_set = ([f"{svc_tag}:{svc}"] if len(group_tags) > 1 else []) + [f"kube_cluster_name:{env}-{cluster}"]
+                    series.append({"scope": ",".join(tag_set), "tag_set": tag_set, "pointlist": _pointlist(val, from_t, to_t)})
+            elif group_tags:
+                tag_set = [f"{group_tags[0]}:{svc}"]
+                series.append(
+                    {"scope": f"{tag_set[0]},env:{env}", "tag_set": tag_set, "pointlist": _pointlist(val, from_t, to_t)}
+                )
+            else:
+                series.append({"scope": query, "tag_set": [], "pointlist": _pointlist(val, from_t, to_t)})
+        return series
+
+    def monitor_search(self, query: str, page: int, per_page: int) -> bytes:
+        env_m = _MONITOR_ENV_RE.search(query or "")
+        env = env_m.group(1) if env_m else "production"
+        svc_m = _MONITOR_SERVICE_RE.search(query or "")
+        names = [svc_m.group(1)] if svc_m else self.universe
+        monitors = []
+        for svc in names:
+            p = self.profile(svc)
+            if p["dormant"]:
+                continue
+            base = int(hashlib.blake2b(f"{svc}|{env}".encode("utf-8"), digest_size=4).hexdigest(), 16)
+            state = "Alert" if p["err_rate"] >= 0.1 else "Warn" if p["err_rate"] >= 0.03 else "OK"
+            monitors.append(
+                {
+                    "id": base,
+                    "name": f"{svc} error rate ({env})",
+                    "overall_state": state,
+                    "status": state,
+                    "tags": [f"service:{svc}", f"env:{env}"],
+                    "scopes": [f"env:{env}", f"service:{svc}"],
+                }
+            )
+            monitors.append(
+                {
+                    "id": base + 1,
+                    "name": f"{svc} p95 latency ({env})",
+                    "overall_state": "OK",
+                    "status": "OK",
+                    "tags": [f"service:{svc}", f"env:{env}"],
+                    "scopes": [f"env:{env}", f"service:{svc}"],
+                }
+            )
+        per_page = max(1, per_page)
+        chunk = monitors[page * per_page : (page + 1) * per_page]
+        page_count = max(1, (len(monitors) + per_page - 1) // per_page)
+        return json.dumps(
+            {"monitors": chunk, "metadata": {"page": page, "per_page": per_page, "page_count": page_count, "total_count": len(monitors)}}
+        ).encode("utf-8")
+
+    def apm_services(self) -> bytes:
+        return json.dumps({"data": {"type": "services_list", "attributes": {"services": self.catalog}}}).encode("utf-8")
+
+    def catalog_entities(self, offset: int, limit: int) -> bytes:
+        rows = [
+            {"type": "entity", "attributes": {"name": svc, "kind": "service", "owner": self.profile(svc).get("owner", "")}}
+            for svc in self.catalog[offset : offset + max(1, limit)]
+        ]
+        return json.dumps({"data": rows, "meta": {"count": len(self.catalog)}}).encode("utf-8")
+
+    # PagerDuty ---------------------------------------------------------------------------
+
+    def pd_incidents(self, statuses: list[str], offset: int, limit: int) -> bytes:
+        now = time.time()
+        incidents = []
+        alerting = [s for s in self.catalog if self.profile(s).get("err_rate", 0) >= 0.1][:5]
+        per_status = {"triggered": alerting[:3], "acknowledged": alerting[3:5], "resolved": self.catalog[:10]}
+        for status in statuses or ["triggered"]:
+            for i, svc in enumerate(per_status.get(status, [])):
+                created = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now - 600 * (i + 1)))
+                incidents.append(
+                    {
+                        "id": f"P{status[:1].upper()}{i:04d}",
+                        "incident_number": 1000 + i,
+                        "title": f"[production] {svc} error rate above threshold",
+                        "status": status,
+                        "urgency": "high",
+                        "created_at": created,
+                        "html_url": f"https://example.pagerduty.com/incidents/P{i:04d}",
+                        "service": {"id": "PSVC", "summary": f"{svc} production"},
+                        "escalation_policy": {"id": "PEP1"},
+                    }
+                )
+        page = incidents[offset : offset + max(1, limit)]
+        return json.dumps(
+            {
+                "incidents": page,
+                "total": len(incidents),
+                "more": offset + len(page) < len(incidents),
+                "escalation_policies": [{"id": "PEP1", "summary": "Platform on-call"}],
+            }
+        ).encode("utf-8")
+
+
+def _endpoint(host: str, path: str) -> str:
+    parts = [p for p in path.split("/") if p][:3]
+    return f"{host} /{'/'.join(parts)}"
+
+
+def _make_handler(up: _Upstream):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, code: int, body: bytes, headers: dict | None = None, ctype: str = "application/json"):
+            self.send_response(code)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            if self.path.startswith("/_bench/"):
+                return self.do_GET()
+            self._send(404, b"{}")
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if parts.path == "/_bench/stats":
+                reset = "reset=1" in (parts.query or "")
+                return self._send(200, json.dumps(up.stats(reset)).encode("utf-8"))
+            _, host, rest = parts.path.split("/", 2) if parts.path.count("/") >= 2 else ("", "", "")
+            path = "/" + rest
+            qs = parse_qs(parts.query, keep_blank_values=True)
+            one = lambda k, d="": (qs.get(k) or [d])[0]  # noqa: E731
+            endpoint = _endpoint(host, path)
+            with up.lock:
+                up.calls[endpoint] += 1
+            if up.latency:
+                time.sleep(up.latency)
+
+            headers = {}
+            if host.endswith("datadoghq.com"):
+                bucket = "query" if path.startswith("/api/v1/query") else endpoint.split(" ", 1)[1]
+                allowed, headers = up.admit(bucket)
+                if not allowed:
+                    with up.lock:
+                        up.throttled[endpoint] += 1
+                    return self._send(429, b'{"errors":["Too many requests"]}', headers)
+
+            fixture_key = one("query") or one("filter[env]") or "*"
+            body = up.fixture(host, path, fixture_key)
+            if body is not None:
+                return self._send(200, body, headers)
+
+            if host == "status.arlo.com":
+                return self._send(200, b"<html><body></body></html>", ctype="text/html")
+            if path == "/api/v1/query":
+                now = int(time.time())
+                body = up.metric_query(one("query"), int(one("from", now - 3600)), int(one("to", now)))
+            elif path == "/api/v1/monitor/search":
+                body = up.monitor_search(one("query"), int(one("page", "0")), int(one("per_page", "30")))
+            elif path == "/api/v2/apm/services":
+                body = up.apm_services()
+            elif path == "/api/v2/catalog/entity":
+                body = up.catalog_entities(int(one("page[offset]", "0")), int(one("page[limit]", "100")))
+            elif path == "/incidents":
+                body = up.pd_incidents(qs.get("statuses[]") or [], int(one("offset", "0")), int(one("limit", "25")))
+            elif path == "/log_entries":
+                body = b'{"log_entries": [], "more": false}'
+            else:
+                return self._send(404, b'{"errors":["not stubbed"]}', headers)
+            self._send(200, body, headers)
+
+    return Handler
+
+
+def _bundled_names() -> list[str]:
+    out: list[str] = []
+    lists_dir = os.path.join(_ROOT, "lists")
+    for fn in sorted(os.listdir(lists_dir)) if os.path.isdir(lists_dir) else []:
+        if fn.endswith(".txt"):
+            with open(os.path.join(lists_dir, fn), encoding="utf-8") as f:
+                out.extend(ln.strip() for ln in f if ln.strip() and not ln.lstrip().startswith("#"))
+    return out
+
+
+def _start_stub(up: _Upstream) -> ThreadingHTTPServer:
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(up))
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, name="bench-stub", daemon=True).start()
+    return srv
+
+
+# --- child: one view at one size -----------------------------------------------------------
+
+
+def _route_to_stub(port: int) -> None:
+    """Send every requests call for the upstream hosts to the stub (path prefixed with the host)."""
+    from requests.adapters import HTTPAdapter
+
+    orig_send = HTTPAdapter.send
+
+    def send(self, request, *args, **kwargs):
+        parts = urlsplit(request.url)
+        host = (parts.hostname or "").lower()
+        if host in _STUB_HOSTS or host.endswith(".datadoghq.com"):
+            request.url = urlunsplit(("http", f"127.0.0.1:{port}", f"/{host}{parts.path}", parts.query, ""))
+        return orig_send(self, request, *args, **kwargs)
+
+    HTTPAdapter.send = send
+
+
+def _stub_stats(port: int) -> dict:
+    from urllib.request import urlopen
+
+    with urlopen(f"http://127.0.0.1:{port}/_bench/stats?reset=1", timeout=10) as r:
+        return json.loads(r.read())
+
+
+def _count_rows(value) -> int:
+    if isinstance(value, dict):
+        own = 1 if "service" in value and "status" in value else 0
+        return own + sum(_count_rows(v) for v in value.values())
+    if isinstance(value, list):
+        return sum(_count_rows(v) for v in value)
+    return 0
+
+
+def _peak_rss_mb() -> float:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _child(args) -> int:
+    tmp = tempfile.mkdtemp(prefix="sm-bench-")
+    os.environ.update(
+        {
+            "DATADOG_API_KEY": "bench",
+            "DATADOG_APP_KEY": "bench",
+            "DATADOG_SITE": "datadoghq.com",
+            "PAGERDUTY_API_TOKEN": "bench",
+            "SOFTWARE_CATALOG_WALL_DD_APM_LIST": "1",
+            "STATUS_MONITOR_SWR": "0",
+            "STATUS_MONITOR_SINGLE_FLIGHT": "0",
+            "STATUS_MONITOR_SNAPSHOT_CACHE": "memory",
+        }
+    )
+    for k in (
+        "DD_API_KEY",
+        "DD_APP_KEY",
+        "SPLUNK_TOKEN",
+        "SOFTWARE_CATALOG_SERVICE_NAMES",
+        "SOFTWARE_CATALOG_SERVICE_LIST_FILE",
+        "PAGERDUTY_EXTERNAL_STATUS_DASHBOARD_ID",
+    ):
+        os.environ.pop(k, None)
+
+    import tools.metrics_persistence as mp
+
+    mp.DB_PATH = os.path.join(tmp, "metrics_history.db")
+    _route_to_stub(args.port)
+    sink = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(open(os.devnull, "w"))
+    with sink:
+        mp.init_database()
+        import tools.status_monitor as sm
+
+        view = {
+            "wall": lambda: sm.status_monitor_wall_data(args.timerange),
+            "hub": lambda: sm.status_monitor_hub_summary(args.timerange),
+            "apm": lambda: sm.status_monitor_software_catalog_wall_data(args.timerange, dd_env="all"),
+        }[args.view]
+        _stub_stats(args.port)
+        passes = []
+        for name in ("cold", "warm"):
+            if name == "warm":
+                sm._sm_snapshot_cache().clear()
+            t0 = time.perf_counter()
+            out = view()
+            secs = time.perf_counter() - t0
+            st = _stub_stats(args.port)
+            passes.append(
+                {
+                    "pass": name,
+                    "secs": round(secs, 3),
+                    "rows": _count_rows(out),
+                    "calls": st["calls"],
+                    "throttled": sum(st["throttled"].values()),
+                }
+            )
+    shutil.rmtree(tmp, ignore_errors=True)
+    print(_RESULT_PREFIX + json.dumps({"view": args.view, "services": args.services, "rss_mb": round(_peak_rss_mb(), 1), "passes": passes}))
+    return 0
+
+
+# --- parent -----------------------------------------------------------------------------------
+
+
+def _run_child(args, port: int, size: int, view: str) -> dict | None:
+    cmd = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--child",
+        "--port",
+        str(port),
+        "--services",
+        str(size),
+        "--view",
+        view,
+        "--timerange",
+        str(args.timerange),
+    ] + (["--verbose"] if args.verbose else [])
+    proc = subprocess.run(cmd, cwd=_ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=args.timeout)
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(_RESULT_PREFIX):
+            return json.loads(line[len(_RESULT_PREFIX):])
+    if args.verbose:
+        sys.stdout.write(proc.stdout)
+    sys.stderr.write(proc.stderr[-4000:])
+    return None
+
+
+def _top_calls(calls: dict, n: int = 3) -> str:
+    ranked = sorted(calls.items(), key=lambda kv: -kv[1])[:n]
+    return ", ".join(f"{ep.split(' ', 1)[1]}={c}" for ep, c in ranked)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", default=",".join(str(s) for s in _SIZES), help="comma-separated service counts")
+    ap.add_argument("--views", default=",".join(_VIEWS), help="wall, hub, apm")
+    ap.add_argument("--latency-ms", type=float, default=40.0, help="added to every upstream response")
+    ap.add_argument("--rate-limit", type=float, default=0.0, help="requests/s per Datadog rate-limit bucket (0 = none)")
+    ap.add_argument("--fixtures", help="directory of recorded responses (see module docstring)")
+    ap.add_argument("--timerange", type=int, default=1)
+    ap.add_argument("--timeout", type=float, default=1800.0, help="seconds per child run")
+    ap.add_argument("--json", action="store_true", help="print results as JSON lines")
+    ap.add_argument("--verbose", action="store_true", help="show the status monitor's own logging")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    ap.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    ap.add_argument("--services", type=int, default=0, help=argparse.SUPPRESS)
+    ap.add_argument("--view", default="wall", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return _child(args)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    views = [v.strip() for v in args.views.split(",") if v.strip() in _VIEWS]
+    extra = _bundled_names()
+    if not args.json:
+        print(
+            f"latency {args.latency_ms:g} ms, rate limit {args.rate_limit:g}/s per bucket"
+            + (f", fixtures {args.fixtures}" if args.fixtures else "")
+        )
+        print(f"{'services':>8} {'view':<5} {'pass':<5} {'wall s':>8} {'rows':>6} {'calls':>6} {'429':>5} {'rss MB':>7}  top endpoints")
+    failed = 0
+    for size in sizes:
+        names = [f"bench-svc-{i:04d}" for i in range(size)]
+        up = _Upstream(names, extra, args.latency_ms, args.rate_limit, args.fixtures)
+        srv = _start_stub(up)
+        try:
+            for view in views:
+                res = _run_child(args, srv.server_address[1], size, view)
+                if res is None:
+                    failed += 1
+                    print(f"{size:>8} {view:<5} failed")
+                    continue
+                if args.json:
+                    print(json.dumps(res))
+                    continue
+                for p in res["passes"]:
+                    print(
+                        f"{size:>8} {view:<5} {p['pass']:<5} {p['secs']:>8.2f} {p['rows']:>6} "
+                        f"{sum(p['calls'].values()):>6} {p['throttled']:>5} {res['rss_mb']:>7.1f}  {_top_calls(p['calls'])}"
+                    )
+        finally:
+            srv.shutdown()
+            srv.server_close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Render cost per refresh of status monitor tile HTML, with and without the tile fragment cache.
+
+Synthetic rows, no network. Each refresh flips --churn percent of services (status + counts),
+like a typical poll where most tiles are unchanged.
+
+  python scripts/bench_status_monitor_tiles.py --services 300 --refreshes 20 --churn 5
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Keep the engineering mosaic off the Datadog catalog API
+for _k in ("DATADOG_API_KEY", "DD_API_KEY", "DATADOG_APP_KEY", "DD_APP_KEY"):
+    os.environ.pop(_k, None)
+
+import tools.status_monitor as sm  # noqa: E402
+from tools.status_monitor_health import ServiceHealth  # noqa: E402
+
+
+def _row(rng: random.Random, name: str, env: str) -> ServiceHealth:
+    status = rng.choices(["healthy", "warning", "critical", "inactive"], [85, 8, 4, 3])[0]
+    req = rng.randint(100, 500000)
+    err = rng.randint(0, max(1, req // 50)) if status in ("warning", "critical") else rng.randint(0, 3)
+    row = ServiceHealth(
+        service=name,
+        environment=env,
+        status=status,
+        requests=req,
+        errors=err,
+        error_rate=round(100.0 * err / req, 2),
+        p95_latency=round(rng.uniform(5, 900), 1),
+        p99_latency=round(rng.uniform(10, 2000), 1),
+        traffic_drop=False,
+        high_latency=False,
+        dd_monitor_alerts=[],
+        dd_monitor_alert_count=0,
+        eks_clusters=[f"eks-{env}-{rng.randint(1, 4)}"],
+        eks_cluster_count=1,
+    )
+    if status == "critical":
+        row["dd_monitor_alerts"] = [f"{name} error rate high"]
+        row["dd_monitor_alert_count"] = 1
+    return row
+
+
+def _churn(rng: random.Random, rows: list, pct: float) -> list:
+    out = [r.copy() for r in rows]
+    for i in rng.sample(range(len(out)), max(1, int(len(out) * pct / 100))):
+        r = out[i]
+        r["status"] = rng.choice(["healthy", "warning", "critical"])
+        r["errors"] = int(r.get("errors") or 0) + rng.randint(1, 50)
+        r["requests"] = int(r.get("requests") or 0) + rng.randint(1, 500)
+    return out
+
+
+def _run(label: str, render, rows: list, refreshes: int, churn: float, seed: int) -> float:
+    rng = random.Random(seed)
+    render(rows)  # warm imports / lazy module state
+    cur = rows
+    times = []
+    for _ in range(refreshes):
+        cur = _churn(rng, cur, churn)
+        t0 = time.perf_counter()
+        render(cur)
+        times.append(time.perf_counter() - t0)
+    times.sort()
+    med = times[len(times) // 2] * 1000
+    print(f"  {label:<28} median {med:8.2f} ms / refresh   (min {times[0] * 1000:.2f}, max {times[-1] * 1000:.2f})")
+    return med
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--services", type=int, default=300)
+    ap.add_argument("--refreshes", type=int, default=20)
+    ap.add_argument("--churn", type=float, default=5.0, help="percent of services changed per refresh")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    views = []
+    for page_env, env in (("samsung", "samsung_prod"), (None, "production")):
+        rows = [_row(rng, f"svc-{i:04d}-api", env) for i in range(args.services)]
+        views.append(
+            (
+                f"{page_env or 'hub'} {env} column",
+                rows,
+                lambda r, pe=page_env, e=env: sm._sm_render_dd_env_column_html(e, r, pe, [e], timerange=1),
+            )
+        )
+
+    print(f"{args.services} services, {args.refreshes} refreshes, {args.churn:g}% churn per refresh")
+    for label, rows, render in views:
+        print(label)
+        os.environ["STATUS_MONITOR_TILE_CACHE_MAX"] = "0"
+        sm._sm_tile_settings_memo[0] = 0.0
+        before = _run("uncached", render, rows, args.refreshes, args.churn, args.seed)
+        os.environ.pop("STATUS_MONITOR_TILE_CACHE_MAX", None)
+        sm._sm_tile_settings_memo[0] = 0.0
+        sm._sm_tile_html_cache.clear()
+        after = _run("tile cache", render, rows, args.refreshes, args.churn, args.seed)
+        print(f"  speedup {before / after:.1f}x")
+    st = sm._sm_tile_html_stats
+    print(f"tile cache: {st['hits']} hits, {st['misses']} misses, {len(sm._sm_tile_html_cache)} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -10,9 +10,15 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
 import time
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 
+from tools import status_monitor_service_registry as _registry
+from tools.status_monitor_health import ServiceHealth
+
 _REPO_ROOT = Path(__file__).resolve().parent.parent
 _MAPPING_PATH = _REPO_ROOT / "lists" / "apm_engineering_groups.json"
 
@@ -142,6 +148,7 @@ OWNER_SLUG_TO_LABEL: dict[str, str] = {
     "partner-platform": "Partner Platform",
 }
 
+# site -> {"at": unix time of the sync, "owners": {service key: owner slug}}
 _catalog_owner_cache: dict = {}
 
 
@@ -166,26 +173,41 @@ def _label_from_owner_slug(owner_slug: str) -> str:
     return slug.replace("-", " ").title()
 
 
-def fetch_datadog_catalog_service_owners(
-    dd_api_key: str,
-    dd_app_key: str,
-    dd_site: str,
-    *,
-    max_entities: int = 800,
-    cache_secs: int = 600,
-) -> dict[str, str]:
-    """
-    service name (lower) -> catalog owner slug, from GET /api/v2/catalog/entity.
-    """
-    global _catalog_owner_cache
-    now = time.time()
-    site = (dd_site or "arlo.datadoghq.com").strip()
-    hit = _catalog_owner_cache.get(site)
-    if hit and (now - hit.get("at", 0)) < cache_secs:
-        return dict(hit.get("owners") or {})
+# Catalog owners persist in status_monitor_api_cache so a restarted worker starts warm; rows older
+# than the soft TTL are still served (up to this age) while one background sync per site refreshes.
+_CATALOG_OWNER_KIND = "dd_catalog_owners"
+_CATALOG_OWNER_STALE_MAX_SECS = 86400
+_CATALOG_OWNER_PAGE = 100
+# One crawl per site across workers (status_monitor_leases); a cold caller waits this long for it
+_CATALOG_OWNER_LEASE_SECS = 180
+_CATALOG_OWNER_COLD_WAIT_SECS = 90
+_catalog_owner_lock = threading.Lock()
+_catalog_owner_syncing: set[str] = set()
+_catalog_owner_cold_locks: dict[str, threading.Lock] = {}
+
+
+def _catalog_owner_rows(resp) -> tuple[list, int | None] | None:
+    """(entity rows, meta.count) of one catalog page, or None when the page failed."""
+    if isinstance(resp, Exception) or resp.status_code != 200:
+        return None
+    try:
+        payload = resp.json() or {}
+    except ValueError:
+        return None
+    total = (payload.get("meta") or {}).get("count")
+    try:
+        total = int(total) if total is not None else None
+    except (TypeError, ValueError):
+        total = None
+    return payload.get("data") or [], total
 
-    import requests
 
+def _crawl_catalog_owners(dd_api_key: str, dd_app_key: str, site: str, cap: int) -> tuple[dict[str, str], bool]:
+    """
+    (owners, complete) from GET /api/v2/catalog/entity. The first page gives meta.count; the rest
+    are fetched concurrently on the shared Datadog pool (sequentially when the count is missing).
+    """
+    from tools.datadog_http import datadog_get, datadog_get_many
     from tools.status_monitor import datadog_rest_api_base
 
     base = f"{datadog_rest_api_base(site)}/api/v2/catalog/entity"
@@ -194,32 +216,23 @@ def fetch_datadog_catalog_service_owners(
         "DD-APPLICATION-KEY": dd_app_key,
         "Accept": "application/json",
     }
+    limit = _CATALOG_OWNER_PAGE
+
+    def _kwargs(offset: int) -> dict:
+        return {
+            "headers": headers,
+            "params": {
+                "page[offset]": offset,
+                "page[limit]": limit,
+                "filter[kind]": "service",
+                "includeDiscovered": "true",
+            },
+            "timeout": (15, 60),
+        }
+
     owners: dict[str, str] = {}
-    offset = 0
-    limit = 100
-    cap = max(100, min(int(max_entities), 1200))
-    while len(owners) < cap and offset < cap * 2:
-        try:
-            r = requests.get(
-                base,
-                headers=headers,
-                params={
-                    "page[offset]": offset,
-                    "page[limit]": limit,
-                    "filter[kind]": "service",
-                    "includeDiscovered": "true",
-                },
-                timeout=(15, 60),
-            )
-        except Exception as e:
-            print(f"⚠️ Catalog owner fetch failed: {e}")
-            break
-        if r.status_code != 200:
-            print(f"⚠️ Catalog owner API {r.status_code}: {(r.text or '')[:200]}")
-            break
-        rows = (r.json() or {}).get("data") or []
-        if not rows:
-            break
+
+    def _add(rows: list) -> None:
         for item in rows:
             if not isinstance(item, dict):
                 continue
@@ -228,13 +241,181 @@ def fetch_datadog_catalog_service_owners(
             owner = (attr.get("owner") or "").strip().lower()
             if name:
                 owners[_norm_service_key(name)] = owner
+
+    try:
+        first = datadog_get(base, **_kwargs(0))
+    except Exception as e:
+        print(f"⚠️ Catalog owner fetch failed: {e}")
+        return owners, False
+    page = _catalog_owner_rows(first)
+    if page is None:
+        print(f"⚠️ Catalog owner API {first.status_code}: {(first.text or '')[:200]}")
+        return owners, False
+    rows, total = page
+    _add(rows)
+    if len(rows) < limit:
+        return owners, True
+
+    if total is not None:
+        offsets = list(range(limit, min(total, cap * 2), limit))
+        complete = True
+        for resp in datadog_get_many([(base, _kwargs(off)) for off in offsets]):
+            page = _catalog_owner_rows(resp)
+            if page is None:
+                complete = False
+                continue
+            _add(page[0])
+        return owners, complete
+
+    offset = limit
+    while len(owners) < cap and offset < cap * 2:
+        try:
+            resp = datadog_get(base, **_kwargs(offset))
+        except Exception as e:
+            print(f"⚠️ Catalog owner fetch failed: {e}")
+            return owners, False
+        page = _catalog_owner_rows(resp)
+        if page is None:
+            print(f"⚠️ Catalog owner API {resp.status_code}: {(resp.text or '')[:200]}")
+            return owners, False
+        rows = page[0]
+        if not rows:
+            break
+        _add(rows)
         if len(rows) < limit:
             break
         offset += limit
-    _catalog_owner_cache[site] = {"at": now, "owners": owners}
+    return owners, True
+
+
+def _sync_catalog_owners(dd_api_key: str, dd_app_key: str, site: str, cap: int, previous: dict | None) -> dict[str, str]:
+    """
+    Crawl, merge and persist. An incomplete crawl only adds to the previous map (owners on
+    failed pages are kept); a complete one replaces it.
+    """
+    from tools.metrics_persistence import sm_api_cache_set
+
+    t0 = time.time()
+    owners, complete = _crawl_catalog_owners(dd_api_key, dd_app_key, site, cap)
+    if not complete and previous:
+        owners = {**previous, **owners}
+    # Empty (API down / no permission) is kept in memory only, so the next try waits cache_secs
+    _catalog_owner_cache[site] = {"at": time.time(), "owners": owners}
+    if owners:
+        sm_api_cache_set(_CATALOG_OWNER_KIND, site, owners, compute_secs=time.time() - t0)
+        print(
+            f"👥 Catalog owners ({site}): {len(owners)} services "
+            f"({'full' if complete else 'partial, merged'} sync in {time.time() - t0:.1f}s)"
+        )
     return owners
 
 
+def _catalog_owner_lease(site: str) -> tuple[str, str]:
+    return f"catalog_owners:{site}", f"{os.getpid()}:{threading.get_ident()}"
+
+
+def _sync_catalog_owners_cold(dd_api_key: str, dd_app_key: str, site: str, cap: int) -> dict[str, str]:
+    """
+    First load with no row anywhere: one request thread per site crawls (per-site lock in this
+    worker, DB lease across workers); later callers wait and reuse its result.
+    """
+    from tools.metrics_persistence import sm_api_cache_get_entry, sm_lease_acquire, sm_lease_release
+
+    with _catalog_owner_lock:
+        lock = _catalog_owner_cold_locks.setdefault(site, threading.Lock())
+    with lock:
+        hit = _catalog_owner_cache.get(site)
+        if hit is not None:
+            return hit.get("owners") or {}
+        lease, owner = _catalog_owner_lease(site)
+        deadline = time.time() + _CATALOG_OWNER_COLD_WAIT_SECS
+        waited = False
+        while True:
+            entry = sm_api_cache_get_entry(
+                _CATALOG_OWNER_KIND, site, newer_than=time.time() - _CATALOG_OWNER_STALE_MAX_SECS
+            )
+            if entry is not None and entry[0]:
+                _catalog_owner_cache[site] = {"at": entry[1], "owners": entry[0]}
+                return entry[0]
+            if sm_lease_acquire(lease, owner, _CATALOG_OWNER_LEASE_SECS):
+                try:
+                    return _sync_catalog_owners(dd_api_key, dd_app_key, site, cap, None)
+                finally:
+                    sm_lease_release(lease, owner)
+            if time.time() >= deadline:
+                break
+            if not waited:
+                print(f"⏳ Catalog owners ({site}): another worker is crawling — waiting for its result")
+                waited = True
+            time.sleep(0.5)
+    # The other worker's crawl has not landed: crawl here rather than hold the request any longer
+    return _sync_catalog_owners(dd_api_key, dd_app_key, site, cap, None)
+
+
+def _sync_catalog_owners_in_background(dd_api_key: str, dd_app_key: str, site: str, cap: int, cache_secs: int) -> None:
+    """One background sync per site across workers; adopts a fresher row another worker wrote instead."""
+    from tools.metrics_persistence import sm_api_cache_get_entry, sm_lease_acquire, sm_lease_release
+
+    with _catalog_owner_lock:
+        if site in _catalog_owner_syncing:
+            return
+        _catalog_owner_syncing.add(site)
+
+    def _run():
+        try:
+            entry = sm_api_cache_get_entry(_CATALOG_OWNER_KIND, site, newer_than=time.time() - cache_secs)
+            if entry is not None and entry[0]:
+                _catalog_owner_cache[site] = {"at": entry[1], "owners": entry[0]}
+                return
+            lease, owner = _catalog_owner_lease(site)
+            if not sm_lease_acquire(lease, owner, _CATALOG_OWNER_LEASE_SECS):
+                return  # another worker is refreshing; its row is adopted on the next stale read
+            try:
+                previous = (_catalog_owner_cache.get(site) or {}).get("owners")
+                _sync_catalog_owners(dd_api_key, dd_app_key, site, cap, previous)
+            finally:
+                sm_lease_release(lease, owner)
+        except Exception as e:
+            print(f"⚠️ Catalog owner background sync ({site}): {e}")
+        finally:
+            with _catalog_owner_lock:
+                _catalog_owner_syncing.discard(site)
+
+    threading.Thread(target=_run, name=f"catalog-owners-{site}", daemon=True).start()
+
+
+def fetch_datadog_catalog_service_owners(
+    dd_api_key: str,
+    dd_app_key: str,
+    dd_site: str,
+    *,
+    max_entities: int = 800,
+    cache_secs: int = 600,
+) -> dict[str, str]:
+    """
+    service name (lower) -> catalog owner slug, from GET /api/v2/catalog/entity.
+
+    Served from memory, then the SQLite row (written by any worker); an entry past cache_secs is
+    returned as-is while a background sync refreshes it. With no row at all, one request thread
+    crawls (see _sync_catalog_owners_cold) and concurrent callers wait for its result.
+    """
+    from tools.metrics_persistence import sm_api_cache_get_entry
+
+    now = time.time()
+    site = (dd_site or "arlo.datadoghq.com").strip()
+    cap = max(100, min(int(max_entities), 1200))
+    hit = _catalog_owner_cache.get(site)
+    if hit is None:
+        entry = sm_api_cache_get_entry(_CATALOG_OWNER_KIND, site, newer_than=now - _CATALOG_OWNER_STALE_MAX_SECS)
+        if entry is not None and entry[0]:
+            hit = _catalog_owner_cache[site] = {"at": entry[1], "owners": entry[0]}
+    if hit is not None:
+        if now - hit.get("at", 0) >= cache_secs:
+            _sync_catalog_owners_in_background(dd_api_key, dd_app_key, site, cap, cache_secs)
+        return dict(hit.get("owners") or {})
+    return dict(_sync_catalog_owners_cold(dd_api_key, dd_app_key, site, cap))
+
+
 def _engineering_team_display_order(labels_seen: set[str]) -> list[str]:
     """Org column order first, then extra Datadog teams, then Other."""
     out: list[str] = []
@@ -274,20 +455,26 @@ _CATALOG_DD_ALIASES: dict[str, tuple[str, ...]] = {
 }
 
 
+def _copy_row(row: Mapping) -> dict:
+    # ServiceHealth.copy() is a list copy; dict(row) would go through __getitem__ per key
+    return row.copy() if isinstance(row, ServiceHealth) else dict(row)
+
+
 def _row_with_display_service(row: dict, display_name: str) -> dict:
-    out = dict(row)
+    out = _copy_row(row)
     out["service"] = display_name
     return out
 
 
-def _dd_keys_for_catalog_name(catalog_name: str) -> set[str]:
+@lru_cache(maxsize=16384)
+def _dd_keys_for_catalog_name(catalog_name: str) -> frozenset[str]:
     k = _norm_service_key(catalog_name)
     keys = {k} if k else set()
     for alt in _CATALOG_DD_ALIASES.get(k, ()):
         ak = _norm_service_key(alt)
         if ak:
             keys.add(ak)
-    return keys
+    return frozenset(keys)
 
 
 def _lookup_status_for_catalog_name(catalog_name: str, by_key: dict[str, dict]) -> dict | None:
@@ -315,12 +502,10 @@ def merge_bundled_names_with_org_catalog(file_names: list[str]) -> list[str]:
     scope_keys = {_norm_service_key(n) for n in (file_names or []) if (n or "").strip()}
     if not scope_keys:
         return list(file_names or [])
-    org = engineering_wall_catalog_names()
     seen: set[str] = set()
     merged: list[str] = []
-    for n in org:
-        k = _norm_service_key(n)
-        if k and k in scope_keys and k not in seen:
+    for k, n in _org_catalog_keyed():
+        if k in scope_keys and k not in seen:
             seen.add(k)
             merged.append(n)
     for n in file_names or []:
@@ -357,9 +542,8 @@ def order_services_for_engineering_wall(
         out: list[str] = []
         for label in _engineering_team_display_order(labels_seen):
             names = team_buckets.get(label) or []
-            wall_order = ENGINEERING_WALL_SERVICE_ORDER.get(label, ())
-            if wall_order:
-                rank = {_norm_service_key(n): i for i, n in enumerate(wall_order)}
+            rank = _wall_order_rank(label)
+            if rank:
                 names.sort(
                     key=lambda n: (
                         rank.get(_norm_service_key(n), 9999),
@@ -373,14 +557,10 @@ def order_services_for_engineering_wall(
 
     out: list[str] = []
     placed: set[str] = set()
-    for label in ENGINEERING_GROUP_ORDER:
-        if label == "Other":
-            continue
-        for name in ENGINEERING_WALL_SERVICE_ORDER.get(label, ()):
-            k = _norm_service_key(name)
-            if k in scope_keys and k not in placed:
-                out.append(by_key.get(k, name))
-                placed.add(k)
+    for k, name in _org_catalog_keyed():
+        if k in scope_keys:
+            out.append(by_key.get(k, name))
+            placed.add(k)
     extras = sorted(
         (by_key[k] for k in by_key if k not in placed),
         key=str.lower,
@@ -550,10 +730,11 @@ _SLUG_BY_LABEL = {
 }
 
 
-def engineering_wall_catalog_names() -> list[str]:
-    """All org-wall services in display order (deduped, first occurrence wins)."""
+@lru_cache(maxsize=1)
+def _org_catalog_keyed() -> tuple[tuple[str, str], ...]:
+    """(normalized key, name) for every org-wall service in display order, first occurrence wins."""
     seen: set[str] = set()
-    out: list[str] = []
+    out: list[tuple[str, str]] = []
     for label in ENGINEERING_GROUP_ORDER:
         if label == "Other":
             continue
@@ -561,8 +742,19 @@ def engineering_wall_catalog_names() -> list[str]:
             k = _norm_service_key(name)
             if k and k not in seen:
                 seen.add(k)
-                out.append(name)
-    return out
+                out.append((k, name))
+    return tuple(out)
+
+
+@lru_cache(maxsize=None)
+def _wall_order_rank(label: str) -> dict[str, int]:
+    """Normalized service key -> tile position within one team block (empty if unordered)."""
+    return {_norm_service_key(n): i for i, n in enumerate(ENGINEERING_WALL_SERVICE_ORDER.get(label, ()))}
+
+
+def engineering_wall_catalog_names() -> list[str]:
+    """All org-wall services in display order (deduped, first occurrence wins)."""
+    return [name for _k, name in _org_catalog_keyed()]
 
 
 def engineering_wall_tile_columns_for_slug(slug: str) -> int:
@@ -575,10 +767,9 @@ def sort_services_for_engineering_group(label: str, services: list[dict]) -> lis
     order = ENGINEERING_WALL_SERVICE_ORDER.get(label, ())
     if not order:
         return sorted(services or [], key=lambda s: str(s.get("service") or "").lower())
-    rank = {_norm_service_key(n): i for i, n in enumerate(order)}
     by_key: dict[str, dict] = {}
     for s in services or []:
-        if not isinstance(s, dict):
+        if not isinstance(s, Mapping):
             continue
         k = _norm_service_key(str(s.get("service") or ""))
         if k and k not in by_key:
@@ -623,7 +814,7 @@ def merge_engineering_wall_statuses(
 
     by_key: dict[str, dict] = {}
     for s in all_statuses or []:
-        if not isinstance(s, dict):
+        if not isinstance(s, Mapping):
             continue
         k = _norm_service_key(str(s.get("service") or ""))
         if k:
@@ -687,34 +878,38 @@ def org_wall_legacy_list_path(dd_env: str) -> Path | None:
     return _ORG_WALL_LEGACY_LIST_BY_ENV.get((dd_env or "").strip())
 
 
-def org_wall_legacy_service_names(dd_env: str = "production") -> list[str]:
-    """Bundled org wall list for production or adt_prod."""
-    path = org_wall_legacy_list_path(dd_env)
-    if path is None or not path.is_file():
-        return []
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return []
+def _dedupe_by_service_key(names) -> tuple[str, ...]:
     out: list[str] = []
     seen: set[str] = set()
-    for ln in lines:
-        s = ln.strip()
-        if not s or s.lstrip().startswith("#"):
-            continue
+    for s in names:
         k = _norm_service_key(s)
         if k and k not in seen:
             seen.add(k)
             out.append(s)
-    return out
+    return tuple(out)
 
 
-def org_wall_legacy_service_keys(dd_env: str = "production") -> set[str]:
+def _legacy_service_keys(names) -> frozenset[str]:
     keys: set[str] = set()
-    for name in org_wall_legacy_service_names(dd_env):
+    for name in _dedupe_by_service_key(names):
         keys.update(_dd_keys_for_catalog_name(name))
         keys.add(_norm_service_key(name))
-    return keys
+    return frozenset(keys)
+
+
+def org_wall_legacy_service_names(dd_env: str = "production") -> list[str]:
+    """Bundled org wall list for production or adt_prod (loaded once per file change)."""
+    path = org_wall_legacy_list_path(dd_env)
+    if path is None:
+        return []
+    return list(_registry.derived(path, "org_legacy_names", _dedupe_by_service_key, ()))
+
+
+def org_wall_legacy_service_keys(dd_env: str = "production") -> frozenset[str]:
+    path = org_wall_legacy_list_path(dd_env)
+    if path is None:
+        return frozenset()
+    return _registry.derived(path, "org_legacy_keys", _legacy_service_keys, frozenset())
 
 
 def is_org_wall_legacy_service(name: str, dd_env: str = "production") -> bool:
@@ -740,7 +935,7 @@ def normalize_org_wall_legacy_tile_statuses(
         return list(statuses or [])
     out: list[dict] = []
     for s in statuses or []:
-        if not isinstance(s, dict):
+        if not isinstance(s, Mapping):
             continue
         name = str(s.get("service") or "")
         if not is_org_wall_legacy_service(name, dd_env):
@@ -751,7 +946,7 @@ def normalize_org_wall_legacy_tile_statuses(
             out.append(s)
             continue
         if st in ("inactive", "unknown"):
-            row = dict(s)
+            row = _copy_row(s)
             row["status"] = "healthy"
             row["wall_idle"] = True
             out.append(row)
@@ -817,7 +1012,7 @@ def drop_other_unlisted_org_wall_tiles(
     out: list[dict] = []
     dropped = 0
     for s in statuses or []:
-        if not isinstance(s, dict):
+        if not isinstance(s, Mapping):
             continue
         name = str(s.get("service") or "")
         k = _norm_service_key(name)
@@ -991,10 +1186,12 @@ _SERVICE_TO_GROUP: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=16384)
 def _norm_service_key(name: str) -> str:
     return re.sub(r"\s+", "", (name or "").strip().lower())
 
 
+@lru_cache(maxsize=16384)
 def canonical_service_name(name: str) -> str:
     k = _norm_service_key(name)
     if not k:
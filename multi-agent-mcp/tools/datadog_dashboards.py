@@ -1,6 +1,5 @@
 import os
 import html
-import threading
 import requests
 import time
 import json
@@ -9,24 +8,20 @@ from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
-from requests.adapters import HTTPAdapter
 from requests.exceptions import ChunkedEncodingError, ConnectionError, Timeout
-from urllib3.util.retry import Retry
+from tools.datadog_http import (
+    datadog_get,
+    datadog_post,
+    datadog_session,
+    reset_datadog_session_for_thread,
+)
 
 load_dotenv()
 
-_dd_session_local = threading.local()
-
 
 def _reset_datadog_session_for_thread():
     """Drop pooled TLS connections after a reset/abort (stale pool entries)."""
-    sess = getattr(_dd_session_local, "session", None)
-    if sess is not None:
-        try:
-            sess.close()
-        except Exception:
-            pass
-        _dd_session_local.session = None
+    reset_datadog_session_for_thread()
 
 
 def _is_transient_datadog_connection_error(exc: BaseException) -> bool:
@@ -109,22 +104,8 @@ def datadog_rest_api_base(dd_site: str | None) -> str:
 
 
 def _datadog_http_session():
-    """Thread-local Session with retries (Session is not safe across threads)."""
-    if getattr(_dd_session_local, "session", None) is None:
-        retry = Retry(
-            total=6,
-            connect=5,
-            read=5,
-            backoff_factor=0.8,
-            status_forcelist=(502, 503, 504),
-            allowed_methods=frozenset(["GET", "POST"]),
-            respect_retry_after_header=True,
-        )
-        adapter = HTTPAdapter(max_retries=retry, pool_connections=6, pool_maxsize=12)
-        sess = requests.Session()
-        sess.mount("https://", adapter)
-        _dd_session_local.session = sess
-    return _dd_session_local.session
+    """Thread-local retrying Session on the shared Datadog connection pool (tools.datadog_http)."""
+    return datadog_session(retrying=True)
 
 
 __all__ = [
@@ -212,7 +193,7 @@ def get_metric_data(dd_api_key, dd_app_key, dd_site, query, from_time, to_time):
     
     try:
         # Reduced timeout from 15 to 10 seconds
-        response = requests.get(api_url, headers=headers, params=params, timeout=10)
+        response = datadog_get(api_url, headers=headers, params=params, timeout=10)
         if response.status_code == 200:
             return response.json()
         return None
@@ -418,7 +399,7 @@ def create_graph_snapshot(dd_api_key, dd_app_key, dd_site, metric_query, from_ti
     }
     
     try:
-        response = requests.post(api_url, headers=headers, json=graph_def, timeout=20)
+        response = datadog_post(api_url, headers=headers, json=graph_def, timeout=20)
         if response.status_code == 200:
             data = response.json()
             return data.get('snapshot_url', None)
@@ -696,7 +677,7 @@ def read_datadog_dashboards(query: str, timerange_hours: int = 4) -> str:
             print(f"📊 Created filtered_dashboards with {len(filtered_dashboards)} item(s)")
         else:
             # Fetch all dashboards and filter
-            response = requests.get(api_url, headers=headers, timeout=15)
+            response = datadog_get(api_url, headers=headers, timeout=15)
             
             if response.status_code == 403:
                 return "<p>❌ Error 403: Access forbidden. Please verify your Datadog API and Application keys have the correct permissions.</p>"
@@ -4578,7 +4559,7 @@ def read_datadog_failed_pods(query: str = "", timerange_hours: int = 4) -> str:
                 "query": query_str
             }
             
-            response = requests.get(query_url, headers=headers, params=params, timeout=30)
+            response = datadog_get(query_url, headers=headers, params=params, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -4782,7 +4763,7 @@ def read_datadog_403_errors(query: str = "", timerange_hours: int = 4) -> str:
             "end": to_ts
         }
         
-        response = requests.post(search_url, headers=headers, json=body, timeout=30)
+        response = datadog_post(search_url, headers=headers, json=body, timeout=30)
         
         traces_403 = []
         
@@ -5004,7 +4985,7 @@ def search_datadog_dashboards(query: str = "", timerange: int = 4) -> str:
         dashboards_url = f"{datadog_rest_api_base(dd_site)}/api/v1/dashboard"
         print(f"📡 Fetching dashboards from: {dashboards_url}")
         
-        response = requests.get(dashboards_url, headers=headers, timeout=30)
+        response = datadog_get(dashboards_url, headers=headers, timeout=30)
         
         if response.status_code != 200:
             return output + f"""
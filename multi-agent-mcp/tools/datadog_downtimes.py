@@ -18,6 +18,7 @@ from zoneinfo import ZoneInfo
 import requests
 
 from tools.datadog_dashboards import datadog_rest_api_base, datadog_ui_origin
+from tools.datadog_http import datadog_get
 
 _LOG = logging.getLogger(__name__)
 
@@ -386,7 +387,7 @@ def _fetch_downtime_search_rows(headers: dict[str, str], dd_site: str) -> list[d
     offset = 0
 
     while len(rows) < max_rows:
-        response = requests.get(
+        response = datadog_get(
             url,
             headers=headers,
             params={"limit": page_size, "offset": offset, "sort": "-start_dt"},
@@ -424,7 +425,7 @@ def _fetch_monitor_tags(
     if mid in cache:
         return cache[mid]
     try:
-        response = requests.get(
+        response = datadog_get(
             f"{datadog_rest_api_base(dd_site)}/api/v1/monitor/{mid}",
             headers=headers,
             timeout=25,
@@ -0,0 +1,396 @@
+"""
+Shared keep-alive HTTPS transport for Datadog API calls.
+
+One process-wide urllib3 connection pool (per retry profile) backs every Datadog request made by
+status monitor, dashboards, downtimes and engineering groups, so parallel health checks reuse TLS
+connections to api.datadoghq.com instead of handshaking per query. Sessions stay thread-local
+(``requests.Session`` is not safe across threads); the mounted adapters are shared.
+
+Every request also passes through one process-wide AIMD concurrency limiter: the number of
+Datadog calls in flight grows by ~1 per round trip while responses are healthy, halves on a 429,
+and follows the X-RateLimit-Remaining / X-RateLimit-Reset headers — a rate-limit bucket that is
+exhausted (or answers 429) pauses new calls to its endpoints until its reset instead of letting
+them fail. Caller thread pools (status monitor workers, EKS, hub envs) are upper bounds only.
+
+Env:
+  DATADOG_HTTP_POOL_MAXSIZE     — keep-alive connections kept per host (default 32)
+  DATADOG_HTTP_POOL_CONNECTIONS — distinct hosts pooled (default 8)
+  DATADOG_HTTP_FANOUT_WORKERS   — threads for datadog_get_many (default = pool maxsize)
+  DATADOG_HTTP_ADAPTIVE         — 0 disables the limiter (default 1)
+  DATADOG_HTTP_MIN_CONCURRENCY / DATADOG_HTTP_MAX_CONCURRENCY / DATADOG_HTTP_INITIAL_CONCURRENCY
+                                — limiter bounds (default 2 / pool maxsize / 16)
+  DATADOG_HTTP_429_RETRIES      — times a 429 is retried after its bucket resets (default 2)
+  DATADOG_HTTP_MAX_WAIT_SECS    — longest a call waits on a paused bucket before trying anyway (default 30)
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_adapter_lock = threading.Lock()
+_adapters: dict[str, HTTPAdapter] = {}
+_session_local = threading.local()
+
+_fanout_lock = threading.Lock()
+_fanout_pool: ThreadPoolExecutor | None = None
+
+_stats_lock = threading.Lock()
+_stats: dict[str, dict[str, Any]] = {}
+
+_limiter_lock = threading.Lock()
+_limiter: "_AdaptiveLimiter | None" = None
+
+
+def _int_env(name: str, default: int, lo: int, hi: int) -> int:
+    try:
+        n = int((os.getenv(name) or str(default)).strip())
+    except (TypeError, ValueError):
+        n = default
+    return max(lo, min(n, hi))
+
+
+def datadog_http_pool_maxsize() -> int:
+    return _int_env("DATADOG_HTTP_POOL_MAXSIZE", 32, 4, 256)
+
+
+def datadog_http_pool_connections() -> int:
+    return _int_env("DATADOG_HTTP_POOL_CONNECTIONS", 8, 1, 64)
+
+
+def _build_adapter(retrying: bool) -> HTTPAdapter:
+    if retrying:
+        # Same policy datadog_dashboards used for its per-thread session
+        retry: Retry | int = Retry(
+            total=6,
+            connect=5,
+            read=5,
+            backoff_factor=0.8,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+        )
+    else:
+        # Callers run their own retry loops (status monitor); keep requests' default of none
+        retry = 0
+    return HTTPAdapter(
+        max_retries=retry,
+        pool_connections=datadog_http_pool_connections(),
+        pool_maxsize=datadog_http_pool_maxsize(),
+    )
+
+
+def _shared_adapter(retrying: bool) -> HTTPAdapter:
+    kind = "retrying" if retrying else "plain"
+    with _adapter_lock:
+        adapter = _adapters.get(kind)
+        if adapter is None:
+            adapter = _build_adapter(retrying)
+            _adapters[kind] = adapter
+        return adapter
+
+
+def _endpoint_key(method: str, url: str) -> str:
+    """``GET /api/v1/query`` — path trimmed to three segments so ids do not explode the counters."""
+    try:
+        path = urlsplit(url).path or "/"
+    except ValueError:
+        path = "/"
+    parts = [p for p in path.split("/") if p][:3]
+    return f"{method.upper()} /{'/'.join(parts)}"
+
+
+def _record(key: str, elapsed_ms: float, status: int | None) -> None:
+    with _stats_lock:
+        st = _stats.get(key)
+        if st is None:
+            st = {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0, "statuses": {}}
+            _stats[key] = st
+        st["count"] += 1
+        st["total_ms"] += elapsed_ms
+        if elapsed_ms > st["max_ms"]:
+            st["max_ms"] = elapsed_ms
+        if status is None:
+            st["errors"] += 1
+        else:
+            bucket = str(status)
+            st["statuses"][bucket] = st["statuses"].get(bucket, 0) + 1
+            if status >= 400:
+                st["errors"] += 1
+
+
+def _header_float(headers, name: str) -> float | None:
+    try:
+        v = headers.get(name)
+        return float(v) if v not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+class _AdaptiveLimiter:
+    """
+    Process-wide AIMD limit on concurrent Datadog requests plus per-bucket pauses.
+
+    Buckets are Datadog's X-RateLimit-Name values; the endpoint -> bucket mapping is learned from
+    responses, so the first call to an endpoint is never held back.
+    """
+
+    def __init__(self, lo: int, hi: int, initial: int, max_wait: float):
+        self.lo = lo
+        self.hi = hi
+        self.limit = float(max(lo, min(initial, hi)))
+        self.max_wait = max_wait
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._endpoint_bucket: dict[str, str] = {}
+        self._buckets: dict[str, dict[str, Any]] = {}
+        self._last_decrease = 0.0
+        self.counters = {"throttled": 0, "waits": 0, "wait_ms": 0.0, "increases": 0, "decreases": 0}
+
+    def _paused_until(self, endpoint: str) -> float:
+        b = self._buckets.get(self._endpoint_bucket.get(endpoint, ""))
+        return float(b["paused_until"]) if b else 0.0
+
+    def acquire(self, endpoint: str) -> None:
+        t0 = time.monotonic()
+        deadline = t0 + self.max_wait
+        waited = False
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                pause = self._paused_until(endpoint) - now
+                if pause > 0 and now < deadline:
+                    waited = True
+                    self._cond.wait(min(pause, deadline - now))
+                    continue
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    break
+                waited = True
+                self._cond.wait(1.0)
+            if waited:
+                self.counters["waits"] += 1
+                self.counters["wait_ms"] += (time.monotonic() - t0) * 1000.0
+
+    def _decrease(self, now: float) -> None:
+        # One multiplicative decrease per congestion event, not one per in-flight 429
+        if now - self._last_decrease >= 1.0:
+            self.limit = max(float(self.lo), self.limit / 2.0)
+            self._last_decrease = now
+            self.counters["decreases"] += 1
+
+    def release(self, endpoint: str, status: int | None, headers=None) -> float:
+        """Record the outcome; returns seconds until the endpoint's bucket resets (0 if unknown)."""
+        now = time.monotonic()
+        reset_in = 0.0
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            name = headers.get("X-RateLimit-Name") if headers is not None else None
+            remaining = _header_float(headers, "X-RateLimit-Remaining") if headers is not None else None
+            reset = _header_float(headers, "X-RateLimit-Reset") if headers is not None else None
+            if name:
+                self._endpoint_bucket[endpoint] = name
+                b = self._buckets.setdefault(name, {"paused_until": 0.0})
+                b["limit"] = _header_float(headers, "X-RateLimit-Limit")
+                b["remaining"] = remaining
+                b["period"] = _header_float(headers, "X-RateLimit-Period")
+                b["seen_at"] = now
+            else:
+                b = self._buckets.get(self._endpoint_bucket.get(endpoint, ""))
+                if b is None and status == 429:
+                    # 429 without rate-limit headers: pause just this endpoint
+                    name = f"endpoint:{endpoint}"
+                    self._endpoint_bucket[endpoint] = name
+                    b = self._buckets.setdefault(name, {"paused_until": 0.0})
+            if reset is not None:
+                reset_in = max(0.0, reset)
+            if status == 429:
+                self.counters["throttled"] += 1
+                self._decrease(now)
+                if b is not None:
+                    b["paused_until"] = max(b["paused_until"], now + (reset_in or 1.0))
+            elif status is not None and status < 500:
+                if b is not None and remaining is not None and remaining <= self.in_flight:
+                    # Calls already in flight will use up the bucket: hold new ones until it resets
+                    # (budget, not concurrency, is the constraint here — no multiplicative decrease)
+                    b["paused_until"] = max(b["paused_until"], now + (reset_in or 1.0))
+                elif self.limit < self.hi:
+                    self.limit = min(float(self.hi), self.limit + 1.0 / max(self.limit, 1.0))
+                    self.counters["increases"] += 1
+            self._cond.notify_all()
+        return reset_in
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        with self._cond:
+            return {
+                "limit": round(self.limit, 2),
+                "min": self.lo,
+                "max": self.hi,
+                "in_flight": self.in_flight,
+                **{k: (round(v, 1) if isinstance(v, float) else v) for k, v in self.counters.items()},
+                "buckets": {
+                    name: {
+                        "limit": b.get("limit"),
+                        "remaining": b.get("remaining"),
+                        "period": b.get("period"),
+                        "paused_for_secs": round(max(0.0, b["paused_until"] - now), 1),
+                    }
+                    for name, b in self._buckets.items()
+                },
+            }
+
+
+def _adaptive_limiter() -> _AdaptiveLimiter | None:
+    global _limiter
+    if (os.getenv("DATADOG_HTTP_ADAPTIVE") or "1").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                hi = _int_env("DATADOG_HTTP_MAX_CONCURRENCY", datadog_http_pool_maxsize(), 1, 256)
+                lo = _int_env("DATADOG_HTTP_MIN_CONCURRENCY", 2, 1, hi)
+                _limiter = _AdaptiveLimiter(
+                    lo,
+                    hi,
+                    _int_env("DATADOG_HTTP_INITIAL_CONCURRENCY", 16, lo, hi),
+                    float(_int_env("DATADOG_HTTP_MAX_WAIT_SECS", 30, 0, 600)),
+                )
+    return _limiter
+
+
+class _DatadogSession(requests.Session):
+    """
+    Session over the shared adapters; every request is admitted by the adaptive limiter and
+    timed into the latency counters. A 429 is retried once its bucket resets (if that is soon).
+    """
+
+    def request(self, method, url, *args, **kwargs):
+        key = _endpoint_key(method, url)
+        limiter = _adaptive_limiter()
+        retries = _int_env("DATADOG_HTTP_429_RETRIES", 2, 0, 10)
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(key)
+            t0 = time.perf_counter()
+            try:
+                resp = super().request(method, url, *args, **kwargs)
+            except Exception:
+                _record(key, (time.perf_counter() - t0) * 1000.0, None)
+                if limiter is not None:
+                    limiter.release(key, None)
+                raise
+            _record(key, (time.perf_counter() - t0) * 1000.0, resp.status_code)
+            if limiter is None:
+                return resp
+            reset_in = limiter.release(key, resp.status_code, resp.headers)
+            if resp.status_code != 429 or attempt >= retries or reset_in > limiter.max_wait:
+                return resp
+            attempt += 1
+            print(f"⏳ Datadog 429 on {key}: retry {attempt}/{retries} after bucket reset (~{reset_in:.0f}s)")
+
+    def close(self):
+        # Adapters are process-wide; closing one thread's session must not tear down the pool.
+        pass
+
+
+def datadog_session(retrying: bool = False) -> requests.Session:
+    """Thread-local Session mounted on the shared pooled adapter for this retry profile."""
+    attr = "retrying" if retrying else "plain"
+    sess = getattr(_session_local, attr, None)
+    if sess is None:
+        sess = _DatadogSession()
+        sess.mount("https://", _shared_adapter(retrying))
+        sess.mount("http://", _shared_adapter(retrying))
+        setattr(_session_local, attr, sess)
+    return sess
+
+
+def reset_datadog_session_for_thread() -> None:
+    """
+    Drop this thread's sessions after a reset/abort (stale TLS); the next call gets fresh ones.
+    The shared pools are left alone: urllib3 already discards the connection that failed and
+    re-checks idle ones on checkout, so other threads keep their keep-alive connections.
+    """
+    _session_local.plain = None
+    _session_local.retrying = None
+
+
+def is_datadog_api_url(url: str) -> bool:
+    """True for Datadog API hosts (api.datadoghq.com, api.us5.datadoghq.com, datadoghq.eu, ddog-gov)."""
+    try:
+        host = (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return False
+    return host.endswith((".datadoghq.com", ".datadoghq.eu", ".ddog-gov.com"))
+
+
+def datadog_get(url: str, **kwargs) -> requests.Response:
+    return datadog_session().get(url, **kwargs)
+
+
+def datadog_post(url: str, **kwargs) -> requests.Response:
+    return datadog_session().post(url, **kwargs)
+
+
+def _fanout_executor() -> ThreadPoolExecutor:
+    global _fanout_pool
+    with _fanout_lock:
+        if _fanout_pool is None:
+            workers = _int_env("DATADOG_HTTP_FANOUT_WORKERS", datadog_http_pool_maxsize(), 2, 256)
+            _fanout_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dd-http")
+        return _fanout_pool
+
+
+def datadog_get_many(calls: list[tuple[str, dict]]) -> list[Any]:
+    """
+    Run several GETs concurrently on the shared fan-out pool.
+    ``calls`` is ``[(url, requests_kwargs), ...]``; results keep order (Response or the raised Exception).
+    """
+
+    def _one(url: str, kwargs: dict):
+        try:
+            return datadog_get(url, **kwargs)
+        except Exception as ex:
+            return ex
+
+    if len(calls) <= 1:
+        return [_one(u, kw) for u, kw in calls]
+    ex = _fanout_executor()
+    futs = [ex.submit(_one, u, kw) for u, kw in calls]
+    return [f.result() for f in futs]
+
+
+def datadog_http_stats() -> dict:
+    """Per-endpoint request counters: count, errors, avg/max latency (ms), status histogram."""
+    with _stats_lock:
+        endpoints = {
+            key: {
+                "count": st["count"],
+                "errors": st["errors"],
+                "avg_ms": round(st["total_ms"] / st["count"], 1) if st["count"] else 0.0,
+                "max_ms": round(st["max_ms"], 1),
+                "statuses": dict(st["statuses"]),
+            }
+            for key, st in _stats.items()
+        }
+    limiter = _adaptive_limiter()
+    return {
+        "pool_maxsize": datadog_http_pool_maxsize(),
+        "pool_connections": datadog_http_pool_connections(),
+        "adaptive": limiter.snapshot() if limiter is not None else None,
+        "endpoints": endpoints,
+    }
+
+
+def reset_datadog_http_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
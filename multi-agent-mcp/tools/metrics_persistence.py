@@ -5,7 +5,7 @@ Stores and retrieves historical service health metrics
 import sqlite3
 import json
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Any
 import os
 
@@ -119,7 +119,58 @@ def init_database():
         CREATE INDEX IF NOT EXISTS idx_pd_incident_time 
         ON pagerduty_incidents(created_at, status)
     ''')
-    
+    # Incident store columns (tools/pagerduty_store.py): raw API payload and sync time
+    pd_cols = {r[1] for r in cursor.execute("PRAGMA table_info(pagerduty_incidents)")}
+    for col, decl in (
+        ("updated_at", "TEXT"),
+        ("payload_json", "TEXT"),
+        ("synced_at", "REAL"),
+    ):
+        if col not in pd_cols:
+            cursor.execute(f"ALTER TABLE pagerduty_incidents ADD COLUMN {col} {decl}")
+    if "custom_fields_json" in pd_cols:
+        # Left by the first store build; custom fields are cached in pagerduty_custom_fields
+        try:
+            cursor.execute("ALTER TABLE pagerduty_incidents DROP COLUMN custom_fields_json")
+        except sqlite3.OperationalError:
+            pass  # SQLite < 3.35: the unused column stays
+
+    # User log entries that count as "touching" an incident (shift crew filters)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS pagerduty_log_entries (
+            log_id TEXT PRIMARY KEY,
+            incident_id TEXT NOT NULL,
+            entry_type TEXT NOT NULL,
+            agent_id TEXT,
+            agent_name TEXT,
+            created_at TEXT NOT NULL
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_pd_log_agent_time
+        ON pagerduty_log_entries(agent_id, created_at)
+    ''')
+
+    # Incident custom fields (root cause), valid while the incident's last_status_change_at is unchanged
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS pagerduty_custom_fields (
+            incident_id TEXT PRIMARY KEY,
+            status TEXT,
+            status_change_at TEXT,
+            fields_json TEXT NOT NULL,
+            fetched_at REAL NOT NULL
+        )
+    ''')
+
+    # Incident store watermark and backfill coverage per PagerDuty account
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS pagerduty_sync_state (
+            sync_key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )
+    ''')
+
     # Service state changes tracking
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS service_state_changes (
@@ -237,6 +288,10 @@ def init_database():
         CREATE INDEX IF NOT EXISTS idx_sm_api_cache_updated
         ON status_monitor_api_cache(cache_kind, updated_at)
     ''')
+    # compute_secs (how long the payload took to fetch) drives probabilistic early refresh
+    api_cache_cols = {r[1] for r in cursor.execute("PRAGMA table_info(status_monitor_api_cache)")}
+    if "compute_secs" not in api_cache_cols:
+        cursor.execute("ALTER TABLE status_monitor_api_cache ADD COLUMN compute_secs REAL NOT NULL DEFAULT 0")
 
     # Persisted EKS cluster names per (service, env) — avoids repeated Datadog metrics queries on every load
     cursor.execute('''
@@ -252,6 +307,42 @@ def init_database():
         CREATE INDEX IF NOT EXISTS idx_service_eks_updated
         ON service_eks_clusters(updated_at)
     ''')
+
+    # APM operation family (trace.servlet / trace.http / trace.web) each (service, env) emits —
+    # health checks query the remembered family first instead of walking all of them
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS service_apm_families (
+            service_name TEXT NOT NULL,
+            environment TEXT NOT NULL,
+            family TEXT NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (service_name, environment)
+        )
+    ''')
+
+    # Shared status-monitor view snapshots (STATUS_MONITOR_SNAPSHOT_CACHE=sqlite): byte-bounded LRU
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS status_monitor_snapshots (
+            cache_key TEXT PRIMARY KEY,
+            payload_json TEXT NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            saved_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_sm_snapshots_accessed
+        ON status_monitor_snapshots(accessed_at)
+    ''')
+
+    # Cross-worker single-flight: one gunicorn worker holds the lease while it computes a view
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS status_monitor_leases (
+            lease_key TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )
+    ''')
     
     conn.commit()
     conn.close()
@@ -802,17 +893,19 @@ def get_state_changes(service_name: str, environment: str, hours: int = 24) -> L
 def sm_api_cache_get(kind: str, key: str, max_age_secs: float) -> Optional[Any]:
     """
     Status monitor: read short-lived cached JSON (Datadog health row, PagerDuty blob, Arlo list).
-    Returns None if missing, too old, or on error.
+    max_age_secs is the soft TTL (jittered per entry, refreshed early by entry_is_fresh).
+    Returns None if missing, due for refresh, or on error.
     """
+    from tools.status_monitor_cache import entry_is_fresh
+
     if max_age_secs <= 0:
         return None
     try:
-        cutoff = time.time() - float(max_age_secs)
         conn = _connect_db(timeout=30)
         cursor = conn.cursor()
         cursor.execute(
             """
-            SELECT payload_json, updated_at FROM status_monitor_api_cache
+            SELECT payload_json, updated_at, compute_secs FROM status_monitor_api_cache
             WHERE cache_kind = ? AND cache_key = ?
             """,
             (kind, key),
@@ -821,8 +914,8 @@ def sm_api_cache_get(kind: str, key: str, max_age_secs: float) -> Optional[Any]:
         conn.close()
         if not row:
             return None
-        payload_json, updated_at = row
-        if updated_at < cutoff:
+        payload_json, updated_at, compute_secs = row
+        if not entry_is_fresh(f"{kind}:{key}", updated_at, max_age_secs, compute_secs or 0.0):
             return None
         return json.loads(payload_json)
     except Exception as e:
@@ -830,8 +923,18 @@ def sm_api_cache_get(kind: str, key: str, max_age_secs: float) -> Optional[Any]:
         return None
 
 
-def sm_api_cache_set(kind: str, key: str, payload: Any) -> None:
-    """Persist JSON-serializable payload for reuse within TTL window."""
+def sm_api_cache_get_stale(kind: str, key: str, hard_max_age_secs: float) -> Optional[tuple[Any, float]]:
+    """
+    (payload, updated_at_unix) for a row younger than the hard TTL, ignoring soft expiry.
+    Fallback when a live fetch fails or comes back empty.
+    """
+    if hard_max_age_secs <= 0:
+        return None
+    return sm_api_cache_get_entry(kind, key, newer_than=time.time() - float(hard_max_age_secs))
+
+
+def sm_api_cache_set(kind: str, key: str, payload: Any, compute_secs: float = 0.0) -> None:
+    """Persist JSON-serializable payload (and how long it took to fetch) for reuse within TTL window."""
     try:
         blob = json.dumps(payload, default=str)
         now = time.time()
@@ -839,13 +942,14 @@ def sm_api_cache_set(kind: str, key: str, payload: Any) -> None:
         cursor = conn.cursor()
         cursor.execute(
             """
-            INSERT INTO status_monitor_api_cache (cache_kind, cache_key, payload_json, updated_at)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO status_monitor_api_cache (cache_kind, cache_key, payload_json, updated_at, compute_secs)
+            VALUES (?, ?, ?, ?, ?)
             ON CONFLICT(cache_kind, cache_key) DO UPDATE SET
                 payload_json = excluded.payload_json,
-                updated_at = excluded.updated_at
+                updated_at = excluded.updated_at,
+                compute_secs = excluded.compute_secs
             """,
-            (kind, key, blob, now),
+            (kind, key, blob, now, max(0.0, float(compute_secs or 0.0))),
         )
         conn.commit()
         conn.close()
@@ -853,6 +957,115 @@ def sm_api_cache_set(kind: str, key: str, payload: Any) -> None:
         print(f"⚠️ sm_api_cache_set ({kind}): {e}")
 
 
+def sm_api_cache_get_entry(kind: str, key: str, newer_than: float = 0.0) -> Optional[tuple[Any, float]]:
+    """
+    (payload, updated_at_unix) if the row was written after newer_than (unix), else None.
+    The payload is only loaded when the row qualifies (cheap to poll).
+    """
+    try:
+        conn = _connect_db(timeout=30)
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT payload_json, updated_at FROM status_monitor_api_cache
+            WHERE cache_kind = ? AND cache_key = ? AND updated_at > ?
+            """,
+            (kind, key, float(newer_than)),
+        )
+        row = cursor.fetchone()
+        conn.close()
+        if not row:
+            return None
+        return (json.loads(row[0]), float(row[1]))
+    except Exception as e:
+        print(f"⚠️ sm_api_cache_get_entry ({kind}): {e}")
+        return None
+
+
+def sm_api_cache_get_many(kind: str, keys: List[str], max_age_secs: float) -> Dict[str, Any]:
+    """
+    Bulk sm_api_cache_get: one connection for many keys of the same kind.
+    Returns {key: payload} for fresh rows only (missing / due-for-refresh keys are omitted).
+    """
+    from tools.status_monitor_cache import entry_is_fresh
+
+    out: Dict[str, Any] = {}
+    if max_age_secs <= 0 or not keys:
+        return out
+    try:
+        now = time.time()
+        # Jitter only ever shortens the TTL, so the plain cutoff is a safe SQL pre-filter
+        cutoff = now - float(max_age_secs)
+        uniq = list(dict.fromkeys(keys))
+        conn = _connect_db(timeout=30)
+        cursor = conn.cursor()
+        # Stay well under SQLITE_MAX_VARIABLE_NUMBER on older builds
+        for i in range(0, len(uniq), 500):
+            chunk = uniq[i : i + 500]
+            marks = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"""
+                SELECT cache_key, payload_json, updated_at, compute_secs FROM status_monitor_api_cache
+                WHERE cache_kind = ? AND updated_at >= ? AND cache_key IN ({marks})
+                """,
+                (kind, cutoff, *chunk),
+            )
+            for cache_key, payload_json, updated_at, compute_secs in cursor.fetchall():
+                if not entry_is_fresh(f"{kind}:{cache_key}", updated_at, max_age_secs, compute_secs or 0.0, now=now):
+                    continue
+                try:
+                    out[cache_key] = json.loads(payload_json)
+                except ValueError:
+                    continue
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ sm_api_cache_get_many ({kind}): {e}")
+    return out
+
+
+def sm_api_cache_set_many(kind: str, payloads: Dict[str, Any], compute_secs: float = 0.0) -> None:
+    """Bulk sm_api_cache_set in a single transaction (compute_secs shared by the batch)."""
+    if not payloads:
+        return
+    try:
+        now = time.time()
+        cs = max(0.0, float(compute_secs or 0.0))
+        rows = [(kind, k, json.dumps(v, default=str), now, cs) for k, v in payloads.items()]
+        conn = _connect_db(timeout=30)
+        conn.executemany(
+            """
+            INSERT INTO status_monitor_api_cache (cache_kind, cache_key, payload_json, updated_at, compute_secs)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(cache_kind, cache_key) DO UPDATE SET
+                payload_json = excluded.payload_json,
+                updated_at = excluded.updated_at,
+                compute_secs = excluded.compute_secs
+            """,
+            rows,
+        )
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ sm_api_cache_set_many ({kind}): {e}")
+
+
+def sm_api_cache_purge(kind: str, older_than_secs: float) -> int:
+    """Delete rows of one kind not written within older_than_secs (short-lived per-session rows)."""
+    try:
+        conn = _connect_db(timeout=30)
+        cur = conn.execute(
+            "DELETE FROM status_monitor_api_cache WHERE cache_kind = ? AND updated_at < ?",
+            (kind, time.time() - float(older_than_secs)),
+        )
+        conn.commit()
+        n = cur.rowcount or 0
+        conn.close()
+        return n
+    except Exception as e:
+        print(f"⚠️ sm_api_cache_purge ({kind}): {e}")
+        return 0
+
+
 def get_service_eks_clusters(service_name: str, environment: str) -> Optional[tuple[list[str], float]]:
     """
     Returns (cluster_names, updated_at_unix) if a row exists, else None.
@@ -905,6 +1118,565 @@ def set_service_eks_clusters(service_name: str, environment: str, clusters: list
         print(f"⚠️ set_service_eks_clusters: {e}")
 
 
+def get_service_eks_clusters_env(environment: str) -> Dict[str, tuple[list[str], float]]:
+    """Every persisted row for one environment: {service_name: (cluster_names, updated_at_unix)}."""
+    out: Dict[str, tuple[list[str], float]] = {}
+    try:
+        conn = _connect_db(timeout=30)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT service_name, clusters_json, updated_at FROM service_eks_clusters WHERE environment = ?",
+            (environment,),
+        )
+        rows = cursor.fetchall()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ get_service_eks_clusters_env: {e}")
+        return out
+    for service_name, raw, updated_at in rows:
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            continue
+        if isinstance(data, list):
+            out[service_name] = (
+                [str(x).strip() for x in data if x is not None and str(x).strip()],
+                float(updated_at),
+            )
+    return out
+
+
+def set_service_eks_clusters_many(rows: List[tuple]) -> None:
+    """Bulk upsert of (service_name, environment, cluster_names) in one transaction."""
+    if not rows:
+        return
+    try:
+        now = time.time()
+        params = [
+            (
+                svc,
+                env,
+                json.dumps([str(x).strip() for x in clusters if x is not None and str(x).strip()], ensure_ascii=False),
+                now,
+            )
+            for svc, env, clusters in rows
+        ]
+        conn = _connect_db(timeout=30)
+        conn.executemany(
+            """
+            INSERT INTO service_eks_clusters (service_name, environment, clusters_json, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(service_name, environment) DO UPDATE SET
+                clusters_json = excluded.clusters_json,
+                updated_at = excluded.updated_at
+            """,
+            params,
+        )
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ set_service_eks_clusters_many: {e}")
+
+
+def get_service_apm_family(service_name: str, environment: str) -> Optional[tuple[str, float]]:
+    """Returns (family, updated_at_unix) for a (service, env) if one was recorded, else None."""
+    try:
+        conn = _connect_db(timeout=30)
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT family, updated_at FROM service_apm_families
+            WHERE service_name = ? AND environment = ?
+            """,
+            (service_name, environment),
+        )
+        row = cursor.fetchone()
+        conn.close()
+        if not row:
+            return None
+        return (str(row[0]), float(row[1]))
+    except Exception as e:
+        print(f"⚠️ get_service_apm_family: {e}")
+        return None
+
+
+def set_service_apm_family(service_name: str, environment: str, family: str) -> None:
+    """Upsert the APM operation family a (service, env) was last seen emitting."""
+    set_service_apm_families([(service_name, environment, family)])
+
+
+def set_service_apm_families(rows: List[tuple]) -> None:
+    """Bulk upsert of (service_name, environment, family) in one transaction."""
+    if not rows:
+        return
+    try:
+        now = time.time()
+        conn = _connect_db(timeout=30)
+        conn.executemany(
+            """
+            INSERT INTO service_apm_families (service_name, environment, family, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(service_name, environment) DO UPDATE SET
+                family = excluded.family,
+                updated_at = excluded.updated_at
+            """,
+            [(svc, env, fam, now) for svc, env, fam in rows],
+        )
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ set_service_apm_families: {e}")
+
+
+def sm_snapshot_get(cache_key: str, max_age_secs: float) -> Optional[tuple[Any, float]]:
+    """
+    (payload, saved_at_unix) for a shared view snapshot younger than max_age_secs, else None.
+    Bumps accessed_at (LRU order) at most every 30s per key to keep reads mostly write-free.
+    """
+    try:
+        now = time.time()
+        conn = _connect_db(timeout=30)
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT payload_json, saved_at, accessed_at FROM status_monitor_snapshots
+            WHERE cache_key = ? AND saved_at > ?
+            """,
+            (cache_key, now - float(max_age_secs)),
+        )
+        row = cursor.fetchone()
+        if row and now - float(row[2]) > 30:
+            conn.execute(
+                "UPDATE status_monitor_snapshots SET accessed_at = ? WHERE cache_key = ?",
+                (now, cache_key),
+            )
+            conn.commit()
+        conn.close()
+        if not row:
+            return None
+        return (json.loads(row[0]), float(row[1]))
+    except Exception as e:
+        print(f"⚠️ sm_snapshot_get: {e}")
+        return None
+
+
+def sm_snapshot_saved_at(cache_key: str) -> Optional[float]:
+    """saved_at of a shared snapshot without loading its payload."""
+    try:
+        conn = _connect_db(timeout=30)
+        cursor = conn.cursor()
+        cursor.execute("SELECT saved_at FROM status_monitor_snapshots WHERE cache_key = ?", (cache_key,))
+        row = cursor.fetchone()
+        conn.close()
+        return float(row[0]) if row else None
+    except Exception as e:
+        print(f"⚠️ sm_snapshot_saved_at: {e}")
+        return None
+
+
+def sm_snapshot_set(cache_key: str, payload_json: str, saved_at: float, max_bytes: int) -> int:
+    """
+    Upsert a snapshot, then evict least-recently-accessed rows until the table fits max_bytes.
+    Returns the number of evicted rows.
+    """
+    try:
+        now = time.time()
+        conn = _connect_db(timeout=30)
+        conn.execute(
+            """
+            INSERT INTO status_monitor_snapshots (cache_key, payload_json, size_bytes, saved_at, accessed_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                payload_json = excluded.payload_json,
+                size_bytes = excluded.size_bytes,
+                saved_at = excluded.saved_at,
+                accessed_at = excluded.accessed_at
+            """,
+            (cache_key, payload_json, len(payload_json), float(saved_at), now),
+        )
+        evicted = 0
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM status_monitor_snapshots").fetchone()[0]
+        if total > max_bytes:
+            rows = conn.execute(
+                """
+                SELECT cache_key, size_bytes FROM status_monitor_snapshots
+                WHERE cache_key != ? ORDER BY accessed_at ASC
+                """,
+                (cache_key,),
+            ).fetchall()
+            drop = []
+            for key, size in rows:
+                if total <= max_bytes:
+                    break
+                drop.append((key,))
+                total -= int(size)
+            conn.executemany("DELETE FROM status_monitor_snapshots WHERE cache_key = ?", drop)
+            evicted = len(drop)
+        conn.commit()
+        conn.close()
+        return evicted
+    except Exception as e:
+        print(f"⚠️ sm_snapshot_set: {e}")
+        return 0
+
+
+def sm_snapshot_stats() -> Dict[str, int]:
+    """Entry count and total payload bytes of the shared snapshot table."""
+    try:
+        conn = _connect_db(timeout=30)
+        n, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM status_monitor_snapshots"
+        ).fetchone()
+        conn.close()
+        return {"entries": int(n), "bytes": int(total)}
+    except Exception as e:
+        print(f"⚠️ sm_snapshot_stats: {e}")
+        return {"entries": 0, "bytes": 0}
+
+
+def sm_snapshot_delete(cache_key: str) -> None:
+    try:
+        conn = _connect_db(timeout=30)
+        conn.execute("DELETE FROM status_monitor_snapshots WHERE cache_key = ?", (cache_key,))
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ sm_snapshot_delete: {e}")
+
+
+def sm_snapshot_clear() -> None:
+    try:
+        conn = _connect_db(timeout=30)
+        conn.execute("DELETE FROM status_monitor_snapshots")
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ sm_snapshot_clear: {e}")
+
+
+def sm_lease_acquire(lease_key: str, owner: str, ttl_secs: float) -> bool:
+    """
+    Take (or renew) a named lease for ttl_secs. False while another owner holds an unexpired one.
+    Fails open (True) when the DB is unavailable so callers still compute.
+    """
+    try:
+        now = time.time()
+        conn = _connect_db(timeout=30)
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            INSERT INTO status_monitor_leases (lease_key, owner, expires_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(lease_key) DO UPDATE SET
+                owner = excluded.owner,
+                expires_at = excluded.expires_at
+            WHERE status_monitor_leases.expires_at < ? OR status_monitor_leases.owner = excluded.owner
+            """,
+            (lease_key, owner, now + float(ttl_secs), now),
+        )
+        acquired = cursor.rowcount > 0
+        conn.commit()
+        conn.close()
+        return acquired
+    except Exception as e:
+        print(f"⚠️ sm_lease_acquire ({lease_key}): {e}")
+        return True
+
+
+def sm_lease_release(lease_key: str, owner: str) -> None:
+    """Drop a lease if this owner still holds it."""
+    try:
+        conn = _connect_db(timeout=30)
+        conn.execute(
+            "DELETE FROM status_monitor_leases WHERE lease_key = ? AND owner = ?",
+            (lease_key, owner),
+        )
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ sm_lease_release ({lease_key}): {e}")
+
+
+def _pd_utc(value: Optional[str]) -> Optional[str]:
+    """PagerDuty timestamp as ``YYYY-MM-DDTHH:MM:SSZ`` (UTC) so stored values compare as strings."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return str(value)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _pd_incident_row(inc: Dict, now: float) -> tuple:
+    created = _pd_utc(inc.get("created_at"))
+    changed = _pd_utc(inc.get("last_status_change_at") or inc.get("updated_at"))
+    status = inc.get("status")
+    resolved = changed if status == "resolved" else None
+    duration = None
+    if resolved and created:
+        try:
+            duration = int(
+                (datetime.fromisoformat(resolved[:-1]) - datetime.fromisoformat(created[:-1])).total_seconds() // 60
+            )
+        except ValueError:
+            duration = None
+    service = inc.get("service") or {}
+    assignees = [
+        (a.get("assignee") or {}).get("summary")
+        for a in inc.get("assignments") or []
+        if isinstance(a, dict) and (a.get("assignee") or {}).get("summary")
+    ]
+    return (
+        inc.get("id"),
+        inc.get("incident_number"),
+        inc.get("title"),
+        status,
+        inc.get("urgency"),
+        created,
+        resolved,
+        service.get("id"),
+        service.get("summary"),
+        json.dumps([service.get("summary")] if service.get("summary") else []),
+        duration,
+        json.dumps(assignees),
+        changed,
+        json.dumps(inc, default=str),
+        now,
+    )
+
+
+def pd_store_upsert_incidents(incidents: List[Dict], clear_custom_fields: Optional[List[str]] = None) -> int:
+    """
+    Insert or refresh raw PagerDuty incidents (keeps stored custom fields unless the incident id is
+    in clear_custom_fields). Returns the number of rows written. Raises sqlite3.Error (like the
+    other store writers) so a failed write never lets the store sync advance its watermark.
+    """
+    now = time.time()
+    rows = [_pd_incident_row(i, now) for i in incidents if isinstance(i, dict) and i.get("id")]
+    if not rows and not clear_custom_fields:
+        return 0
+    conn = _connect_db(timeout=30)
+    try:
+        cursor = conn.cursor()
+        cursor.executemany(
+            """
+            INSERT INTO pagerduty_incidents (
+                incident_id, incident_number, title, status, urgency, created_at, resolved_at,
+                service_id, service_name, affected_services, duration_minutes, assignees,
+                updated_at, payload_json, synced_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(incident_id) DO UPDATE SET
+                incident_number = excluded.incident_number,
+                title = excluded.title,
+                status = excluded.status,
+                urgency = excluded.urgency,
+                created_at = excluded.created_at,
+                resolved_at = excluded.resolved_at,
+                service_id = excluded.service_id,
+                service_name = excluded.service_name,
+                affected_services = excluded.affected_services,
+                duration_minutes = excluded.duration_minutes,
+                assignees = excluded.assignees,
+                updated_at = excluded.updated_at,
+                payload_json = excluded.payload_json,
+                synced_at = excluded.synced_at
+            """,
+            rows,
+        )
+        if clear_custom_fields:
+            cursor.executemany(
+                "DELETE FROM pagerduty_custom_fields WHERE incident_id = ?",
+                [(iid,) for iid in clear_custom_fields],
+            )
+        conn.commit()
+        return len(rows)
+    finally:
+        conn.close()
+
+
+def pd_store_incidents(since: str, until: Optional[str] = None, statuses: Optional[List[str]] = None) -> List[Dict]:
+    """Stored incident payloads created in [since, until) (``...Z`` strings), newest first."""
+    sql = "SELECT payload_json FROM pagerduty_incidents WHERE payload_json IS NOT NULL AND created_at >= ?"
+    args: list = [since]
+    if until:
+        sql += " AND created_at < ?"
+        args.append(until)
+    if statuses:
+        sql += f" AND status IN ({','.join('?' * len(statuses))})"
+        args.extend(statuses)
+    sql += " ORDER BY created_at DESC, incident_number DESC"
+    try:
+        conn = _connect_db(timeout=30)
+        rows = conn.execute(sql, args).fetchall()
+        conn.close()
+        return [json.loads(r[0]) for r in rows]
+    except Exception as e:
+        print(f"⚠️ pd_store_incidents: {e}")
+        return []
+
+
+def pd_store_incidents_by_id(incident_ids: List[str]) -> Dict[str, Dict]:
+    """{incident_id: payload} for the stored ones among incident_ids."""
+    out: Dict[str, Dict] = {}
+    if not incident_ids:
+        return out
+    try:
+        conn = _connect_db(timeout=30)
+        ids = list(incident_ids)
+        for i in range(0, len(ids), 500):
+            chunk = ids[i : i + 500]
+            for iid, blob in conn.execute(
+                f"""
+                SELECT incident_id, payload_json FROM pagerduty_incidents
+                WHERE payload_json IS NOT NULL AND incident_id IN ({','.join('?' * len(chunk))})
+                """,
+                chunk,
+            ):
+                out[iid] = json.loads(blob)
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ pd_store_incidents_by_id: {e}")
+    return out
+
+
+def pd_custom_fields_get(incident_ids: List[str]) -> Dict[str, tuple]:
+    """{incident_id: (status, status_change_at, custom_fields, fetched_at_unix)} for cached incidents."""
+    out: Dict[str, tuple] = {}
+    if not incident_ids:
+        return out
+    try:
+        conn = _connect_db(timeout=30)
+        ids = list(incident_ids)
+        for i in range(0, len(ids), 500):
+            chunk = ids[i : i + 500]
+            for iid, status, changed, blob, fetched in conn.execute(
+                f"""
+                SELECT incident_id, status, status_change_at, fields_json, fetched_at
+                FROM pagerduty_custom_fields WHERE incident_id IN ({','.join('?' * len(chunk))})
+                """,
+                chunk,
+            ):
+                out[iid] = (status, changed, json.loads(blob), float(fetched))
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ pd_custom_fields_get: {e}")
+    return out
+
+
+def pd_custom_fields_set(rows: List[tuple], retention_days: int = 92) -> None:
+    """rows: (incident_id, status, status_change_at, custom_fields). Drops rows older than retention_days."""
+    if not rows:
+        return
+    try:
+        now = time.time()
+        conn = _connect_db(timeout=30)
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO pagerduty_custom_fields
+            (incident_id, status, status_change_at, fields_json, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [(iid, status, changed, json.dumps(fields, default=str), now) for iid, status, changed, fields in rows],
+        )
+        conn.execute("DELETE FROM pagerduty_custom_fields WHERE fetched_at < ?", (now - retention_days * 86400,))
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ pd_custom_fields_set: {e}")
+
+
+def pd_store_upsert_log_entries(rows: List[tuple]) -> None:
+    """rows: (log_id, incident_id, entry_type, agent_id, agent_name, created_at). Raises sqlite3.Error."""
+    if not rows:
+        return
+    conn = _connect_db(timeout=30)
+    try:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO pagerduty_log_entries
+            (log_id, incident_id, entry_type, agent_id, agent_name, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [(r[0], r[1], r[2], r[3], r[4], _pd_utc(r[5])) for r in rows],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def pd_store_touches(agent_ids: List[str], since: str) -> List[tuple]:
+    """(incident_id, agent_name, created_at) log entries by agent_ids since ``since``, newest first."""
+    if not agent_ids:
+        return []
+    try:
+        conn = _connect_db(timeout=30)
+        rows = conn.execute(
+            f"""
+            SELECT incident_id, agent_name, created_at FROM pagerduty_log_entries
+            WHERE agent_id IN ({','.join('?' * len(agent_ids))}) AND created_at >= ?
+            ORDER BY created_at DESC
+            """,
+            [*agent_ids, since],
+        ).fetchall()
+        conn.close()
+        return rows
+    except Exception as e:
+        print(f"⚠️ pd_store_touches: {e}")
+        return []
+
+
+def pd_store_purge(before: str) -> None:
+    """Drop resolved incidents and log entries created before ``before`` (``...Z`` string)."""
+    try:
+        conn = _connect_db(timeout=30)
+        conn.execute(
+            "DELETE FROM pagerduty_incidents WHERE created_at < ? AND status = 'resolved' AND payload_json IS NOT NULL",
+            (before,),
+        )
+        conn.execute("DELETE FROM pagerduty_log_entries WHERE created_at < ?", (before,))
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ pd_store_purge: {e}")
+
+
+def pd_store_state_get(prefix: str) -> Dict[str, str]:
+    """Sync-state values whose key starts with prefix, keyed by the rest of the key."""
+    try:
+        conn = _connect_db(timeout=30)
+        rows = conn.execute(
+            "SELECT sync_key, value FROM pagerduty_sync_state WHERE substr(sync_key, 1, ?) = ?",
+            (len(prefix), prefix),
+        ).fetchall()
+        conn.close()
+        return {k[len(prefix):]: v for k, v in rows}
+    except Exception as e:
+        print(f"⚠️ pd_store_state_get: {e}")
+        return {}
+
+
+def pd_store_state_set(prefix: str, values: Dict[str, str]) -> None:
+    """Upsert sync-state values under prefix. Raises sqlite3.Error."""
+    if not values:
+        return
+    now = time.time()
+    conn = _connect_db(timeout=30)
+    try:
+        conn.executemany(
+            """
+            INSERT INTO pagerduty_sync_state (sync_key, value, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT(sync_key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+            """,
+            [(prefix + k, str(v), now) for k, v in values.items()],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def clear_status_monitor_api_cache() -> None:
     """Wipe status-monitor API cache (Datadog / PagerDuty / Arlo short TTL rows)."""
     try:
@@ -0,0 +1,200 @@
+"""
+Shared PagerDuty REST transport and offset paginator.
+
+``pagerduty_pages(headers, path, params, key)`` asks for the first page with ``total=true``, then
+fetches the remaining offsets concurrently on one process-wide pool and yields rows in offset order
+as their pages arrive: callers filter page one while later pages are still downloading. Without a
+``total`` (e.g. status-dashboard filters) it walks pages one after another like the old loops.
+
+Every call shares one keep-alive pool and one rate-limit gate per process. A 429 pauses all
+PagerDuty calls until ``ratelimit-reset`` / ``Retry-After`` and retries the page; when
+``ratelimit-remaining`` drops to the number of calls in flight, new calls wait for the reset
+instead of spending the token's budget (PagerDuty allows ~960 requests/min per token).
+
+Env:
+  PAGERDUTY_HTTP_MAX_WORKERS=6   — concurrent page fetches per process (1 = sequential pages)
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+PD_API = "https://api.pagerduty.com"
+_PD_MAX_OFFSET = 10000
+_429_RETRIES = 3
+_MAX_PAUSE_SECS = 60.0
+
+_adapter_lock = threading.Lock()
+_adapter: HTTPAdapter | None = None
+_session_local = threading.local()
+
+_pool_lock = threading.Lock()
+_pool: ThreadPoolExecutor | None = None
+
+_gate = threading.Condition()
+_gate_state = {"paused_until": 0.0, "in_flight": 0}
+
+
+class PagerDutyAPIError(RuntimeError):
+    """Non-200 answer from a PagerDuty list endpoint."""
+
+    def __init__(self, status_code: int, reason: str = ""):
+        super().__init__(f"PagerDuty API Error {status_code}: {reason}")
+        self.status_code = status_code
+        self.reason = reason
+
+
+def pagerduty_http_max_workers() -> int:
+    try:
+        return max(1, min(32, int(os.getenv("PAGERDUTY_HTTP_MAX_WORKERS", "6"))))
+    except (TypeError, ValueError):
+        return 6
+
+
+def _session() -> requests.Session:
+    global _adapter
+    sess = getattr(_session_local, "session", None)
+    if sess is None:
+        with _adapter_lock:
+            if _adapter is None:
+                _adapter = HTTPAdapter(
+                    max_retries=Retry(
+                        total=4,
+                        connect=3,
+                        read=3,
+                        backoff_factor=0.6,
+                        status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset(["GET"]),
+                    ),
+                    pool_maxsize=max(4, pagerduty_http_max_workers() * 2),
+                )
+        sess = requests.Session()
+        sess.mount("https://", _adapter)
+        _session_local.session = sess
+    return sess
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=pagerduty_http_max_workers(), thread_name_prefix="pd-http")
+        return _pool
+
+
+def _reset_secs(headers) -> float:
+    for name in ("ratelimit-reset", "Retry-After"):
+        try:
+            v = float(headers.get(name))
+        except (TypeError, ValueError):
+            continue
+        return max(0.5, min(v, _MAX_PAUSE_SECS))
+    return 2.0
+
+
+def pagerduty_get(url: str, headers: dict, params: dict | None = None, timeout=(12, 60)) -> requests.Response:
+    """GET through the shared pool and rate-limit gate; a 429 waits for the reset and retries."""
+    if url.startswith("/"):
+        url = PD_API + url
+    attempt = 0
+    while True:
+        with _gate:
+            while True:
+                pause = _gate_state["paused_until"] - time.monotonic()
+                if pause <= 0:
+                    break
+                _gate.wait(pause)
+            _gate_state["in_flight"] += 1
+        resp = None
+        try:
+            resp = _session().get(url, headers=headers, params=params, timeout=timeout)
+        finally:
+            with _gate:
+                _gate_state["in_flight"] -= 1
+                if resp is not None:
+                    try:
+                        remaining = float(resp.headers.get("ratelimit-remaining"))
+                    except (TypeError, ValueError):
+                        remaining = None
+                    if resp.status_code == 429 or (remaining is not None and remaining <= _gate_state["in_flight"]):
+                        until = time.monotonic() + _reset_secs(resp.headers)
+                        _gate_state["paused_until"] = max(_gate_state["paused_until"], until)
+                _gate.notify_all()
+        if resp.status_code != 429 or attempt >= _429_RETRIES:
+            return resp
+        attempt += 1
+        print(f"⏳ PagerDuty 429: retry {attempt}/{_429_RETRIES} after ~{_reset_secs(resp.headers):.0f}s")
+
+
+def _page(url: str, headers: dict, params: dict, timeout) -> dict:
+    r = pagerduty_get(url, headers, params, timeout)
+    if r.status_code != 200:
+        raise PagerDutyAPIError(r.status_code, r.reason or "")
+    return r.json()
+
+
+def pagerduty_pages(
+    headers: dict,
+    path: str,
+    params: dict,
+    key: str,
+    *,
+    page_size: int = 100,
+    max_rows: int = _PD_MAX_OFFSET,
+    page_hook: Callable[[list, dict], None] | None = None,
+    timeout=(12, 60),
+) -> Iterator[dict]:
+    """
+    Rows under ``key`` from every page of an offset-paginated list, in order, up to max_rows.
+    page_hook(rows, page_json) runs on each page before its rows are yielded (sibling ``include[]``
+    lists). Raises PagerDutyAPIError on a non-200 page (rows already yielded stay with the caller).
+    """
+    url = path if path.startswith("http") else PD_API + path
+    max_rows = min(max_rows, _PD_MAX_OFFSET)
+
+    def _fetch(offset: int) -> tuple[list, dict]:
+        data = _page(url, headers, {**params, "limit": page_size, "offset": offset, "total": "true"}, timeout)
+        rows = data.get(key) or []
+        if page_hook is not None:
+            page_hook(rows, data)
+        return rows, data
+
+    rows, data = _fetch(0)
+    yield from rows
+    offset = page_size
+    if not data.get("more") or not rows:
+        return
+    try:
+        total = int(data.get("total"))
+    except (TypeError, ValueError):
+        total = None
+    if total is not None and pagerduty_http_max_workers() > 1:
+        offsets = list(range(page_size, min(total, max_rows), page_size))
+        pool = _executor()
+        futs = [pool.submit(_fetch, o) for o in offsets]
+        try:
+            for o, fut in zip(offsets, futs):
+                rows, data = fut.result()
+                yield from rows
+                offset = o + page_size
+                if not rows:
+                    return
+        finally:
+            for fut in futs:
+                fut.cancel()
+        if not data.get("more"):
+            return
+    # No total, or rows were added while paging: continue one page at a time
+    while offset < max_rows:
+        rows, data = _fetch(offset)
+        yield from rows
+        if not data.get("more") or not rows:
+            return
+        offset += page_size
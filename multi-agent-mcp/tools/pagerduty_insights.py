@@ -4,6 +4,8 @@ import json
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+from tools import pagerduty_store
+from tools.pagerduty_http import PagerDutyAPIError, pagerduty_pages
 from tools.pagerduty_team import (
     fetch_incidents_touched_by_team,
     normalize_pagerduty_shift,
@@ -56,40 +58,20 @@ def get_pagerduty_insights(query="", shift: str = "", team_only: bool = False):
             label = pagerduty_shift_label(active_shift) if active_shift else "all shifts"
             print(f"✅ PagerDuty Insights ({label}): {total_count} incident(s) touched in last {days} days")
         else:
-            all_incidents = []
-            offset = 0
-            limit = 100
-            more = True
-
-            while more:
-                incidents_params = {
-                    "since": since,
-                    "until": until,
-                    "limit": limit,
-                    "offset": offset,
-                    "total": "true",
-                    "time_zone": "UTC"
-                }
-
-                incidents_response = requests.get(incidents_url, headers=headers, params=incidents_params, timeout=15)
-
-                if incidents_response.status_code != 200:
-                    return f"<p style='color: #f56565;'>⚠️ PagerDuty API Error {incidents_response.status_code}: {incidents_response.reason}</p>"
-
-                incidents_data = incidents_response.json()
-                batch_incidents = incidents_data.get("incidents", [])
-                all_incidents.extend(batch_incidents)
-
-                more = incidents_data.get("more", False)
-                offset += limit
-
-                if offset >= 10000:
-                    print(f"⚠️ PagerDuty Insights: Reached safety limit of 10000 incidents")
-                    break
-
-            incidents = all_incidents
+            incidents = pagerduty_store.incidents(api_token, start_time, until=end_time)
+            if incidents is not None:
+                print(f"✅ PagerDuty Insights: {len(incidents)} incident(s) from the local store")
+            else:
+                try:
+                    incidents = list(
+                        pagerduty_pages(
+                            headers, incidents_url, {"since": since, "until": until, "time_zone": "UTC"}, "incidents", timeout=15
+                        )
+                    )
+                except PagerDutyAPIError as e:
+                    return f"<p style='color: #f56565;'>⚠️ PagerDuty API Error {e.status_code}: {e.reason}</p>"
+                print(f"✅ PagerDuty Insights: Fetched {len(incidents)} total incidents")
             total_count = len(incidents)
-            print(f"✅ PagerDuty Insights: Fetched {total_count} total incidents")
         
         # Get services list for additional context
         services_url = "https://api.pagerduty.com/services"
@@ -0,0 +1,194 @@
+"""
+Inverted index from PagerDuty incident text to monitored service names.
+
+Correlation asks, per incident, "which service names (or distinctive hyphen parts of them) occur
+in this title?". Scanning every service for every incident is O(incidents x services x parts) on
+each wall build. ``ServiceIndex`` files each pattern under its rarest trigram instead: an incident
+only looks up the trigrams of its own text and verifies the few patterns filed there, so the cost
+follows the title length, not the number of services. Matches are the same substring matches the
+scan made. Hyphen-prefix and "name contains X" lookups (Savant / smart-notification inference,
+streaming escalation-policy rules) are dictionaries built once per service list.
+
+``service_index(services)`` memoizes the index per service list.
+"""
+from __future__ import annotations
+
+import threading
+from collections import Counter, OrderedDict
+
+# Hyphen segments shared by many monitored service names. If we match `part in title` for these,
+# a title like "backend-hmsgoogleapi ..." flags every `backend-*` service (false positives).
+PD_FUZZY_PART_BLOCKLIST = frozenset(
+    {
+        "backend",
+        "nginx",
+        "device",
+        "oauth",
+        "partner",
+        "proxy",
+        "logger",
+        "hmsweb",
+        "secret",
+        "mqtt",
+        "broker",
+        "privacy",
+        "registration",
+        "support",
+        "discovery",
+        "directory",
+        "presence",
+        "messaging",
+        "history",
+        "advisor",
+        "geolocation",
+        "mediamigrationscheduler",
+        "automation",  # backend-hmsautomation, scheduler, arloautomation-leader, etc.
+        "arlo",
+    }
+)
+
+# Escalation policy name (e.g. savant-ep) → substring that should appear in the APM service name
+PD_STREAMING_EP_SVC_RULES = (
+    ("savant", "savant"),
+    ("cvr", "cvr"),
+    ("adt", "adt"),
+    ("samsung", "samsung"),
+    ("cat", "cat"),
+    ("comcast", "comcast"),
+)
+
+# Parts shorter than this are too generic to flag a service on their own
+PD_FUZZY_PART_MIN_LEN = 5
+
+_GRAM = 3
+
+
+def fuzzy_parts(service_lower: str) -> list[str]:
+    """Hyphen parts of a lowercase service name distinctive enough to match a title by themselves."""
+    return [
+        p for p in service_lower.split("-") if len(p) >= PD_FUZZY_PART_MIN_LEN and p not in PD_FUZZY_PART_BLOCKLIST
+    ]
+
+
+class _SubstringIndex:
+    """Which of a fixed set of patterns occur in a text, via one trigram anchor per pattern."""
+
+    __slots__ = ("targets", "by_gram", "short")
+
+    def __init__(self, targets: dict[str, tuple[int, ...]]):
+        self.targets = targets
+        grams = {p: {p[i : i + _GRAM] for i in range(len(p) - _GRAM + 1)} for p in targets}
+        freq = Counter(g for gs in grams.values() for g in gs)
+        self.by_gram: dict[str, list[str]] = {}
+        self.short: list[str] = []
+        for p, gs in grams.items():
+            if not gs:
+                self.short.append(p)
+                continue
+            # Rarest trigram: texts that contain it are the only ones worth verifying
+            anchor = min(gs, key=lambda g: (freq[g], g))
+            self.by_gram.setdefault(anchor, []).append(p)
+
+    def find(self, text: str, into: set[int]) -> None:
+        """Add the positions of every pattern occurring in text to ``into``."""
+        targets = self.targets
+        for p in self.short:
+            if p in text:
+                into.update(targets[p])
+        by_gram = self.by_gram
+        seen: set[str] = set()
+        for i in range(len(text) - _GRAM + 1):
+            g = text[i : i + _GRAM]
+            if g in seen:
+                continue
+            seen.add(g)
+            for p in by_gram.get(g, ()):
+                if p in text:
+                    into.update(targets[p])
+
+
+class ServiceIndex:
+    """Lookups from incident text to services; results keep the order of the service list."""
+
+    def __init__(self, services):
+        self.services: tuple[str, ...] = tuple(services)
+        self.lower: tuple[str, ...] = tuple(s.lower() for s in self.services)
+        names: dict[str, list[int]] = {}
+        parts: dict[str, list[int]] = {}
+        self._by_name_or_prefix: dict[str, list[int]] = {}
+        for pos, sl in enumerate(self.lower):
+            if not sl:
+                continue
+            names.setdefault(sl, []).append(pos)
+            for part in set(fuzzy_parts(sl)):
+                parts.setdefault(part, []).append(pos)
+            # tok == name or name.startswith(tok + "-")
+            keys = {sl} | {sl[:i] for i, ch in enumerate(sl) if ch == "-" and i}
+            for k in keys:
+                self._by_name_or_prefix.setdefault(k, []).append(pos)
+        self._names = _SubstringIndex({k: tuple(v) for k, v in names.items()})
+        self._parts = _SubstringIndex({k: tuple(v) for k, v in parts.items()})
+        self._containing: dict[str, tuple[int, ...]] = {}
+        self._lock = threading.Lock()
+
+    def _names_of(self, positions) -> list[str]:
+        out: list[str] = []
+        seen: set[str] = set()
+        for pos in sorted(positions):
+            svc = self.services[pos]
+            if svc not in seen:
+                seen.add(svc)
+                out.append(svc)
+        return out
+
+    def name_matches(self, *texts: str) -> list[str]:
+        """Services whose lowercase name occurs in any of the (lowercase) texts."""
+        hits: set[int] = set()
+        for text in texts:
+            if text:
+                self._names.find(text, hits)
+        return self._names_of(hits)
+
+    def part_matches(self, text: str) -> list[str]:
+        """Services with a distinctive hyphen part (see fuzzy_parts) occurring in the lowercase text."""
+        hits: set[int] = set()
+        if text:
+            self._parts.find(text, hits)
+        return self._names_of(hits)
+
+    def named_or_prefixed(self, token: str) -> list[str]:
+        """Services named ``token`` or starting with ``token-`` (token lowercase)."""
+        return self._names_of(self._by_name_or_prefix.get(token, ()))
+
+    def containing(self, *subs: str) -> list[str]:
+        """Services whose lowercase name contains any of subs."""
+        hits: set[int] = set()
+        for sub in subs:
+            positions = self._containing.get(sub)
+            if positions is None:
+                positions = tuple(i for i, sl in enumerate(self.lower) if sub in sl)
+                with self._lock:
+                    self._containing[sub] = positions
+            hits.update(positions)
+        return self._names_of(hits)
+
+
+_INDEX_MEMO_MAX = 8
+_memo_lock = threading.Lock()
+_memo: OrderedDict = OrderedDict()
+
+
+def service_index(services) -> ServiceIndex:
+    """Index for a service list, reused while the same list keeps coming back (LRU of a few lists)."""
+    key = tuple(services)
+    with _memo_lock:
+        idx = _memo.get(key)
+        if idx is not None:
+            _memo.move_to_end(key)
+            return idx
+    idx = ServiceIndex(key)
+    with _memo_lock:
+        _memo[key] = idx
+        while len(_memo) > _INDEX_MEMO_MAX:
+            _memo.popitem(last=False)
+    return idx
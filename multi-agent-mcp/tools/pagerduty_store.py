@@ -0,0 +1,287 @@
+"""
+Local PagerDuty incident store (``pagerduty_incidents`` in metrics_history.db).
+
+The first read of a window backfills it from /incidents (one-day slices fetched in parallel, plus
+every open incident whatever its age). After that a sync only asks /log_entries for what happened
+since the last watermark (include[]=incidents): every incident created, acknowledged, resolved,
+reassigned or annotated since comes back with its current state, user log entries are kept for
+"touched by shift crew" queries, and custom-field changes drop that incident's cached custom
+fields (see enrich_incidents_custom_fields). Reads are then SQLite queries.
+
+A sync runs at most every PAGERDUTY_STORE_SYNC_SECS, in one worker at a time (DB lease); the
+others keep reading the store meanwhile. Readers return None when the store cannot answer (disabled,
+or never backfilled and PagerDuty unreachable) and callers paginate the API themselves as before.
+
+Env:
+  PAGERDUTY_INCIDENT_STORE=1    — 0 = every tool paginates PagerDuty on each call
+  PAGERDUTY_STORE_SYNC_SECS=60  — minimum watermark age before the next incremental sync
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from tools.metrics_persistence import (
+    pd_store_incidents,
+    pd_store_incidents_by_id,
+    pd_store_purge,
+    pd_store_state_get,
+    pd_store_state_set,
+    pd_store_touches,
+    pd_store_upsert_incidents,
+    pd_store_upsert_log_entries,
+    sm_lease_acquire,
+    sm_lease_release,
+)
+from tools.pagerduty_http import pagerduty_get, pagerduty_pages
+from tools.pagerduty_team import _PD_TEAM_TOUCH_LOG_TYPES, _pd_headers
+
+# /incidents and /log_entries are fetched in slices so no single slice reaches the offset cap
+_BACKFILL_SLICE_HOURS = 24
+_LOG_SLICE_HOURS = 6
+_SLICE_WORKERS = 4
+# Log entries can land slightly after their timestamp; re-read this much before the watermark
+_LOG_OVERLAP_SECS = 120
+# PAGERDUTY_INCIDENTS_LOOKBACK_DAYS tops out at 90; analytics and insights read 30 days
+_RETENTION_DAYS = 92
+_LEASE_SECS = 600
+
+_locks_guard = threading.Lock()
+_sync_locks: dict[str, threading.Lock] = {}
+
+
+def store_enabled() -> bool:
+    v = (os.getenv("PAGERDUTY_INCIDENT_STORE") or "1").strip().lower()
+    return v not in ("0", "false", "no", "off")
+
+
+def _sync_secs() -> int:
+    try:
+        return max(0, min(3600, int(os.getenv("PAGERDUTY_STORE_SYNC_SECS", "60"))))
+    except (TypeError, ValueError):
+        return 60
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _account(api_token: str) -> str:
+    """State keys are per token, so two PagerDuty accounts never share a watermark."""
+    return "pd:" + hashlib.blake2b(api_token.encode("utf-8"), digest_size=6).hexdigest() + ":"
+
+
+def _slices(start: datetime, end: datetime, hours: int) -> list[tuple[datetime, datetime]]:
+    out = []
+    cur = start
+    while cur < end:
+        nxt = min(end, cur + timedelta(hours=hours))
+        out.append((cur, nxt))
+        cur = nxt
+    return out
+
+
+def _paginate(headers: dict, path: str, params: dict, key: str) -> list[dict]:
+    """Every page of an offset-paginated list; raises on an API error so the sync is not recorded."""
+    hook = _attach_escalation_summaries if path == "/incidents" else None
+    return list(pagerduty_pages(headers, path, params, key, page_hook=hook))
+
+
+def _attach_escalation_summaries(incidents: list, data: dict) -> None:
+    labels = {
+        ep["id"]: (ep.get("summary") or ep.get("name") or "").strip()
+        for ep in data.get("escalation_policies") or []
+        if isinstance(ep, dict) and ep.get("id")
+    }
+    for inc in incidents:
+        ep = inc.get("escalation_policy") if isinstance(inc, dict) else None
+        if isinstance(ep, dict) and not (ep.get("summary") or "").strip() and labels.get(ep.get("id")):
+            ep["summary"] = labels[ep["id"]]
+
+
+def _fetch_sliced(headers: dict, path: str, params: dict, key: str, windows: list) -> list[dict]:
+    def _one(window):
+        lo, hi = window
+        return _paginate(headers, path, {**params, "since": _iso(lo), "until": _iso(hi)}, key)
+
+    if len(windows) <= 1:
+        return [row for w in windows for row in _one(w)]
+    with ThreadPoolExecutor(max_workers=_SLICE_WORKERS) as pool:
+        return [row for batch in pool.map(_one, windows) for row in batch]
+
+
+def _store_log_entries(headers: dict, entries: list[dict]) -> int:
+    """Upsert the incidents behind log entries (current state) and keep user touch entries."""
+    latest: dict[str, tuple[str, dict]] = {}
+    touches: list[tuple] = []
+    custom_changed: set[str] = set()
+    for entry in entries:
+        inc = entry.get("incident") or {}
+        iid = inc.get("id")
+        if not iid:
+            continue
+        at = entry.get("created_at") or ""
+        if iid not in latest or at > latest[iid][0]:
+            latest[iid] = (at, inc)
+        etype = entry.get("type") or ""
+        if etype == "custom_field_value_change_log_entry":
+            custom_changed.add(iid)
+        agent = entry.get("agent") or {}
+        if etype in _PD_TEAM_TOUCH_LOG_TYPES and agent.get("id") and entry.get("id"):
+            touches.append(
+                (entry["id"], iid, etype, agent["id"], agent.get("summary") or agent.get("name") or "", at)
+            )
+    incidents = [inc for _, inc in latest.values() if inc.get("status")]
+    # A bare reference (no status) means the API did not expand it: fetch those few directly
+    bare = [iid for iid, (_, inc) in latest.items() if not inc.get("status")]
+    if bare:
+        def _get(iid):
+            r = pagerduty_get(f"/incidents/{iid}", headers, timeout=(12, 30))
+            return (r.json().get("incident") or {}) if r.status_code == 200 else {}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            incidents.extend(i for i in pool.map(_get, bare) if i.get("id"))
+    pd_store_upsert_log_entries(touches)
+    return pd_store_upsert_incidents(incidents, clear_custom_fields=sorted(custom_changed))
+
+
+def _sync(api_token: str, acct: str, state: dict, since: datetime, need_incidents: bool, need_users: list) -> None:
+    """
+    One sync pass. API and store-write errors propagate (the store writers raise sqlite3.Error), so
+    a window whose changes were not written never gets past the watermark: the next sync re-reads it.
+    """
+    headers = _pd_headers(api_token)
+    started = datetime.utcnow()
+    updates: dict[str, str] = {}
+    t0 = time.time()
+
+    wm = state.get("watermark")
+    if wm:
+        lo = datetime.strptime(wm, "%Y-%m-%dT%H:%M:%SZ") - timedelta(seconds=_LOG_OVERLAP_SECS)
+        entries = _fetch_sliced(
+            headers, "/log_entries", {"include[]": ["incidents"]}, "log_entries",
+            _slices(lo, started, _LOG_SLICE_HOURS),
+        )
+        n = _store_log_entries(headers, entries)
+        print(f"🔄 PagerDuty store: {n} incident(s) changed since {wm} ({len(entries)} log entries, {time.time() - t0:.1f}s)")
+
+    if need_incidents:
+        covered = state.get("incidents_since")
+        hi = datetime.strptime(covered, "%Y-%m-%dT%H:%M:%SZ") if covered else started
+        statuses = {"statuses[]": ["triggered", "acknowledged", "resolved"]}
+        rows = _fetch_sliced(
+            headers, "/incidents", {**statuses, "include[]": ["escalation_policies"], "time_zone": "UTC"},
+            "incidents", _slices(since, hi, _BACKFILL_SLICE_HOURS),
+        )
+        if not covered:
+            # Open incidents older than the window still drive counts and correlation
+            rows += _paginate(
+                headers, "/incidents",
+                {"statuses[]": ["triggered", "acknowledged"], "date_range": "all",
+                 "include[]": ["escalation_policies"], "time_zone": "UTC"},
+                "incidents",
+            )
+        n = pd_store_upsert_incidents(rows)
+        updates["incidents_since"] = _iso(since)
+        print(f"📥 PagerDuty store: backfilled {n} incident(s) since {_iso(since)} ({time.time() - t0:.1f}s)")
+
+    if need_users:
+        entries = _fetch_sliced(
+            headers, "/log_entries", {"include[]": ["incidents"], "user_ids[]": need_users}, "log_entries",
+            _slices(since, started, _BACKFILL_SLICE_HOURS),
+        )
+        _store_log_entries(headers, entries)
+        for uid in need_users:
+            updates[f"touch_since:{uid}"] = _iso(since)
+        print(f"📥 PagerDuty store: backfilled {len(entries)} log entries for {len(need_users)} user(s)")
+
+    pd_store_purge(_iso(started - timedelta(days=_RETENTION_DAYS)))
+    updates["watermark"] = _iso(started)
+    pd_store_state_set(acct, updates)
+
+
+def _ensure(api_token: str, since: datetime, user_ids: list | tuple = (), max_age_secs: float | None = None) -> bool:
+    """Sync when the window is not backfilled or the watermark is old; True when the store can answer."""
+    acct = _account(api_token)
+    since_iso = _iso(since)
+    max_age = _sync_secs() if max_age_secs is None else max_age_secs
+
+    def _plan(state: dict):
+        need_incidents = (state.get("incidents_since") or "~") > since_iso
+        need_users = [u for u in user_ids if (state.get(f"touch_since:{u}") or "~") > since_iso]
+        try:
+            wm_age = (datetime.utcnow() - datetime.strptime(state["watermark"], "%Y-%m-%dT%H:%M:%SZ")).total_seconds()
+        except (KeyError, ValueError):
+            wm_age = float("inf")
+        return need_incidents, need_users, wm_age
+
+    need_incidents, need_users, wm_age = _plan(pd_store_state_get(acct))
+    if not need_incidents and not need_users and wm_age < max_age:
+        return True
+    with _locks_guard:
+        lock = _sync_locks.setdefault(acct, threading.Lock())
+    with lock:
+        state = pd_store_state_get(acct)
+        need_incidents, need_users, wm_age = _plan(state)
+        covered = not need_incidents and not need_users
+        if covered and wm_age < max_age:
+            return True
+        lease = f"{acct}sync"
+        owner = f"{os.getpid()}:{threading.get_ident()}"
+        if not sm_lease_acquire(lease, owner, _LEASE_SECS):
+            # Another worker is syncing: a backfilled store answers a little stale meanwhile
+            return covered
+        try:
+            _sync(api_token, acct, state, since, need_incidents, need_users)
+        except Exception as e:
+            print(f"⚠️ PagerDuty store sync failed ({e}); {'serving stored incidents' if covered else 'falling back to the API'}")
+            return covered
+        finally:
+            sm_lease_release(lease, owner)
+    return True
+
+
+def incidents(
+    api_token: str,
+    since: datetime,
+    until: datetime | None = None,
+    statuses: list[str] | None = None,
+    max_age_secs: float | None = None,
+) -> list[dict] | None:
+    """Incidents created in [since, until) (naive UTC datetimes), newest first; None = ask the API."""
+    if not api_token or not store_enabled():
+        return None
+    if not _ensure(api_token, since, max_age_secs=max_age_secs):
+        return None
+    return pd_store_incidents(_iso(since), _iso(until) if until else None, statuses)
+
+
+def touched_incidents(api_token: str, user_ids: list[str], since: datetime) -> list[dict] | None:
+    """
+    Incidents any of user_ids touched since ``since``, newest touch first, with ``_team_touched_by``
+    and ``_team_touched_at`` like fetch_incidents_touched_by_team; None = ask the API.
+    """
+    if not api_token or not user_ids or not store_enabled():
+        return None
+    if not _ensure(api_token, since, user_ids):
+        return None
+    by_id: dict[str, dict] = {}
+    for iid, agent_name, at in pd_store_touches(list(user_ids), _iso(since)):
+        row = by_id.setdefault(iid, {"users": set(), "last_at": at})
+        if agent_name:
+            row["users"].add(agent_name)
+    payloads = pd_store_incidents_by_id(list(by_id))
+    out: list[dict] = []
+    for iid, meta in by_id.items():
+        inc = payloads.get(iid)
+        if inc is None:
+            continue
+        inc["_team_touched_by"] = sorted(meta["users"])
+        inc["_team_touched_at"] = meta["last_at"]
+        out.append(inc)
+    return out
+
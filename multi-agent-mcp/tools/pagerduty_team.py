@@ -3,10 +3,11 @@ Per-shift NOC filter and shared PagerDuty incident helpers for query tools.
 """
 
 import os
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
-import requests
+from tools.pagerduty_http import PagerDutyAPIError, pagerduty_get, pagerduty_pages
 
 ROOT_CAUSE_FIELD_NAME = "root_cause"
 DEFAULT_INCIDENTS_LOOKBACK_DAYS = 15
@@ -136,59 +137,129 @@ def fetch_all_incidents(api_token: str, days: int | None = None) -> list[dict]:
         return []
     if days is None:
         days = pagerduty_incidents_lookback_days()
+    from tools import pagerduty_store
+
+    stored = pagerduty_store.incidents(api_token, datetime.utcnow() - timedelta(days=days))
+    if stored is not None:
+        return stored
     headers = _pd_headers(api_token)
     since = (datetime.utcnow() - timedelta(days=days)).isoformat()
     all_incidents: list[dict] = []
-    offset = 0
-    limit = 100
-    while offset < 10000:
-        response = requests.get(
-            "https://api.pagerduty.com/incidents",
-            headers=headers,
-            params={
+    try:
+        for inc in pagerduty_pages(
+            headers,
+            "/incidents",
+            {
                 "sort_by": "created_at:desc",
-                "limit": limit,
-                "offset": offset,
                 "statuses[]": ["triggered", "acknowledged", "resolved"],
                 "since": since,
             },
+            "incidents",
             timeout=(12, 45),
-        )
-        if response.status_code != 200:
-            break
-        data = response.json()
-        batch = data.get("incidents") or []
-        all_incidents.extend(batch)
-        if not data.get("more") or not batch:
-            break
-        offset += limit
+        ):
+            all_incidents.append(inc)
+    except PagerDutyAPIError:
+        pass
     return all_incidents
 
 
+def _custom_fields_cache_enabled() -> bool:
+    v = (os.getenv("PAGERDUTY_CUSTOM_FIELDS_CACHE") or "1").strip().lower()
+    return v not in ("0", "false", "no", "off")
+
+
+def _empty_root_cause_recheck_secs() -> int:
+    raw = (os.getenv("PAGERDUTY_EMPTY_ROOT_CAUSE_RECHECK_SECS") or "600").strip()
+    try:
+        return max(0, min(86400, int(raw)))
+    except ValueError:
+        return 600
+
+
+# Longest wait between re-checks of a resolved incident whose root cause is still empty
+_EMPTY_ROOT_CAUSE_RECHECK_MAX_SECS = 86400
+
+
+def _parse_pd_time(value: str) -> float | None:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return None
+
+
+def _cached_custom_fields_usable(incident: dict, cached: tuple, now: float, recheck_secs: int | None) -> bool:
+    """
+    Cached fields stand for a resolved incident that has not changed status since they were fetched.
+    An empty root cause (crews often fill it in after resolving) is re-checked with exponential
+    backoff: the wait is the incident's resolved age at the last fetch, at least recheck_secs and at
+    most a day, so each check roughly doubles the next wait. recheck_secs None = never re-check (the
+    incident store drops cached fields when a custom_field_value_change log entry arrives).
+    """
+    status, changed_at, fields, fetched_at = cached
+    if incident.get("status") != "resolved" or status != "resolved":
+        return False
+    if changed_at != (incident.get("last_status_change_at") or ""):
+        return False
+    if recheck_secs is None or incident_root_cause({"custom_fields": fields})[0]:
+        return True
+    resolved_at = _parse_pd_time(changed_at)
+    age_at_fetch = fetched_at - resolved_at if resolved_at is not None else 0.0
+    wait = min(max(float(recheck_secs), age_at_fetch), _EMPTY_ROOT_CAUSE_RECHECK_MAX_SECS)
+    return now - fetched_at < wait
+
+
 def enrich_incidents_custom_fields(api_token: str, incidents: list[dict]) -> list[dict]:
-    """Attach custom_fields to each incident (needed for root cause)."""
+    """
+    Attach custom_fields to each incident (needed for root cause). Resolved incidents come from the
+    on-disk cache keyed by (id, last_status_change_at); only open or changed ones are fetched.
+    """
     if not api_token or not incidents:
         return incidents
+    from tools.metrics_persistence import pd_custom_fields_get, pd_custom_fields_set
+
+    from tools import pagerduty_store
+
     headers = _pd_headers(api_token)
     by_id = {i.get("id"): dict(i) for i in incidents if i.get("id")}
+    use_cache = _custom_fields_cache_enabled()
+    cached = pd_custom_fields_get(list(by_id)) if use_cache else {}
+    now = time.time()
+    # The incident store invalidates on custom-field log entries; timed re-checks only without it
+    recheck = None if pagerduty_store.store_enabled() else _empty_root_cause_recheck_secs()
+    todo: list[str] = []
+    for iid, inc in by_id.items():
+        hit = cached.get(iid)
+        if hit is not None and _cached_custom_fields_usable(inc, hit, now, recheck):
+            inc["custom_fields"] = hit[2]
+        else:
+            todo.append(iid)
 
-    def _fetch_one(iid: str) -> tuple[str, list]:
-        r = requests.get(
-            f"https://api.pagerduty.com/incidents/{iid}",
-            headers=headers,
-            params={"include[]": ["custom_fields"]},
+    def _fetch_one(iid: str) -> tuple[str, dict | None]:
+        r = pagerduty_get(
+            f"/incidents/{iid}",
+            headers,
+            {"include[]": ["custom_fields"]},
             timeout=(12, 30),
         )
         if r.status_code != 200:
-            return iid, []
-        return iid, (r.json().get("incident") or {}).get("custom_fields") or []
+            return iid, None
+        return iid, r.json().get("incident") or {}
 
+    fetched: list[tuple] = []
     with ThreadPoolExecutor(max_workers=8) as pool:
-        futures = {pool.submit(_fetch_one, iid): iid for iid in by_id}
+        futures = {pool.submit(_fetch_one, iid): iid for iid in todo}
         for fut in as_completed(futures):
-            iid, fields = fut.result()
+            iid, detail = fut.result()
+            fields = (detail or {}).get("custom_fields") or []
+            if detail is not None:
+                fetched.append(
+                    (iid, detail.get("status"), detail.get("last_status_change_at") or "", fields)
+                )
             if iid in by_id:
                 by_id[iid]["custom_fields"] = fields
+    if use_cache:
+        pd_custom_fields_set(fetched)
+    print(f"🗂️ PagerDuty custom fields: {len(by_id) - len(todo)} from cache, {len(todo)} fetched")
     return [by_id[i.get("id")] if i.get("id") in by_id else i for i in incidents]
 
 
@@ -220,32 +291,33 @@ def fetch_incidents_touched_by_team(
     if days is None:
         days = pagerduty_incidents_lookback_days()
 
+    from tools import pagerduty_store
+
+    stored = pagerduty_store.touched_incidents(
+        api_token, team_user_ids, datetime.utcnow() - timedelta(days=days)
+    )
+    if stored is not None:
+        return stored
+
     team_id_set = set(team_user_ids)
 
     headers = _pd_headers(api_token)
     since = (datetime.utcnow() - timedelta(days=days)).isoformat()
     by_id: dict[str, dict] = {}
-    offset = 0
-    page_limit = 100
-    max_rows = 2000
-
-    while offset < max_rows:
-        response = requests.get(
-            "https://api.pagerduty.com/log_entries",
-            headers=headers,
-            params={
-                "since": since,
-                "limit": page_limit,
-                "offset": offset,
-                "user_ids[]": team_user_ids,
-                "include[]": ["incidents"],
-            },
-            timeout=(12, 60),
-        )
-        if response.status_code != 200:
-            break
-        data = response.json()
-        entries = data.get("log_entries") or []
+    entries = pagerduty_pages(
+        headers,
+        "/log_entries",
+        {
+            "since": since,
+            "user_ids[]": team_user_ids,
+            "include[]": ["incidents"],
+        },
+        "log_entries",
+        max_rows=2000,
+        timeout=(12, 60),
+    )
+    try:
+        # Filter as pages stream in; later pages are still downloading meanwhile
         for entry in entries:
             if entry.get("type") not in _PD_TEAM_TOUCH_LOG_TYPES:
                 continue
@@ -270,9 +342,8 @@ def fetch_incidents_touched_by_team(
                     row["users"].add(agent_name)
                 if created_at > (row.get("last_at") or ""):
                     row["last_at"] = created_at
-        if not data.get("more") or not entries:
-            break
-        offset += page_limit
+    except PagerDutyAPIError:
+        pass
 
     incidents: list[dict] = []
     for meta in sorted(by_id.values(), key=lambda r: r.get("last_at") or "", reverse=True):
@@ -2,6 +2,7 @@ import os
 import requests
 import html
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from tools.service_query import extract_service_name_from_query
 from tools.pagerduty_team import (
@@ -15,15 +16,7 @@ from tools.pagerduty_team import (
     pagerduty_shift_label,
     pagerduty_user_ids_for_filter,
 )
-
-_PD_FUZZY_PART_BLOCKLIST = frozenset(
-    {
-        "backend", "nginx", "device", "oauth", "partner", "proxy", "logger",
-        "hmsweb", "secret", "mqtt", "broker", "privacy", "registration",
-        "support", "discovery", "directory", "presence", "messaging", "history",
-        "advisor", "geolocation", "mediamigrationscheduler", "automation", "arlo",
-    }
-)
+from tools.pagerduty_service_index import PD_FUZZY_PART_BLOCKLIST, fuzzy_parts
 
 
 def _pd_incident_search_blob(incident: dict) -> str:
@@ -46,36 +39,34 @@ def _pd_incident_search_blob(incident: dict) -> str:
     return " ".join(chunks)
 
 
+@lru_cache(maxsize=64)
+def _service_match_terms(needle: str) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """(name variants, title parts, significant parts) for a lowercase service name, built once per filter."""
+    candidates = {needle}
+    if needle.startswith("backend-"):
+        candidates.add(needle[8:])
+    else:
+        candidates.add(f"backend-{needle}")
+    significant = tuple(p for p in needle.split("-") if len(p) >= 6 and p not in PD_FUZZY_PART_BLOCKLIST)
+    return tuple(t for t in candidates if t), tuple(fuzzy_parts(needle)), significant
+
+
 def _incident_matches_service(incident: dict, service_name: str) -> bool:
     needle = (service_name or "").strip().lower()
     if not needle:
         return True
+    candidates, title_parts, significant = _service_match_terms(needle)
 
     title = (incident.get("title") or "").lower()
     service_obj = incident.get("service") or {}
     svc = (service_obj.get("summary") or service_obj.get("name") or "").lower()
     blob = _pd_incident_search_blob(incident)
 
-    candidates = {needle}
-    if needle.startswith("backend-"):
-        candidates.add(needle[8:])
-    else:
-        candidates.add(f"backend-{needle}")
-
     for token in candidates:
-        if token and (token in title or token in svc or token in blob):
-            return True
-
-    for part in needle.split("-"):
-        pl = part.lower()
-        if len(pl) > 4 and pl not in _PD_FUZZY_PART_BLOCKLIST and pl in title:
+        if token in title or token in svc or token in blob:
             return True
-
-    significant = [
-        p.lower()
-        for p in needle.split("-")
-        if len(p) >= 6 and p.lower() not in _PD_FUZZY_PART_BLOCKLIST
-    ]
+    if any(part in title for part in title_parts):
+        return True
     for part in significant:
         if part in blob or part in title or part in svc:
             return True
@@ -3,16 +3,19 @@ Status Monitor Dashboard Tool
 Real-time service health monitoring across all environments using Datadog APM
 """
 
+import hashlib
 import os
+import random
 import re
 import time
 import json
 import html
 import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
 # Import metrics persistence
 from urllib.parse import quote, urlparse
@@ -23,13 +26,41 @@ from tools.metrics_persistence import (
     get_dashboard_history,
     get_service_eks_clusters,
     set_service_eks_clusters,
+    get_service_eks_clusters_env,
+    set_service_eks_clusters_many,
+    get_service_apm_family,
+    set_service_apm_family,
+    set_service_apm_families,
     sm_api_cache_get,
+    sm_api_cache_get_entry,
+    sm_api_cache_get_many,
+    sm_api_cache_get_stale,
+    sm_api_cache_purge,
     sm_api_cache_set,
+    sm_api_cache_set_many,
+    sm_lease_acquire,
+    sm_lease_release,
     clear_status_monitor_api_cache,
 )
 
 # Import Datadog dashboard utilities
 from tools.datadog_dashboards import datadog_rest_api_base, datadog_ui_origin, get_dashboard_details
+from tools.datadog_http import datadog_get, datadog_get_many, is_datadog_api_url
+from tools.status_monitor_cache import build_snapshot_cache, cache_hard_ttl, entry_is_fresh, entry_soft_ttl
+from tools.status_monitor_health import ServiceHealth
+from tools.status_monitor_timing import perf_phase, perf_record, submit_in_context
+from tools import pagerduty_store
+from tools.pagerduty_http import PagerDutyAPIError, pagerduty_pages
+from tools.pagerduty_service_index import PD_STREAMING_EP_SVC_RULES, ServiceIndex, service_index
+from tools import status_monitor_service_registry as service_registry
+from tools.status_monitor_stream import (
+    decode_cursor,
+    encode_cursor,
+    sse_comment,
+    sse_event,
+    sse_retry,
+    wall_delta,
+)
 from tools.status_monitor_service_lists import (
     ADT_MONITOR_SERVICES,
     GENERAL_MONITOR_SERVICES,
@@ -408,13 +439,58 @@ def _sm_hover_service_payload(svc: dict, env: str, page_environment: str | None
     }
 
 
-# Simple in-memory cache for status monitor data
-_status_cache = {}
-_hub_summary_cache = {}
-_wall_data_cache = {}
-_software_catalog_wall_cache = {}
-# When each in-memory cache entry was stored (for force_refresh grace window)
-_mem_cache_saved_at = {}
+# Rendered tile HTML keyed by a digest of everything the tile reads (row, env, page env, link
+# settings), so a refresh only re-renders tiles whose status, counts or hover payload changed
+_sm_tile_html_cache: OrderedDict = OrderedDict()
+_sm_tile_html_lock = threading.Lock()
+_sm_tile_html_stats = {"hits": 0, "misses": 0}
+# Env read while building tile links / hover payloads
+_SM_TILE_SETTING_ENVS = ("DD_SITE", "SPLUNK_HOST", "SPLUNK_UI_LOCALE", "STATUS_MONITOR_SPLUNK_SEARCH_HOURS")
+
+
+_sm_tile_settings_memo: list = [0.0, 0, ()]
+
+
+def _sm_tile_cache_settings() -> tuple[int, tuple]:
+    """(max entries, link settings) — env is re-read at most once a second, not once per tile."""
+    now = time.monotonic()
+    memo = _sm_tile_settings_memo
+    if now - memo[0] > 1.0:
+        memo[1] = _status_monitor_int_env("STATUS_MONITOR_TILE_CACHE_MAX", 8192, 0, 200000)
+        memo[2] = tuple(os.getenv(n) for n in _SM_TILE_SETTING_ENVS)
+        memo[0] = now
+    return memo[1], memo[2]
+
+
+def _sm_cached_tile_html(kind: str, inputs: tuple, render) -> str:
+    """``render()`` output for one tile, reused while ``inputs`` hash the same."""
+    max_n, settings = _sm_tile_cache_settings()
+    if max_n <= 0:
+        return render()
+    # repr of plain rows / ServiceHealth positional rows is deterministic and far cheaper than
+    # json.dumps(sort_keys=True); equal dicts in a different key order only cost a miss
+    parts = [x.to_row() if isinstance(x, ServiceHealth) else x for x in inputs]
+    blob = repr((kind, settings, parts)).encode("utf-8", "surrogatepass")
+    key = hashlib.blake2b(blob, digest_size=16).digest()
+    with _sm_tile_html_lock:
+        out = _sm_tile_html_cache.get(key)
+        if out is not None:
+            _sm_tile_html_cache.move_to_end(key)
+            _sm_tile_html_stats["hits"] += 1
+            return out
+        _sm_tile_html_stats["misses"] += 1
+    out = render()
+    with _sm_tile_html_lock:
+        _sm_tile_html_cache[key] = out
+        while len(_sm_tile_html_cache) > max_n:
+            _sm_tile_html_cache.popitem(last=False)
+    return out
+
+
+# Full-view snapshots (dashboard HTML, hub summary, status wall, APM wall) live in one pluggable
+# backend — per-worker byte-bounded LRU, shared SQLite, or Redis protocol (see _sm_snapshot_cache)
+_snapshot_cache = None
+_snapshot_cache_lock = threading.Lock()
 # Longer default TTL + env override reduces repeated full DD fan-out (CPU + rate limits)
 _cache_ttl = _status_monitor_int_env("STATUS_MONITOR_CACHE_SECS", 180, 60, 900)
 # SQLite-backed API cache (per-service DD health, PagerDuty, Arlo) — shared across hub/wall/dashboard
@@ -425,7 +501,8 @@ _FORCE_REFRESH_GRACE_SECS = _status_monitor_int_env("STATUS_MONITOR_FORCE_REFRES
 # Extra live Datadog attempts when status is unknown (transient errors)
 _UNKNOWN_RETRY_COUNT = _status_monitor_int_env("STATUS_MONITOR_UNKNOWN_RETRIES", 2, 0, 5)
 
-# Parallel Datadog health checks per dashboard/hub mode (each task ~2 HTTP calls)
+# Parallel Datadog health checks per dashboard/hub mode (each task ~2 HTTP calls). These pool sizes are
+# upper bounds: actual in-flight Datadog calls follow the shared adaptive limiter in tools.datadog_http.
 STATUS_MONITOR_DD_MAX_WORKERS = _status_monitor_int_env("STATUS_MONITOR_DD_MAX_WORKERS", 16, 2, 32)
 STATUS_MONITOR_DD_MIN_WORKERS = _status_monitor_int_env("STATUS_MONITOR_DD_MIN_WORKERS", 4, 1, 16)
 # Hub: parallel env batches (main + samsung + adt + red-us…). Higher = faster if DD rate limits allow.
@@ -599,7 +676,8 @@ def _wall_apm_monitors_for_dd_env(
         pd_badge = _wall_pd_badge(pd_counts)
     elif pd_api_key:
         try:
-            counts, _ = get_pagerduty_status_counts(pd_api_key, force_refresh)
+            with perf_phase("pagerduty"):
+                counts, _ = get_pagerduty_status_counts(pd_api_key, force_refresh)
             pd_badge = _wall_pd_badge(counts)
         except Exception as e:
             pd_badge = {
@@ -652,6 +730,12 @@ def _dd_requests_timeout() -> tuple[int, int]:
 _DD_MONITOR_SEARCH_CACHE = {}
 _DD_MONITOR_SEARCH_LOCK = threading.Lock()
 _DD_MONITOR_SEARCH_TTL = _status_monitor_int_env("STATUS_MONITOR_DD_MONITOR_CACHE_SECS", 120, 30, 600)
+# Per-environment monitor index: (environment, dd_site) -> (built_at, {service_lower: [[state, name, id], ...]} | None, compute_secs)
+_DD_MONITOR_INDEX_CACHE: dict = {}
+_DD_MONITOR_INDEX_BUILD_LOCKS: dict = {}
+_DD_MONITOR_INDEX_KIND = "dd_monitor_index"
+# A failed bulk fetch falls back to per-service search for this long before retrying
+_DD_MONITOR_INDEX_FAIL_SECS = 30
 
 # Cache for dashboard services (so we don't fetch dashboard details every time)
 _dashboard_services_cache = {}
@@ -676,11 +760,13 @@ def _https_get_with_retries(
     import requests
     from requests.exceptions import ChunkedEncodingError, ConnectionError, SSLError, Timeout
 
+    # Datadog goes through the shared keep-alive pool; other hosts keep a plain GET
+    get = datadog_get if is_datadog_api_url(url) else requests.get
     headers = headers or {}
     last_exc = None
     for attempt in range(max_attempts):
         try:
-            return requests.get(url, headers=headers, params=params, timeout=timeout)
+            return get(url, headers=headers, params=params, timeout=timeout)
         except (SSLError, ConnectionError, Timeout, ChunkedEncodingError) as e:
             last_exc = e
             if attempt < max_attempts - 1:
@@ -697,16 +783,16 @@ def _https_get_with_retries(
 
 def clear_status_cache():
     """Clear the status monitor cache - useful after config changes"""
-    global _status_cache, _hub_summary_cache, _wall_data_cache, _software_catalog_wall_cache, _mem_cache_saved_at, _DD_MONITOR_SEARCH_CACHE
-    _status_cache.clear()
-    _hub_summary_cache.clear()
-    _wall_data_cache.clear()
-    _software_catalog_wall_cache.clear()
-    _mem_cache_saved_at.clear()
+    global _DD_MONITOR_SEARCH_CACHE
+    _sm_snapshot_cache().clear()
+    with _swr_lock:
+        _swr_views.clear()
     with _DD_MONITOR_SEARCH_LOCK:
         _DD_MONITOR_SEARCH_CACHE.clear()
+        _DD_MONITOR_INDEX_CACHE.clear()
     clear_status_monitor_api_cache()
-    print("🧹 Status monitor cache cleared (memory + DB API cache)")
+    service_registry.clear()
+    print("🧹 Status monitor cache cleared (snapshots + DB API cache + service lists)")
 
 
 def _effective_db_cache_ttl_secs(force_refresh: bool) -> float:
@@ -716,23 +802,404 @@ def _effective_db_cache_ttl_secs(force_refresh: bool) -> float:
     return float(_db_api_cache_ttl)
 
 
-def _read_sm_mem_cache(cache_dict: dict, cache_key: str, force_refresh: bool):
+# Stale-while-revalidate for full views (wall, hub, catalog wall, dashboard): requests get the last
+# good snapshot immediately (with its age); a background scheduler recomputes every key polled in the
+# last STATUS_MONITOR_SWR_IDLE_SECS before it expires, so no request thread waits on a rollover.
+_SWR_REFRESH_AHEAD_PCT = _status_monitor_int_env("STATUS_MONITOR_SWR_REFRESH_AHEAD_PCT", 80, 10, 100)
+_SWR_IDLE_SECS = _status_monitor_int_env("STATUS_MONITOR_SWR_IDLE_SECS", 900, 60, 86400)
+# Older snapshots are not served stale: the request recomputes synchronously
+_SWR_MAX_STALE_SECS = _status_monitor_int_env("STATUS_MONITOR_SWR_MAX_STALE_SECS", 1800, 60, 86400)
+_SWR_TICK_SECS = _status_monitor_int_env("STATUS_MONITOR_SWR_TICK_SECS", 10, 2, 300)
+_SWR_WORKERS = _status_monitor_int_env("STATUS_MONITOR_SWR_WORKERS", 2, 1, 8)
+_swr_lock = threading.Lock()
+# cache_key -> {"ttl", "compute", "cacheable", "last_access"}
+_swr_views: dict = {}
+# cache_key -> threading.Event set when the in-process computation finishes
+_swr_inflight: dict = {}
+# cache_key -> seconds the last compute took (scales probabilistic early refresh)
+_swr_compute_secs: dict = {}
+_swr_scheduler_pid = None
+_swr_executor = None
+
+# Cross-worker single-flight: the gunicorn worker holding the SQLite lease (metrics_history.db)
+# computes a view and publishes it; other workers adopt the published snapshot or keep serving
+# their previous one instead of repeating the same Datadog fan-out. With a shared snapshot backend
+# the backend itself is the publish channel; with the per-worker LRU it is status_monitor_api_cache.
+_SF_SNAPSHOT_KIND = "sm_view_snapshot"
+_SF_LEASE_SECS = _status_monitor_int_env("STATUS_MONITOR_SINGLE_FLIGHT_LEASE_SECS", 900, 30, 3600)
+_SF_POLL_SECS = 0.5
+
+
+def _sm_snapshot_cache():
+    """Full-view snapshot backend (tools.status_monitor_cache), built once from env."""
+    global _snapshot_cache
+    if _snapshot_cache is None:
+        with _snapshot_cache_lock:
+            if _snapshot_cache is None:
+                ttl = max(_SWR_MAX_STALE_SECS, _cache_ttl, _apm_status_wall_cache_bucket_secs())
+                _snapshot_cache = build_snapshot_cache(ttl_secs=ttl)
+                print(f"🗄️ Status monitor snapshot cache: {_snapshot_cache.name} (ttl={ttl}s)")
+    return _snapshot_cache
+
+
+def status_monitor_cache_stats() -> dict:
+    """Hit/miss/eviction counters and size of the full-view snapshot cache (this worker's view)."""
+    return _sm_snapshot_cache().stats()
+
+
+def _sm_swr_enabled() -> bool:
+    v = (os.getenv("STATUS_MONITOR_SWR") or "1").strip().lower()
+    return v not in ("0", "false", "no", "off")
+
+
+def _sm_single_flight_enabled() -> bool:
+    v = (os.getenv("STATUS_MONITOR_SINGLE_FLIGHT") or "1").strip().lower()
+    return v not in ("0", "false", "no", "off")
+
+
+def _sm_published_snapshot(cache_key: str, newer_than: float):
+    """(value, saved_at) another worker published after newer_than, else None."""
+    cache = _sm_snapshot_cache()
+    if cache.shared:
+        saved = cache.peek_saved_at(cache_key)
+        if saved is None or saved <= newer_than:
+            return None
+        return cache.get(cache_key)
+    entry = sm_api_cache_get_entry(_SF_SNAPSHOT_KIND, cache_key, newer_than=newer_than)
+    if entry is None:
+        return None
+    cache.set(cache_key, entry[0], saved_at=entry[1])
+    return entry
+
+
+def _sm_adopt_shared_snapshot(cache_key: str):
+    """Per-worker backend only: pull a snapshot another worker published if newer than ours."""
+    cache = _sm_snapshot_cache()
+    if cache.shared or not _sm_single_flight_enabled():
+        return None
+    return _sm_published_snapshot(cache_key, cache.peek_saved_at(cache_key) or 0.0)
+
+
+def _sm_sf_compute(cache_key: str, compute, cacheable, force_refresh: bool, ttl: float, background: bool):
     """
-    In-memory HTML/JSON cache. If force_refresh, only return hit if saved within grace window.
+    Compute under the cross-worker lease and publish; returns (value, saved_at). When another worker
+    holds the lease: background callers get None, request callers serve their previous snapshot
+    (unless Refresh) or wait for the published one. An owner that dies simply lets the lease expire.
     """
-    if cache_key not in cache_dict:
-        return None
-    if not force_refresh:
-        return cache_dict[cache_key]
-    ts = _mem_cache_saved_at.get(cache_key)
-    if ts is not None and time.time() - ts < _FORCE_REFRESH_GRACE_SECS:
-        return cache_dict[cache_key]
-    return None
+    cache = _sm_snapshot_cache()
+
+    def _run():
+        t0 = time.time()
+        out = compute(force_refresh)
+        saved = time.time()
+        with _swr_lock:
+            _swr_compute_secs[cache_key] = saved - t0
+        if cacheable is None or cacheable(out):
+            cache.set(cache_key, out, saved_at=saved)
+            if _sm_single_flight_enabled() and not cache.shared:
+                sm_api_cache_set(_SF_SNAPSHOT_KIND, cache_key, out)
+        return out, saved
+
+    if not _sm_single_flight_enabled():
+        return _run()
+    lease_key = f"view:{cache_key}"
+    owner = f"{os.getpid()}:{threading.get_ident()}"
+    t_wait = time.time()
+    waited = False
+    while True:
+        if sm_lease_acquire(lease_key, owner, _SF_LEASE_SECS):
+            try:
+                return _run()
+            finally:
+                sm_lease_release(lease_key, owner)
+        if background:
+            return None
+        if not force_refresh:
+            prev = cache.get(cache_key)
+            if prev is not None:
+                return prev
+        if not waited:
+            print(f"⏳ {cache_key}: another worker is computing — waiting for its snapshot")
+            waited = True
+        time.sleep(_SF_POLL_SECS)
+        entry = _sm_published_snapshot(cache_key, t_wait - (0.0 if force_refresh else float(ttl)))
+        if entry is not None:
+            return entry
+
+
+def _sm_swr_meta(cache_key: str, saved: float | None, stale: bool) -> dict:
+    now = time.time()
+    with _swr_lock:
+        refreshing = cache_key in _swr_inflight
+    return {
+        "age_secs": round(now - saved, 1) if saved is not None else 0.0,
+        "generated_at": datetime.utcfromtimestamp(saved if saved is not None else now).isoformat() + "Z",
+        # Cursor for /api/statusmonitor/wall/stream (Last-Event-ID)
+        "version": round(saved if saved is not None else now, 3),
+        "stale": bool(stale),
+        "refreshing": refreshing,
+    }
 
 
-def _write_sm_mem_cache(cache_dict: dict, cache_key: str, value) -> None:
-    cache_dict[cache_key] = value
-    _mem_cache_saved_at[cache_key] = time.time()
+def _sm_swr_refresh(cache_key: str, compute, cacheable, force_refresh: bool, ttl: float, background: bool = False):
+    """
+    Single-flight recompute: per process via an Event, across workers via _sm_sf_compute.
+    Returns (value, saved_at); concurrent callers wait for the owner's snapshot.
+    Background callers get None when skipped.
+    """
+    with _swr_lock:
+        ev = _swr_inflight.get(cache_key)
+        owner = ev is None
+        if owner:
+            ev = threading.Event()
+            _swr_inflight[cache_key] = ev
+    if not owner:
+        ev.wait()
+        hit = _sm_snapshot_cache().get(cache_key)
+        if hit is not None or background:
+            return hit
+        # Owner's result was not cacheable (error payload) — compute our own
+        return _sm_sf_compute(cache_key, compute, cacheable, force_refresh, ttl, False)
+    try:
+        return _sm_sf_compute(cache_key, compute, cacheable, force_refresh, ttl, background)
+    finally:
+        with _swr_lock:
+            _swr_inflight.pop(cache_key, None)
+        ev.set()
+
+
+def _sm_swr_background_refresh(cache_key: str, view: dict) -> None:
+    t0 = time.time()
+    try:
+        # Another worker may already have published a fresh one
+        adopted = _sm_adopt_shared_snapshot(cache_key)
+        if adopted is not None and time.time() - adopted[1] < _sm_swr_refresh_after(cache_key, adopted[1], view["ttl"]):
+            return
+        res = _sm_swr_refresh(cache_key, view["compute"], view["cacheable"], False, view["ttl"], background=True)
+        if res is None:
+            return
+        print(f"🔁 SWR refreshed {cache_key} in {time.time() - t0:.1f}s")
+    except Exception as e:
+        print(f"⚠️ SWR background refresh failed for {cache_key}: {e}")
+
+
+def _sm_swr_submit(cache_key: str) -> None:
+    with _swr_lock:
+        view = _swr_views.get(cache_key)
+        ex = _swr_executor
+        if view is None or ex is None or cache_key in _swr_inflight:
+            return
+    ex.submit(_sm_swr_background_refresh, cache_key, view)
+
+
+def _sm_swr_refresh_after(cache_key: str, saved: float, ttl: float) -> float:
+    """Age at which the scheduler refreshes a snapshot: the jittered soft TTL × refresh-ahead %."""
+    return entry_soft_ttl(cache_key, saved, ttl) * _SWR_REFRESH_AHEAD_PCT / 100.0
+
+
+def _sm_swr_tick() -> None:
+    """Queue refreshes for recently polled keys whose snapshot is missing or near expiry."""
+    now = time.time()
+    candidates = []
+    with _swr_lock:
+        for key, view in list(_swr_views.items()):
+            if now - view["last_access"] > _SWR_IDLE_SECS:
+                del _swr_views[key]
+                continue
+            if key not in _swr_inflight:
+                candidates.append((key, view["ttl"]))
+    cache = _sm_snapshot_cache()
+    for key, ttl in candidates:
+        saved = cache.peek_saved_at(key)
+        if saved is None or now - saved >= _sm_swr_refresh_after(key, saved, ttl):
+            _sm_swr_submit(key)
+
+
+def _sm_swr_scheduler_loop() -> None:
+    while True:
+        time.sleep(_SWR_TICK_SECS)
+        try:
+            _sm_swr_tick()
+        except Exception as e:
+            print(f"⚠️ SWR scheduler tick failed: {e}")
+
+
+def _sm_swr_ensure_scheduler() -> None:
+    """Start the refresher lazily, once per process (gunicorn forks after import)."""
+    global _swr_scheduler_pid, _swr_executor
+    pid = os.getpid()
+    with _swr_lock:
+        if _swr_scheduler_pid == pid:
+            return
+        _swr_scheduler_pid = pid
+        _swr_executor = ThreadPoolExecutor(max_workers=_SWR_WORKERS, thread_name_prefix="sm-swr")
+        # Events inherited across fork belong to threads that no longer exist
+        _swr_inflight.clear()
+    threading.Thread(target=_sm_swr_scheduler_loop, name="sm-swr-scheduler", daemon=True).start()
+    print(f"🔁 Status monitor SWR refresher started (pid={pid}, workers={_SWR_WORKERS}, tick={_SWR_TICK_SECS}s)")
+
+
+def _sm_swr_serve(cache_key: str, ttl: float, compute, force_refresh: bool, cacheable=None):
+    """
+    Serve a full view from its last good snapshot. Returns (value, meta).
+
+    compute(force_refresh) builds a fresh value; cacheable(value) gates storing it (default: always).
+    Fresh snapshots (entry_is_fresh: jittered soft ttl, probabilistic early expiry) are returned as-is;
+    others are returned immediately while a background refresh runs. No snapshot, one older than
+    STATUS_MONITOR_SWR_MAX_STALE_SECS, or a Refresh click outside the grace window recomputes on the
+    request thread.
+    """
+    swr = _sm_swr_enabled()
+    if swr:
+        with _swr_lock:
+            _swr_views[cache_key] = {
+                "ttl": float(ttl),
+                "compute": compute,
+                "cacheable": cacheable,
+                "last_access": time.time(),
+            }
+        _sm_swr_ensure_scheduler()
+    hit = _sm_snapshot_cache().get(cache_key)
+    limit = float(_FORCE_REFRESH_GRACE_SECS) if force_refresh else float(ttl)
+    if hit is None or time.time() - hit[1] >= limit:
+        hit = _sm_adopt_shared_snapshot(cache_key) or hit
+    if hit is not None:
+        snap, saved = hit
+        now = time.time()
+        age = now - saved
+        with _swr_lock:
+            compute_secs = _swr_compute_secs.get(cache_key, 0.0)
+        if force_refresh:
+            if age < _FORCE_REFRESH_GRACE_SECS:
+                return snap, _sm_swr_meta(cache_key, saved, stale=False)
+        elif entry_is_fresh(cache_key, saved, ttl, compute_secs, now=now):
+            return snap, _sm_swr_meta(cache_key, saved, stale=False)
+        elif swr and age < max(float(_SWR_MAX_STALE_SECS), float(ttl)):
+            # Soft-expired (or picked for early refresh): serve it, recompute off-thread
+            _sm_swr_submit(cache_key)
+            return snap, _sm_swr_meta(cache_key, saved, stale=age >= ttl)
+    out, saved = _sm_swr_refresh(cache_key, compute, cacheable, force_refresh, ttl)
+    return out, _sm_swr_meta(cache_key, saved, stale=False)
+
+
+# Live wall streams (/api/statusmonitor/wall/stream): recent snapshots per view are kept so a
+# reconnecting client (Last-Event-ID) gets a delta instead of the full payload.
+_WALL_STREAM_POLL_SECS = _status_monitor_int_env("STATUS_MONITOR_WALL_STREAM_POLL_SECS", 2, 1, 60)
+_WALL_STREAM_HISTORY = _status_monitor_int_env("STATUS_MONITOR_WALL_STREAM_HISTORY", 4, 1, 32)
+# Held-open streams per worker; beyond this clients get catch-up-and-close (reconnect on retry)
+_WALL_STREAM_MAX_CLIENTS = _status_monitor_int_env("STATUS_MONITOR_WALL_STREAM_MAX_CLIENTS", 16, 0, 512)
+_WALL_STREAM_KEEPALIVE_SECS = 15
+_WALL_STREAM_MAX_VIEWS = 32
+_wall_stream_lock = threading.Lock()
+# cache_key -> OrderedDict(version -> payload)
+_wall_stream_history: OrderedDict = OrderedDict()
+_wall_stream_clients = 0
+
+
+def _sm_wall_stream_remember(cache_key: str, version: float, payload: dict) -> None:
+    with _wall_stream_lock:
+        hist = _wall_stream_history.get(cache_key)
+        if hist is None:
+            hist = OrderedDict()
+            _wall_stream_history[cache_key] = hist
+        _wall_stream_history.move_to_end(cache_key)
+        hist[version] = payload
+        hist.move_to_end(version)
+        while len(hist) > _WALL_STREAM_HISTORY:
+            hist.popitem(last=False)
+        while len(_wall_stream_history) > _WALL_STREAM_MAX_VIEWS:
+            _wall_stream_history.popitem(last=False)
+
+
+def _sm_wall_stream_recall(cache_key: str, version: float):
+    with _wall_stream_lock:
+        hist = _wall_stream_history.get(cache_key)
+        return hist.get(version) if hist else None
+
+
+def status_monitor_wall_stream(
+    view: str,
+    timerange: int,
+    channels: list,
+    cursor: str | None = None,
+    hold_secs: float = 0.0,
+    retry_ms: int = 30000,
+):
+    """
+    Server-Sent Events for /statuswall (view="wall", channels ["wall"]) and /apm-services
+    (view="apm", one channel per dd_env). For each channel the client is behind on (per the
+    Last-Event-ID cursor) emits a "delta" against the snapshot it has, or a full "snapshot" if this
+    worker no longer remembers it. While hold_secs lasts, emits a delta whenever the background
+    refresher publishes a newer snapshot; then ends and the browser reconnects after retry_ms.
+    """
+    global _wall_stream_clients
+    specs = {ch: _sm_wall_view_spec(view, timerange, ch) for ch in channels}
+    have: dict = {}
+    for ch, v in decode_cursor(cursor).items():
+        if ch in specs:
+            have[ch] = (v, _sm_wall_stream_recall(specs[ch][0], v))
+
+    def _sync(ch: str, out: dict, meta: dict):
+        version = float(meta["version"])
+        _sm_wall_stream_remember(specs[ch][0], version, out)
+        prev_v, prev = have.get(ch, (None, None))
+        have[ch] = (version, out)
+        if prev_v == version:
+            return None
+        if prev is None:
+            return sse_event(
+                "snapshot",
+                {"channel": ch, "data": {**out, "snapshot": meta}},
+                encode_cursor({c: hv[0] for c, hv in have.items()}),
+            )
+        ops = wall_delta(prev, out)
+        if not ops:
+            return None
+        return sse_event(
+            "delta",
+            {"channel": ch, "base": prev_v, "ops": ops, "snapshot": meta},
+            encode_cursor({c: hv[0] for c, hv in have.items()}),
+        )
+
+    yield sse_retry(retry_ms)
+    for ch, (key, ttl, compute, cacheable) in specs.items():
+        out, meta = _sm_swr_serve(key, ttl, compute, False, cacheable=cacheable)
+        ev = _sync(ch, out, meta)
+        if ev:
+            yield ev
+
+    if hold_secs <= 0:
+        return
+    with _wall_stream_lock:
+        if _wall_stream_clients >= _WALL_STREAM_MAX_CLIENTS:
+            return
+        _wall_stream_clients += 1
+    try:
+        cache = _sm_snapshot_cache()
+        deadline = time.time() + float(hold_secs)
+        last_sent = time.time()
+        while time.time() < deadline:
+            time.sleep(_WALL_STREAM_POLL_SECS)
+            now = time.time()
+            for ch, (key, ttl, compute, cacheable) in specs.items():
+                with _swr_lock:
+                    swr_view = _swr_views.get(key)
+                    if swr_view is not None:
+                        swr_view["last_access"] = now
+                saved = cache.peek_saved_at(key)
+                if swr_view is not None and saved is not None and round(saved, 3) == have[ch][0]:
+                    continue
+                out, meta = _sm_swr_serve(key, ttl, compute, False, cacheable=cacheable)
+                ev = _sync(ch, out, meta)
+                if ev:
+                    yield ev
+                    last_sent = time.time()
+            if time.time() - last_sent >= _WALL_STREAM_KEEPALIVE_SECS:
+                yield sse_comment()
+                last_sent = time.time()
+    finally:
+        with _wall_stream_lock:
+            _wall_stream_clients -= 1
 
 
 def get_services_from_dashboard(dashboard_id: str, cache_key: str = None) -> list:
@@ -752,7 +1219,7 @@ def get_services_from_dashboard(dashboard_id: str, cache_key: str = None) -> lis
     # Check cache first
     if cache_key in _dashboard_services_cache:
         cached_data = _dashboard_services_cache[cache_key]
-        if time.time() - cached_data['timestamp'] < _dashboard_services_cache_ttl:
+        if entry_is_fresh(f"dash_services:{cache_key}", cached_data['timestamp'], _dashboard_services_cache_ttl):
             print(f"📦 Using cached services for dashboard {dashboard_id}: {len(cached_data['services'])} services")
             return cached_data['services']
     
@@ -1097,9 +1564,156 @@ def _sm_is_expected_err_rate_ok(service_name: str) -> bool:
     return k in _sm_expected_err_rate_ok_services()
 
 
+def _sm_dd_monitor_index_enabled() -> bool:
+    v = (os.getenv("STATUS_MONITOR_DD_MONITOR_INDEX") or "1").strip().lower()
+    return v not in ("0", "false", "no", "off")
+
+
+def _dd_monitor_summary(entries) -> dict:
+    """
+    allow_error_override / alert_names / alert_names_suffix_ab from [state, name, id] monitor entries.
+    Alert monitors named with a -a/-b suffix count as OK for the override and are listed separately.
+    """
+    bad_states = frozenset({"Alert", "Warn"})
+    ok_states = frozenset({"OK", "No Data", "Skipped", "Ignored", "Unknown"})
+    collected = []
+    alert_keyed: dict[str, str] = {}
+    alert_keyed_suffix: dict[str, str] = {}
+    for st, raw_name, mid in entries:
+        st = (st or "").strip() if isinstance(st, str) else ""
+        raw_name = (raw_name or "").strip()
+        skip_ab = _sm_dd_monitor_name_suffix_ab(raw_name)
+        if st:
+            collected.append("OK" if st == "Alert" and skip_ab else st)
+        if st == "Alert":
+            key = f"id:{mid}" if mid is not None else f"n:{raw_name}"
+            disp = raw_name or (f"monitor {mid}" if mid is not None else "monitor")
+            target = alert_keyed_suffix if skip_ab else alert_keyed
+            if key not in target:
+                target[key] = disp
+    if not collected:
+        return {"allow_error_override": None, "alert_names": [], "alert_names_suffix_ab": []}
+    if any(s in bad_states for s in collected):
+        allow = False
+    elif all(s in ok_states for s in collected):
+        allow = True
+    else:
+        allow = False
+    return {
+        "allow_error_override": allow,
+        "alert_names": sorted(alert_keyed.values(), key=str.lower),
+        "alert_names_suffix_ab": sorted(alert_keyed_suffix.values(), key=str.lower),
+    }
+
+
+def _dd_monitor_entry(m: dict) -> list:
+    st = m.get("overall_state")
+    if st is None and isinstance(m.get("status"), str):
+        st = m["status"]
+    return [st, m.get("name"), m.get("id")]
+
+
+def _dd_fetch_monitor_index(environment, dd_api_key, dd_app_key, dd_site) -> dict | None:
+    """
+    All monitors with env:<environment> in a few 1000-per-page monitor/search calls, keyed by every
+    service:<name> in their tags or scope (the facets the per-service search matches). None on failure.
+    """
+    url = f"{datadog_rest_api_base(dd_site)}/api/v1/monitor/search"
+    headers = {"DD-API-KEY": dd_api_key, "DD-APPLICATION-KEY": dd_app_key}
+    per_page = 1000
+    index: dict[str, list] = {}
+    n_monitors = 0
+    page = 0
+    try:
+        while page < 50:
+            r = datadog_get(
+                url,
+                headers=headers,
+                params={"query": f"env:{environment}", "page": page, "per_page": per_page},
+                timeout=_dd_query_timeout_secs(),
+            )
+            if r.status_code != 200:
+                print(f"⚠️ Datadog monitor index ({environment}) HTTP {r.status_code}: {(r.text or '')[:200]}")
+                return None
+            data = r.json() if r.content else {}
+            monitors = data.get("monitors") or []
+            for m in monitors:
+                services = set()
+                for t in list(m.get("tags") or []) + list(m.get("scopes") or []):
+                    if isinstance(t, str) and t.startswith("service:"):
+                        svc = t[len("service:"):].strip().strip('"').lower()
+                        if svc:
+                            services.add(svc)
+                if not services:
+                    continue
+                n_monitors += 1
+                entry = _dd_monitor_entry(m)
+                for svc in services:
+                    index.setdefault(svc, []).append(entry)
+            page_count = (data.get("metadata") or {}).get("page_count")
+            if not monitors:
+                break
+            if page_count is not None:
+                if page + 1 >= int(page_count):
+                    break
+            elif len(monitors) < per_page:
+                break
+            page += 1
+    except Exception as e:
+        print(f"⚠️ Datadog monitor index ({environment}): {e}")
+        return None
+    print(f"🗂️ Datadog monitor index env={environment}: {n_monitors} monitors, {len(index)} services ({page + 1} page(s))")
+    return index
+
+
+def _dd_monitor_index(environment, dd_api_key, dd_app_key, dd_site) -> dict | None:
+    """
+    Per-environment monitor index shared by every tile: in-process, then status_monitor_api_cache
+    (other workers), then one bulk fetch — built once per env even when many tiles ask at once.
+    """
+    key = (environment, dd_site)
+    db_key = f"{dd_site}|{environment}"
+
+    def _mem_hit():
+        hit = _DD_MONITOR_INDEX_CACHE.get(key)
+        if not hit:
+            return None
+        built_at, idx, compute_secs = hit
+        if idx is None:
+            return hit if time.time() - built_at < _DD_MONITOR_INDEX_FAIL_SECS else None
+        return hit if entry_is_fresh(f"monidx:{db_key}", built_at, _DD_MONITOR_SEARCH_TTL, compute_secs) else None
+
+    with _DD_MONITOR_SEARCH_LOCK:
+        hit = _mem_hit()
+        if hit:
+            return hit[1]
+        build_lock = _DD_MONITOR_INDEX_BUILD_LOCKS.setdefault(key, threading.Lock())
+    with build_lock:
+        with _DD_MONITOR_SEARCH_LOCK:
+            hit = _mem_hit()
+        if hit:
+            return hit[1]
+        entry = sm_api_cache_get_entry(_DD_MONITOR_INDEX_KIND, db_key, newer_than=time.time() - _DD_MONITOR_SEARCH_TTL)
+        if entry is not None:
+            with _DD_MONITOR_SEARCH_LOCK:
+                _DD_MONITOR_INDEX_CACHE[key] = (entry[1], entry[0], 0.0)
+            return entry[0]
+        t0 = time.time()
+        with perf_phase("dd_monitors", environment):
+            idx = _dd_fetch_monitor_index(environment, dd_api_key, dd_app_key, dd_site)
+        compute_secs = time.time() - t0
+        with _DD_MONITOR_SEARCH_LOCK:
+            _DD_MONITOR_INDEX_CACHE[key] = (time.time(), idx, compute_secs)
+        if idx is not None:
+            sm_api_cache_set(_DD_MONITOR_INDEX_KIND, db_key, idx, compute_secs=compute_secs)
+        return idx
+
+
 def _dd_monitor_search_info(service_name, environment, dd_api_key, dd_app_key, dd_site):
     """
-    Query Datadog monitor search (service + env tags, same as UI facets).
+    Datadog monitor state for (service, env tags, same as UI facets) — answered from the
+    per-environment monitor index; per-service monitor search only if the bulk fetch fails
+    or STATUS_MONITOR_DD_MONITOR_INDEX=0.
 
     Returns a dict, or None on total API failure (same as legacy “uncached failed”):
       allow_error_override: bool | None — None = no matches / no usable states (keep APM);
@@ -1107,75 +1721,45 @@ def _dd_monitor_search_info(service_name, environment, dd_api_key, dd_app_key, d
       alert_names: list[str] — Alert monitors excluding -a/-b suffix (drive red/critical merge).
       alert_names_suffix_ab: list[str] — Alert monitors with -a/-b suffix (do not change tile color; counted on DD pill).
     """
-    import requests
+    if _sm_dd_monitor_index_enabled():
+        idx = _dd_monitor_index(environment, dd_api_key, dd_app_key, dd_site)
+        if idx is not None:
+            return _dd_monitor_summary(idx.get((service_name or "").strip().lower()) or [])
 
     cache_key = (service_name, environment, dd_site, "msearch_v4_ab_suffix_warn")
     now = time.time()
     with _DD_MONITOR_SEARCH_LOCK:
         hit = _DD_MONITOR_SEARCH_CACHE.get(cache_key)
-        if hit and now - hit[0] < _DD_MONITOR_SEARCH_TTL:
+        if hit and entry_is_fresh(repr(cache_key), hit[0], _DD_MONITOR_SEARCH_TTL, hit[2], now=now):
             return hit[1]
 
     url = f"{datadog_rest_api_base(dd_site)}/api/v1/monitor/search"
     headers = {"DD-API-KEY": dd_api_key, "DD-APPLICATION-KEY": dd_app_key}
-    bad_states = frozenset({"Alert", "Warn"})
-    ok_states = frozenset({"OK", "No Data", "Skipped", "Ignored", "Unknown"})
     # Hyphenated service names: quoted per Datadog search reserved characters
     query_str = f'service:"{service_name}" env:{environment}'
-    collected = []
-    alert_keyed: dict[str, str] = {}
-    alert_keyed_suffix: dict[str, str] = {}
+    entries = []
     page = 0
     per_page = 100
 
     def _store(result):
         with _DD_MONITOR_SEARCH_LOCK:
-            _DD_MONITOR_SEARCH_CACHE[cache_key] = (now, result)
+            _DD_MONITOR_SEARCH_CACHE[cache_key] = (now, result, time.time() - now)
 
     try:
         while page < 20:
-            r = requests.get(
+            r = datadog_get(
                 url,
                 headers=headers,
                 params={"query": query_str, "page": page, "per_page": per_page},
                 timeout=_dd_query_timeout_secs(),
             )
-            if r.status_code == 429:
-                time.sleep(0.75)
-                r = requests.get(
-                    url,
-                    headers=headers,
-                    params={"query": query_str, "page": page, "per_page": per_page},
-                    timeout=_dd_query_timeout_secs(),
-                )
+            # 429s are retried after the bucket reset inside tools.datadog_http
             if r.status_code != 200:
                 _store(None)
                 return None
             data = r.json() if r.content else {}
             monitors = data.get("monitors") or []
-            for m in monitors:
-                st = m.get("overall_state")
-                if st is None and isinstance(m.get("status"), str):
-                    st = m["status"]
-                st = (st or "").strip() if isinstance(st, str) else ""
-                raw_name = (m.get("name") or "").strip()
-                mid = m.get("id")
-                skip_ab = _sm_dd_monitor_name_suffix_ab(raw_name)
-                if st:
-                    eff = st
-                    if st == "Alert" and skip_ab:
-                        eff = "OK"
-                    collected.append(eff)
-                if st == "Alert" and not skip_ab:
-                    key = f"id:{mid}" if mid is not None else f"n:{raw_name}"
-                    disp = raw_name or (f"monitor {mid}" if mid is not None else "monitor")
-                    if key not in alert_keyed:
-                        alert_keyed[key] = disp
-                elif st == "Alert" and skip_ab:
-                    key = f"id:{mid}" if mid is not None else f"n:{raw_name}"
-                    disp = raw_name or (f"monitor {mid}" if mid is not None else "monitor")
-                    if key not in alert_keyed_suffix:
-                        alert_keyed_suffix[key] = disp
+            entries.extend(_dd_monitor_entry(m) for m in monitors)
             if not monitors or len(monitors) < per_page:
                 break
             page += 1
@@ -1184,27 +1768,140 @@ def _dd_monitor_search_info(service_name, environment, dd_api_key, dd_app_key, d
         _store(None)
         return None
 
-    if not collected:
-        out = {"allow_error_override": None, "alert_names": [], "alert_names_suffix_ab": []}
-        _store(out)
-        return out
-    if any(s in bad_states for s in collected):
-        allow = False
-    elif all(s in ok_states for s in collected):
-        allow = True
-    else:
-        allow = False
-    alert_names = sorted(alert_keyed.values(), key=str.lower)
-    alert_names_suffix_ab = sorted(alert_keyed_suffix.values(), key=str.lower)
-    out = {
-        "allow_error_override": allow,
-        "alert_names": alert_names,
-        "alert_names_suffix_ab": alert_names_suffix_ab,
-    }
+    out = _dd_monitor_summary(entries)
     _store(out)
     return out
 
 
+def _sm_build_health_row(
+    service_name,
+    environment,
+    dd_api_key,
+    dd_app_key,
+    dd_site,
+    *,
+    requests_count,
+    errors_count,
+    dd_query_reachable: bool,
+    traffic_drop: bool = False,
+    high_latency: bool = False,
+    p95_latency=None,
+    p99_latency=None,
+    baseline_requests=0,
+    traffic_variance=None,
+) -> ServiceHealth:
+    """
+    Status row from APM hit/error counts: thresholds, Datadog monitor override / alert merge,
+    expected error-rate list. Shared by the per-service walk and the grouped env engine.
+    """
+    error_rate = (errors_count / requests_count * 100) if requests_count > 0 else 0
+
+    # Determine status based on multiple factors
+    # Be more conservative to avoid false positives
+    if requests_count == 0:
+        # unreachable API / timeouts vs confirmed empty APM series
+        status = 'inactive' if dd_query_reachable else 'unknown'
+    elif traffic_drop:
+        status = 'critical'  # Sudden traffic drop is critical
+    elif error_rate > 5:  # Increased from 3% to 5% to be less aggressive
+        status = 'critical'
+        print(f"   🚨 {service_name} ({environment}): CRITICAL - Error rate {error_rate:.2f}% (>{requests_count:,} requests, {errors_count:,} errors)")
+    elif error_rate > 1:  # Increased from 0.5% to 1%
+        status = 'warning'
+        print(f"   ⚠️  {service_name} ({environment}): WARNING - Error rate {error_rate:.2f}%")
+    elif high_latency:
+        status = 'warning'
+        print(f"   ⚠️  {service_name} ({environment}): WARNING - High latency {p95_latency:.0f}ms")
+    else:
+        status = 'healthy'
+
+    er_critical = status == "critical" and error_rate > 5 and not traffic_drop
+    er_warning = status == "warning" and error_rate > 1 and not high_latency
+    need_dd_for_override = (
+        _sm_dd_monitor_error_override_enabled()
+        and status in ("critical", "warning")
+        and (er_critical or er_warning)
+    )
+    need_dd = need_dd_for_override or _sm_dd_monitor_alerts_enabled()
+    dd_info = None
+    if need_dd:
+        dd_info = _dd_monitor_search_info(
+            service_name, environment, dd_api_key, dd_app_key, dd_site
+        )
+    alert_names: list = []
+    suffix_alert_names: list = []
+    if _sm_dd_monitor_alerts_enabled() and isinstance(dd_info, dict):
+        alert_names = list(dd_info.get("alert_names") or [])
+        suffix_alert_names = list(dd_info.get("alert_names_suffix_ab") or [])
+
+    dd_monitor_override = False
+    if _sm_dd_monitor_error_override_enabled() and status in ("critical", "warning") and (er_critical or er_warning):
+        m_all_ok = (dd_info or {}).get("allow_error_override")
+        if m_all_ok is True:
+            prev = status
+            dd_monitor_override = True
+            status = "healthy"
+            print(
+                f"   ✅ {service_name} ({environment}): Datadog monitors all OK — "
+                f"overriding error-rate {prev} → healthy (ERR {error_rate:.2f}%)"
+            )
+
+    if _sm_dd_monitor_alerts_enabled() and alert_names:
+        status = _sm_merge_status_with_dd_alerts(status, len(alert_names))
+        if status != "healthy":
+            dd_monitor_override = False
+
+    if _sm_dd_monitor_alerts_enabled() and suffix_alert_names:
+        status = _sm_bump_min_warning_for_dd_suffix_alerts(status, len(suffix_alert_names))
+        if status != "healthy":
+            dd_monitor_override = False
+
+    if (
+        _sm_is_expected_err_rate_ok(service_name)
+        and status in ("critical", "warning")
+        and not traffic_drop
+        and not high_latency
+        and error_rate > 1
+    ):
+        prev = status
+        status = "healthy"
+        dd_monitor_override = True
+        print(
+            f"   ✅ {service_name} ({environment}): expected error-rate — "
+            f"{prev} → healthy (ERR {error_rate:.2f}%)"
+        )
+
+    dd_m_url = _dd_monitors_manage_url(service_name, environment, dd_site)
+    dd_m_url_all = (
+        _dd_monitors_manage_url_all_alerts(service_name, environment, dd_site)
+        if suffix_alert_names
+        else None
+    )
+    
+    return ServiceHealth({
+        'service': service_name,
+        'environment': environment,
+        'status': status,
+        'requests': int(requests_count),
+        'errors': int(errors_count),
+        'error_rate': round(error_rate, 2),
+        'p95_latency': round(p95_latency, 2) if p95_latency else None,
+        'p99_latency': round(p99_latency, 2) if p99_latency else None,
+        'traffic_drop': traffic_drop,
+        'high_latency': high_latency,
+        'baseline_requests': int(baseline_requests),
+        'traffic_variance': round(traffic_variance, 1) if traffic_variance is not None else None,
+        'dd_monitor_override': dd_monitor_override,
+        'dd_monitor_alerts': alert_names,
+        'dd_monitor_alert_count': len(alert_names),
+        'dd_monitor_alerts_suffix_ab': suffix_alert_names,
+        'dd_monitor_alert_suffix_count': len(suffix_alert_names),
+        'dd_monitor_open_count': len(alert_names) + len(suffix_alert_names),
+        'dd_monitors_url': dd_m_url or None,
+        'dd_monitors_url_all_alerts': dd_m_url_all or None,
+    })
+
+
 def get_service_health_status(service_name, environment, dd_api_key, dd_app_key, dd_site, from_time, to_time, enable_extended_metrics=False):
     """Get comprehensive health status for a single service using multiple Datadog APM metrics
     
@@ -1212,8 +1909,6 @@ def get_service_health_status(service_name, environment, dd_api_key, dd_app_key,
         enable_extended_metrics: If True, fetch latency and baseline (slower but more comprehensive)
     """
     try:
-        import requests
-        
         headers = {
             "DD-API-KEY": dd_api_key,
             "DD-APPLICATION-KEY": dd_app_key
@@ -1228,21 +1923,18 @@ def get_service_health_status(service_name, environment, dd_api_key, dd_app_key,
         baseline_from = 0
         baseline_to = 0
         
-        # Use primary metric pattern (servlet) - optimized for speed
-        # Only try alternative patterns if extended metrics are enabled
-        if enable_extended_metrics:
-            metric_patterns = [
-                ('trace.servlet.request.hits', 'trace.servlet.request.errors', 'trace.servlet.request.duration.by.service.95p'),
-                ('trace.http.request.hits', 'trace.http.request.errors', 'trace.http.request.duration.by.service.95p'),
-                ('trace.web.request.hits', 'trace.web.request.errors', 'trace.web.request.duration.by.service.95p'),
-            ]
-        else:
-            # Fast mode: try common APM hit patterns (no latency/baseline — still fast)
-            metric_patterns = [
-                ('trace.servlet.request.hits', 'trace.servlet.request.errors', 'trace.servlet.request.duration.by.service.95p'),
-                ('trace.http.request.hits', 'trace.http.request.errors', 'trace.http.request.duration.by.service.95p'),
-                ('trace.web.request.hits', 'trace.web.request.errors', 'trace.web.request.duration.by.service.95p'),
-            ]
+        # APM operation families in walk order; a remembered family (SQLite index) goes first so
+        # most services answer in one round trip. Stale entries re-probe the full canonical walk.
+        known = _dd_known_apm_family(service_name, environment)
+        family_order = list(_DD_APM_HEALTH_FAMILIES)
+        if known is not None:
+            family_order.remove(known)
+            family_order.insert(0, known)
+        metric_patterns = [
+            (f"{fam}.request.hits", f"{fam}.request.errors", f"{fam}.request.duration.by.service.95p")
+            for fam in family_order
+        ]
+        winning_family = None
         
         # True if Datadog returned HTTP 200 at least once (empty series = no traffic, not timeout)
         dd_query_reachable = False
@@ -1259,31 +1951,24 @@ def get_service_health_status(service_name, environment, dd_api_key, dd_app_key,
                 "query": query
             }
             
-            # Parallel hits + errors; one quick retry on transport errors (busy DD / parallel load)
+            # Parallel hits + errors on the shared keep-alive pool; one quick retry on transport
+            # errors (busy DD / parallel load)
             response = None
             err_response = None
             for attempt in (0, 1):
-                fetch_out = {}
-
-                def _dd_fetch(key, q):
-                    try:
-                        fetch_out[key] = requests.get(
+                response, err_response = datadog_get_many(
+                    [
+                        (
                             dd_query_url,
-                            headers=headers,
-                            params={"from": from_time, "to": to_time, "query": q},
-                            timeout=_dd_query_timeout_secs(),
+                            {
+                                "headers": headers,
+                                "params": {"from": from_time, "to": to_time, "query": q},
+                                "timeout": _dd_query_timeout_secs(),
+                            },
                         )
-                    except Exception as ex:
-                        fetch_out[key] = ex
-
-                t_hits = threading.Thread(target=_dd_fetch, args=("hits", hits_query))
-                t_err = threading.Thread(target=_dd_fetch, args=("err", err_query))
-                t_hits.start()
-                t_err.start()
-                t_hits.join()
-                t_err.join()
-                response = fetch_out.get("hits")
-                err_response = fetch_out.get("err")
+                        for q in (hits_query, err_query)
+                    ]
+                )
                 if not isinstance(response, Exception):
                     break
                 if attempt == 0:
@@ -1323,7 +2008,7 @@ def get_service_health_status(service_name, environment, dd_api_key, dd_app_key,
                                     
                                     print(f"   🔍 Trying latency metric ({pattern_name}): {lat_metric_pattern}")
                                     
-                                    lat_response = requests.get(
+                                    lat_response = datadog_get(
                                         dd_query_url,
                                         headers=headers,
                                         params=params,
@@ -1370,7 +2055,7 @@ def get_service_health_status(service_name, environment, dd_api_key, dd_app_key,
                                 
                                 print(f"   📊 Fetching 7-day baseline for traffic comparison...")
                                 
-                                baseline_response = requests.get(
+                                baseline_response = datadog_get(
                                     dd_query_url,
                                     headers=headers,
                                     params=params,
@@ -1385,10 +2070,12 @@ def get_service_health_status(service_name, environment, dd_api_key, dd_app_key,
                                             baseline_requests = sum(p[1] for p in baseline_points if p[1] is not None)
                                             print(f"   📈 Baseline (7 days): {baseline_requests:,} requests")
                             
+                            if requests_count > 0:
+                                winning_family = hits_metric[: -len(".request.hits")]
                             break  # Found working metric pattern
         
-        # Calculate error rate
-        error_rate = (errors_count / requests_count * 100) if requests_count > 0 else 0
+        if winning_family and winning_family != known:
+            set_service_apm_family(service_name, environment, winning_family)
         
         # Detect traffic drop (> 85% drop from weekly average) - only if extended metrics enabled
         traffic_drop = False
@@ -1420,88 +2107,6 @@ def get_service_health_status(service_name, environment, dd_api_key, dd_app_key,
             if p99_latency and p99_latency > 5000:  # 5 seconds in ms
                 high_latency = True
         
-        # Determine status based on multiple factors
-        # Be more conservative to avoid false positives
-        if requests_count == 0:
-            # unreachable API / timeouts vs confirmed empty APM series
-            status = 'inactive' if dd_query_reachable else 'unknown'
-        elif traffic_drop:
-            status = 'critical'  # Sudden traffic drop is critical
-        elif error_rate > 5:  # Increased from 3% to 5% to be less aggressive
-            status = 'critical'
-            print(f"   🚨 {service_name} ({environment}): CRITICAL - Error rate {error_rate:.2f}% (>{requests_count:,} requests, {errors_count:,} errors)")
-        elif error_rate > 1:  # Increased from 0.5% to 1%
-            status = 'warning'
-            print(f"   ⚠️  {service_name} ({environment}): WARNING - Error rate {error_rate:.2f}%")
-        elif high_latency:
-            status = 'warning'
-            print(f"   ⚠️  {service_name} ({environment}): WARNING - High latency {p95_latency:.0f}ms")
-        else:
-            status = 'healthy'
-
-        er_critical = status == "critical" and error_rate > 5 and not traffic_drop
-        er_warning = status == "warning" and error_rate > 1 and not high_latency
-        need_dd_for_override = (
-            _sm_dd_monitor_error_override_enabled()
-            and status in ("critical", "warning")
-            and (er_critical or er_warning)
-        )
-        need_dd = need_dd_for_override or _sm_dd_monitor_alerts_enabled()
-        dd_info = None
-        if need_dd:
-            dd_info = _dd_monitor_search_info(
-                service_name, environment, dd_api_key, dd_app_key, dd_site
-            )
-        alert_names: list = []
-        suffix_alert_names: list = []
-        if _sm_dd_monitor_alerts_enabled() and isinstance(dd_info, dict):
-            alert_names = list(dd_info.get("alert_names") or [])
-            suffix_alert_names = list(dd_info.get("alert_names_suffix_ab") or [])
-
-        dd_monitor_override = False
-        if _sm_dd_monitor_error_override_enabled() and status in ("critical", "warning") and (er_critical or er_warning):
-            m_all_ok = (dd_info or {}).get("allow_error_override")
-            if m_all_ok is True:
-                prev = status
-                dd_monitor_override = True
-                status = "healthy"
-                print(
-                    f"   ✅ {service_name} ({environment}): Datadog monitors all OK — "
-                    f"overriding error-rate {prev} → healthy (ERR {error_rate:.2f}%)"
-                )
-
-        if _sm_dd_monitor_alerts_enabled() and alert_names:
-            status = _sm_merge_status_with_dd_alerts(status, len(alert_names))
-            if status != "healthy":
-                dd_monitor_override = False
-
-        if _sm_dd_monitor_alerts_enabled() and suffix_alert_names:
-            status = _sm_bump_min_warning_for_dd_suffix_alerts(status, len(suffix_alert_names))
-            if status != "healthy":
-                dd_monitor_override = False
-
-        if (
-            _sm_is_expected_err_rate_ok(service_name)
-            and status in ("critical", "warning")
-            and not traffic_drop
-            and not high_latency
-            and error_rate > 1
-        ):
-            prev = status
-            status = "healthy"
-            dd_monitor_override = True
-            print(
-                f"   ✅ {service_name} ({environment}): expected error-rate — "
-                f"{prev} → healthy (ERR {error_rate:.2f}%)"
-            )
-
-        dd_m_url = _dd_monitors_manage_url(service_name, environment, dd_site)
-        dd_m_url_all = (
-            _dd_monitors_manage_url_all_alerts(service_name, environment, dd_site)
-            if suffix_alert_names
-            else None
-        )
-        
         # Calculate traffic variance for context
         traffic_variance = None
         if enable_extended_metrics and baseline_requests > 0:
@@ -1512,32 +2117,26 @@ def get_service_health_status(service_name, environment, dd_api_key, dd_app_key,
             if baseline_avg_rate > 0:
                 traffic_variance = ((current_rate - baseline_avg_rate) / baseline_avg_rate) * 100
         
-        return {
-            'service': service_name,
-            'environment': environment,
-            'status': status,
-            'requests': int(requests_count),
-            'errors': int(errors_count),
-            'error_rate': round(error_rate, 2),
-            'p95_latency': round(p95_latency, 2) if p95_latency else None,
-            'p99_latency': round(p99_latency, 2) if p99_latency else None,
-            'traffic_drop': traffic_drop,
-            'high_latency': high_latency,
-            'baseline_requests': int(baseline_requests),
-            'traffic_variance': round(traffic_variance, 1) if traffic_variance is not None else None,
-            'dd_monitor_override': dd_monitor_override,
-            'dd_monitor_alerts': alert_names,
-            'dd_monitor_alert_count': len(alert_names),
-            'dd_monitor_alerts_suffix_ab': suffix_alert_names,
-            'dd_monitor_alert_suffix_count': len(suffix_alert_names),
-            'dd_monitor_open_count': len(alert_names) + len(suffix_alert_names),
-            'dd_monitors_url': dd_m_url or None,
-            'dd_monitors_url_all_alerts': dd_m_url_all or None,
-        }
+        return _sm_build_health_row(
+            service_name,
+            environment,
+            dd_api_key,
+            dd_app_key,
+            dd_site,
+            requests_count=requests_count,
+            errors_count=errors_count,
+            dd_query_reachable=dd_query_reachable,
+            traffic_drop=traffic_drop,
+            high_latency=high_latency,
+            p95_latency=p95_latency,
+            p99_latency=p99_latency,
+            baseline_requests=baseline_requests,
+            traffic_variance=traffic_variance,
+        )
         
     except Exception as e:
         print(f"Error fetching status for {service_name} in {environment}: {e}")
-        return {
+        return ServiceHealth({
             'service': service_name,
             'environment': environment,
             'status': 'unknown',
@@ -1556,7 +2155,223 @@ def get_service_health_status(service_name, environment, dd_api_key, dd_app_key,
             'dd_monitor_alert_suffix_count': 0,
             'dd_monitors_url': _dd_monitors_manage_url(service_name, environment, dd_site) or None,
             'dd_monitors_url_all_alerts': None,
-        }
+        })
+
+
+# APM operation families walked by get_service_health_status (same order = same winner per service).
+_DD_APM_HEALTH_FAMILIES = ("trace.servlet", "trace.http", "trace.web")
+
+
+def _sm_dd_grouped_health_enabled() -> bool:
+    """
+    Default on: one `by {service}` query per metric family and env instead of 2+ calls per service.
+    STATUS_MONITOR_DD_GROUPED_HEALTH=0 restores the per-service walk everywhere.
+    """
+    v = (os.getenv("STATUS_MONITOR_DD_GROUPED_HEALTH") or "1").strip().lower()
+    return v not in ("0", "false", "no", "off")
+
+
+def _dd_apm_family_reprobe_secs() -> float:
+    """Remembered APM family is trusted this long before a full canonical re-probe (default 6h)."""
+    try:
+        return max(300.0, float((os.getenv("STATUS_MONITOR_DD_FAMILY_REPROBE_SECS") or "21600").strip()))
+    except ValueError:
+        return 21600.0
+
+
+def _dd_known_apm_family(service_name: str, environment: str) -> str | None:
+    """Family recorded in service_apm_families if still fresh, else None (walk from servlet)."""
+    row = get_service_apm_family(service_name, environment)
+    if row is None:
+        return None
+    family, updated_at = row
+    if family not in _DD_APM_HEALTH_FAMILIES:
+        return None
+    if not entry_is_fresh(f"apm_family:{service_name}:{environment}", updated_at, _dd_apm_family_reprobe_secs()):
+        return None
+    return family
+
+
+def _dd_series_tag_value(series: dict, tag_key: str) -> str | None:
+    """Raw value of one group-by tag on a series (tag_set first, scope string as fallback)."""
+    prefix = f"{tag_key}:"
+    for tag in series.get("tag_set") or []:
+        if isinstance(tag, str) and tag.startswith(prefix):
+            return tag[len(prefix):].strip() or None
+    for part in str(series.get("scope") or "").split(","):
+        part = part.strip()
+        if part.startswith(prefix):
+            return part[len(prefix):].strip() or None
+    return None
+
+
+def _dd_series_service_key(series: dict) -> str | None:
+    """`service` tag value of one grouped series, lowercased."""
+    value = _dd_series_tag_value(series, "service")
+    return value.lower() if value else None
+
+
+def _dd_grouped_sum_by_service(dd_query_url: str, headers: dict, query: str, from_time, to_time) -> dict | None:
+    """One grouped as_count query → {service (lower): summed points}. None on HTTP / transport failure."""
+    try:
+        r = _https_get_with_retries(
+            dd_query_url,
+            headers=headers,
+            params={"from": from_time, "to": to_time, "query": query},
+            label="Datadog grouped query",
+            max_attempts=3,
+        )
+    except Exception as e:
+        print(f"⚠️ Datadog grouped query failed ({query}): {e}")
+        return None
+    if r.status_code != 200:
+        print(f"⚠️ Datadog grouped query HTTP {r.status_code} ({query}): {(r.text or '')[:200]}")
+        return None
+    try:
+        data = r.json() or {}
+    except ValueError:
+        return None
+    out: dict = {}
+    for series in data.get("series") or []:
+        key = _dd_series_service_key(series)
+        if not key:
+            continue
+        total = sum(
+            p[1] for p in series.get("pointlist") or [] if p and len(p) > 1 and p[1] is not None
+        )
+        out[key] = out.get(key, 0) + total
+    return out
+
+
+def _dd_grouped_env_counts(environment, dd_api_key, dd_app_key, dd_site, from_time, to_time) -> dict | None:
+    """
+    Hits + errors for every service in one env tag: two grouped queries per family, in parallel.
+    Returns {family: {"hits": map | None, "errors": map | None}}, or None when no hits query
+    succeeded (caller falls back to the per-service walk).
+    """
+    headers = {"DD-API-KEY": dd_api_key, "DD-APPLICATION-KEY": dd_app_key}
+    dd_query_url = f"{datadog_rest_api_base(dd_site)}/api/v1/query"
+    futs = {}
+    with ThreadPoolExecutor(max_workers=len(_DD_APM_HEALTH_FAMILIES) * 2) as ex:
+        for fam in _DD_APM_HEALTH_FAMILIES:
+            for kind in ("hits", "errors"):
+                q = f"sum:{fam}.request.{kind}{{env:{environment}}} by {{service}}.as_count()"
+                futs[(fam, kind)] = ex.submit(
+                    _dd_grouped_sum_by_service, dd_query_url, headers, q, from_time, to_time
+                )
+    counts = {
+        fam: {kind: futs[(fam, kind)].result() for kind in ("hits", "errors")}
+        for fam in _DD_APM_HEALTH_FAMILIES
+    }
+    if all(counts[fam]["hits"] is None for fam in _DD_APM_HEALTH_FAMILIES):
+        return None
+    return counts
+
+
+def _dd_pick_grouped_counts(counts: dict, service_name: str) -> tuple[int, int, str | None] | None:
+    """
+    Per-service walk semantics on grouped data: the first family with hits > 0 wins.
+    Returns (hits, errors, family or None when idle), or None when the answer depends on a
+    failed grouped query (that service is re-checked individually).
+    """
+    key = (service_name or "").strip().lower()
+    for fam in _DD_APM_HEALTH_FAMILIES:
+        hits_map = counts[fam]["hits"]
+        if hits_map is None:
+            return None
+        hits = hits_map.get(key, 0)
+        if hits > 0:
+            err_map = counts[fam]["errors"]
+            if err_map is None:
+                return None
+            return hits, err_map.get(key, 0), fam
+    return 0, 0, None
+
+
+def _sm_fetch_grouped_env_health(
+    services,
+    environment,
+    dd_api_key,
+    dd_app_key,
+    dd_site,
+    from_time,
+    current_time,
+    timerange_hours: int,
+) -> tuple[dict, list]:
+    """
+    Batch health for one env: grouped hit/error counts split locally, then the same row builder
+    as get_service_health_status (monitor override, alerts, expected error rate).
+    Inactive services get one grouped re-check over the inactive lookback window.
+
+    Returns (rows by service name, services that still need the per-service walk).
+    """
+    if not services:
+        return {}, []
+    counts = _dd_grouped_env_counts(environment, dd_api_key, dd_app_key, dd_site, from_time, current_time)
+    if counts is None:
+        print(f"⚠️ Datadog grouped health ({environment}): no family answered — per-service fallback")
+        return {}, list(services)
+
+    picked: dict = {}
+    leftover: list = []
+    for svc in services:
+        pc = _dd_pick_grouped_counts(counts, svc)
+        if pc is None:
+            leftover.append(svc)
+        else:
+            picked[svc] = pc
+
+    lookback_h = _apm_wall_inactive_lookback_hours()
+    lookback_for: dict = {}
+    idle = [svc for svc, (hits, _e, _f) in picked.items() if hits <= 0]
+    if idle and lookback_h > 0 and int(timerange_hours) < lookback_h:
+        fb_counts = _dd_grouped_env_counts(
+            environment, dd_api_key, dd_app_key, dd_site, current_time - (lookback_h * 3600), current_time
+        )
+        for svc in idle:
+            pc = _dd_pick_grouped_counts(fb_counts, svc) if fb_counts is not None else None
+            if pc is not None and pc[0] > 0:
+                picked[svc] = pc
+                lookback_for[svc] = lookback_h
+
+    def _build(svc: str) -> ServiceHealth:
+        hits, errs, _fam = picked[svc]
+        row = _sm_build_health_row(
+            svc,
+            environment,
+            dd_api_key,
+            dd_app_key,
+            dd_site,
+            requests_count=hits,
+            errors_count=errs,
+            dd_query_reachable=True,
+        )
+        if svc in lookback_for:
+            row["wall_timerange_hours"] = int(timerange_hours)
+            row["wall_effective_lookback_hours"] = lookback_for[svc]
+        return row
+
+    # Grouped data already tells us each service's family: keep the discovery index warm for
+    # per-service fallbacks (one transaction for the whole env).
+    set_service_apm_families(
+        [(svc, environment, fam) for svc, (_h, _e, fam) in picked.items() if fam]
+    )
+
+    rows: dict = {}
+    with ThreadPoolExecutor(max_workers=_dd_health_worker_count(len(picked))) as ex:
+        futs = {submit_in_context(ex, _build, svc): svc for svc in picked}
+        for fut in as_completed(futs):
+            svc = futs[fut]
+            try:
+                rows[svc] = fut.result()
+            except Exception as e:
+                print(f"⚠️ Datadog grouped health row ({svc}, {environment}): {e}")
+                leftover.append(svc)
+    print(
+        f"📡 Datadog grouped health ({environment}): {len(rows)} service(s) from grouped queries, "
+        f"{len(leftover)} per-service fallback, {len(lookback_for)} via {lookback_h}h lookback"
+    )
+    return rows, leftover
 
 
 def get_pagerduty_incidents_count(pd_api_key: str):
@@ -1622,6 +2437,7 @@ def _pagerduty_fetch_slices(
         )
         return cached["counts"], cached["incidents_by_status"], cached["active_incidents"]
 
+    t_fetch = time.time()
     counts = {}
     incidents_by_status = {"triggered": [], "acknowledged": [], "resolved": []}
 
@@ -1642,8 +2458,20 @@ def _pagerduty_fetch_slices(
     # External status boards (Samsung/ADT): paginate so lists include full history (typically small).
     _BOARD_PAGE = 100
     _BOARD_MAX_ROWS = 2500
+    # Account-wide slices come from the local incident store (boards filter by status dashboard,
+    # which the store does not track); None when it cannot answer
+    stored = None
+    if not status_dashboard_id:
+        stored = pagerduty_store.incidents(
+            pd_api_key,
+            datetime.utcnow() - timedelta(hours=since_hours),
+            max_age_secs=0 if force_refresh else None,
+        )
 
     def _fetch_pd_incidents_for_status(status: str):
+        if stored is not None:
+            inc_list = [i for i in stored if i.get("status") == status]
+            return status, len(inc_list), inc_list[:10]
         params = {
             "statuses[]": [status],
             "since": since,
@@ -1670,52 +2498,43 @@ def _pagerduty_fetch_slices(
                 return status, 0, []
             data = response.json()
             n = data.get("total", 0) if data.get("total") else len(data.get("incidents", []))
-            inc_list = data.get("incidents", [])
-            _sm_pd_attach_escalation_summaries(inc_list, data)
-            return status, n, inc_list
-
-        # Board: fetch all pages up to _BOARD_MAX_ROWS
-        all_incidents: list = []
-        offset = 0
-        total_reported: int | None = None
-        while len(all_incidents) < _BOARD_MAX_ROWS:
-            p = dict(params)
-            p["offset"] = offset
-            response = _https_get_with_retries(
-                "https://api.pagerduty.com/incidents",
-                headers=headers,
-                params=p,
-                timeout=(12, 60),
-                label="PagerDuty",
-                max_attempts=4,
-            )
-            if response.status_code != 200:
-                return status, 0, all_incidents
-            data = response.json()
-            if total_reported is None:
-                raw_t = data.get("total")
-                if raw_t is not None:
-                    try:
-                        total_reported = int(raw_t)
-                    except (TypeError, ValueError):
-                        total_reported = None
-            page = data.get("incidents") or []
-            _sm_pd_attach_escalation_summaries(page, data)
-            all_incidents.extend(page)
-            if not page or len(page) < _BOARD_PAGE:
-                break
-            if total_reported is not None and len(all_incidents) >= total_reported:
-                break
-            offset += _BOARD_PAGE
+            inc_list = data.get("incidents", [])
+            _sm_pd_attach_escalation_summaries(inc_list, data)
+            return status, n, inc_list
+
+        # Board: all pages up to _BOARD_MAX_ROWS (concurrent when PD reports a total)
+        all_incidents: list = []
+        try:
+            for inc in pagerduty_pages(
+                headers,
+                "/incidents",
+                params,
+                "incidents",
+                page_size=_BOARD_PAGE,
+                max_rows=_BOARD_MAX_ROWS,
+                page_hook=_sm_pd_attach_escalation_summaries,
+            ):
+                all_incidents.append(inc)
+        except PagerDutyAPIError:
+            return status, 0, all_incidents
         # PD often omits or misreports `total` when filtering by status_dashboard_ids; paginated length is truth.
         n = len(all_incidents)
         return status, n, all_incidents
 
     # Parallel: external boards need 3 slices; sequential was ~3× latency for Samsung/ADT widgets.
-    with ThreadPoolExecutor(max_workers=3) as pool:
-        for status, n, inc_list in pool.map(_fetch_pd_incidents_for_status, statuses):
-            counts[status] = n
-            incidents_by_status[status] = inc_list
+    try:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            for status, n, inc_list in pool.map(_fetch_pd_incidents_for_status, statuses):
+                counts[status] = n
+                incidents_by_status[status] = inc_list
+    except Exception as e:
+        # PagerDuty unreachable after retries: last good row up to the hard TTL beats an error
+        stale = sm_api_cache_get_stale("pagerduty_status", cache_key, cache_hard_ttl(_db_api_cache_ttl))
+        if not stale or stale[0].get("incidents_by_status") is None:
+            raise
+        print(f"⚠️ PagerDuty fetch failed ({e}); serving cached row from {int(time.time() - stale[1])}s ago")
+        cached = stale[0]
+        return cached["counts"], cached["incidents_by_status"], cached["active_incidents"]
 
     active_incidents = incidents_by_status["triggered"] + incidents_by_status["acknowledged"]
 
@@ -1733,6 +2552,7 @@ def _pagerduty_fetch_slices(
             "active_incidents": active_incidents,
             "incidents_by_status": incidents_by_status,
         },
+        compute_secs=time.time() - t_fetch,
     )
     return counts, incidents_by_status, active_incidents
 
@@ -1850,8 +2670,6 @@ def get_service_clusters_from_metrics(service_name: str, env: str, timerange_hou
         List of cluster names or empty list
     """
     try:
-        import requests
-        
         dd_api_key = os.getenv("DATADOG_API_KEY")
         dd_app_key = os.getenv("DATADOG_APP_KEY")
         dd_site = os.getenv("DATADOG_SITE", "datadoghq.com")
@@ -1893,7 +2711,7 @@ def get_service_clusters_from_metrics(service_name: str, env: str, timerange_hou
             }
             
             try:
-                response = requests.get(
+                response = datadog_get(
                     f"{datadog_rest_api_base(dd_site)}/api/v1/query",
                     headers={
                         "DD-API-KEY": dd_api_key,
@@ -1964,6 +2782,142 @@ def _eks_cluster_empty_retry_secs() -> float:
         return 3600.0
 
 
+def _eks_fresh_db_clusters(service_name: str, service_env: str, row, now: float | None = None) -> list | None:
+    """Cluster list from a service_eks_clusters row while still fresh, else None (look up again)."""
+    if row is None:
+        return None
+    clusters, updated_at = row
+    eks_key = f"eks:{service_name}:{service_env}"
+    ttl = _eks_cluster_cache_max_age_secs() if clusters else _eks_cluster_empty_retry_secs()
+    if entry_is_fresh(eks_key, updated_at, ttl, now=now):
+        return clusters
+    return None
+
+
+def _sm_dd_grouped_eks_enabled() -> bool:
+    """
+    Default on: walls resolve clusters with one `by {service,kube_cluster_name}` query set per env.
+    STATUS_MONITOR_DD_GROUPED_EKS=0 restores the per-service lookup pool.
+    """
+    v = (os.getenv("STATUS_MONITOR_DD_GROUPED_EKS") or "1").strip().lower()
+    return v not in ("0", "false", "no", "off")
+
+
+# Grouped twins of get_service_clusters_from_metrics' metric list, same priority order.
+# Second element is the tag carrying the service name on that metric.
+_EKS_GROUPED_METRICS = (
+    ("trace.servlet.request.hits", "service"),
+    ("trace.flask.request.hits", "service"),
+    ("trace.http.request.hits", "service"),
+    ("trace.web.request", "service"),
+    ("trace.express.request", "service"),
+    ("trace.django.request", "service"),
+    ("kubernetes.cpu.usage.total", "kube_service"),
+    ("kubernetes.memory.usage", "kube_service"),
+    ("kubernetes_state.pod.ready", "kube_service"),
+    ("container.cpu.usage", "container_name"),
+    ("docker.cpu.usage", "container_name"),
+    ("system.cpu.user", "service"),
+)
+
+
+def _dd_grouped_clusters_by_service(dd_query_url: str, headers: dict, query: str, service_tag: str, from_time, to_time) -> dict | None:
+    """One `by {<service_tag>,kube_cluster_name}` query → {service (lower): [clusters]}. None on failure."""
+    try:
+        r = _https_get_with_retries(
+            dd_query_url,
+            headers=headers,
+            params={"from": from_time, "to": to_time, "query": query},
+            label="Datadog grouped EKS query",
+            max_attempts=2,
+        )
+    except Exception as e:
+        print(f"⚠️ Datadog grouped EKS query failed ({query}): {e}")
+        return None
+    if r.status_code != 200:
+        print(f"⚠️ Datadog grouped EKS query HTTP {r.status_code} ({query}): {(r.text or '')[:200]}")
+        return None
+    try:
+        data = r.json() or {}
+    except ValueError:
+        return None
+    out: dict = {}
+    for series in data.get("series") or []:
+        svc = _dd_series_tag_value(series, service_tag)
+        cluster = _dd_series_tag_value(series, "kube_cluster_name")
+        if not svc or not cluster or not _is_meaningful_kube_cluster_name(cluster):
+            continue
+        names = out.setdefault(svc.lower(), [])
+        if cluster not in names:
+            names.append(cluster)
+    return out
+
+
+def _dd_grouped_eks_clusters(env_tag: str, timerange_hours: int) -> dict | None:
+    """
+    {service (lower): [clusters]} for every service in one env tag, first metric with clusters
+    winning per service (same rule as the per-service walk). None when every query failed.
+    """
+    dd_api_key = os.getenv("DATADOG_API_KEY")
+    dd_app_key = os.getenv("DATADOG_APP_KEY")
+    if not dd_api_key or not dd_app_key:
+        return None
+    dd_site = os.getenv("DATADOG_SITE", "datadoghq.com")
+    headers = {"DD-API-KEY": dd_api_key, "DD-APPLICATION-KEY": dd_app_key}
+    dd_query_url = f"{datadog_rest_api_base(dd_site)}/api/v1/query"
+    to_time = int(time.time())
+    from_time = to_time - timerange_hours * 3600
+    with ThreadPoolExecutor(max_workers=6) as ex:
+        futs = [
+            ex.submit(
+                _dd_grouped_clusters_by_service,
+                dd_query_url,
+                headers,
+                f"avg:{metric}{{env:{env_tag}}} by {{{tag},kube_cluster_name}}",
+                tag,
+                from_time,
+                to_time,
+            )
+            for metric, tag in _EKS_GROUPED_METRICS
+        ]
+        results = [f.result() for f in futs]
+    if all(res is None for res in results):
+        return None
+    merged: dict = {}
+    for res in results:
+        for svc, names in (res or {}).items():
+            merged.setdefault(svc, names)
+    return merged
+
+
+def _resolve_eks_clusters_grouped(services: list, service_env: str, timerange_hours: int) -> dict | None:
+    """
+    Cluster lists for many services of one environment via grouped queries, walking the env tag
+    variants only while services remain unresolved. Bulk-upserts every result (including empty
+    lists) in one transaction. None when Datadog could not be queried at all.
+    """
+    pending = {svc.lower(): svc for svc in services}
+    resolved: dict = {}
+    queried = False
+    for env_tag in _EKS_ENV_TAG_VARIANTS.get(service_env, [service_env]):
+        if not pending:
+            break
+        found = _dd_grouped_eks_clusters(env_tag, timerange_hours)
+        if found is None:
+            continue
+        queried = True
+        for low in [low for low in pending if found.get(low)]:
+            resolved[pending.pop(low)] = found[low]
+    if not queried:
+        return None
+    for svc in pending.values():
+        resolved[svc] = []
+    set_service_eks_clusters_many([(svc, service_env, names) for svc, names in resolved.items()])
+    hits = sum(1 for names in resolved.values() if names)
+    print(f"☸️ EKS clusters {service_env}: {hits}/{len(resolved)} services via grouped Datadog queries")
+    return resolved
+
+
 def _resolve_eks_cluster_names(
     service_name: str,
     service_env: str,
@@ -1974,19 +2928,10 @@ def _resolve_eks_cluster_names(
     Resolve kube_cluster_name via Datadog metrics. Persists results in SQLite (service_eks_clusters)
     so we do not query DD on every load. Returns (cluster_names, used_database_only).
     """
-    now = time.time()
     if not force_refresh:
-        row = get_service_eks_clusters(service_name, service_env)
-        if row is not None:
-            clusters, updated_at = row
-            age = now - updated_at
-            max_age = _eks_cluster_cache_max_age_secs()
-            empty_retry = _eks_cluster_empty_retry_secs()
-            if clusters:
-                if age < max_age:
-                    return clusters, True
-            elif age < empty_retry:
-                return [], True
+        clusters = _eks_fresh_db_clusters(service_name, service_env, get_service_eks_clusters(service_name, service_env))
+        if clusters is not None:
+            return clusters, True
 
     for env_tag in _EKS_ENV_TAG_VARIANTS.get(service_env, [service_env]):
         found = get_service_clusters_from_metrics(service_name, env_tag, timerange_hours=timerange_hours)
@@ -2003,41 +2948,94 @@ def _attach_eks_clusters_wall(
     eks_cache: dict | None = None,
     force_refresh: bool = False,
 ) -> None:
-    """Populate eks_clusters on wall rows (healthy / warning / critical) for tooltips."""
+    """
+    Populate eks_clusters on wall rows (healthy / warning / critical) for tooltips.
+    Fresh DB rows first, then one grouped lookup per environment for the rest; the per-service
+    pool only runs for environments whose grouped queries failed (or with grouping disabled).
+    """
     if not statuses:
         return
     thr = max(1, int(timerange))
     cache = eks_cache if eks_cache is not None else {}
     lock = threading.Lock()
 
-    def work(row: dict) -> None:
+    def apply(row: dict, names: list) -> None:
+        if names:
+            row["eks_clusters"] = names
+            row["eks_cluster_count"] = len(names)
+
+    wanted: dict = {}
+    for row in statuses:
         if row.get("status") not in ("healthy", "warning", "critical"):
-            return
-        if row.get("wall_idle"):
-            return
-        if row.get("eks_clusters"):
-            return
+            continue
+        if row.get("wall_idle") or row.get("eks_clusters"):
+            continue
         svc = row.get("service") or ""
         env = row.get("environment") or ""
         if not svc:
-            return
-        key = (svc, env)
+            continue
+        if (svc, env) in cache:
+            apply(row, cache[(svc, env)])
+        else:
+            wanted.setdefault(env, {}).setdefault(svc, []).append(row)
+    if not wanted:
+        return
+
+    grouped = _sm_dd_grouped_eks_enabled()
+
+    def env_job(env: str, by_svc: dict) -> list:
+        """Resolve one environment; returns rows still needing a per-service lookup."""
+        resolved: dict = {}
+        if not force_refresh:
+            now = time.time()
+            db_rows = get_service_eks_clusters_env(env)
+            for svc in by_svc:
+                names = _eks_fresh_db_clusters(svc, env, db_rows.get(svc), now=now)
+                if names is not None:
+                    resolved[svc] = names
+        missing = [svc for svc in by_svc if svc not in resolved]
+        if missing and grouped:
+            got = _resolve_eks_clusters_grouped(missing, env, thr)
+            if got is not None:
+                resolved.update(got)
+        leftovers = []
+        for svc, rows in by_svc.items():
+            if svc not in resolved:
+                leftovers.extend(rows)
+                continue
+            with lock:
+                cache[(svc, env)] = resolved[svc]
+            for row in rows:
+                apply(row, resolved[svc])
+        return leftovers
+
+    leftovers: list = []
+    with ThreadPoolExecutor(max_workers=min(len(wanted), STATUS_MONITOR_EKS_MAX_WORKERS)) as ex:
+        futs = [ex.submit(env_job, env, by_svc) for env, by_svc in wanted.items()]
+        for f in as_completed(futs):
+            try:
+                leftovers.extend(f.result())
+            except Exception as e:
+                print(f"⚠️ Status wall EKS lookup error: {e}")
+    if not leftovers:
+        return
+
+    def work(row: dict) -> None:
+        key = (row.get("service") or "", row.get("environment") or "")
         with lock:
             cached = key in cache
             if cached:
                 names = cache[key]
         if not cached:
-            resolved, _db = _resolve_eks_cluster_names(svc, env, thr, force_refresh)
+            resolved, _db = _resolve_eks_cluster_names(key[0], key[1], thr, force_refresh)
             with lock:
                 if key not in cache:
                     cache[key] = resolved
                 names = cache[key]
-        if names:
-            row["eks_clusters"] = names
-            row["eks_cluster_count"] = len(names)
+        apply(row, names)
 
     with ThreadPoolExecutor(max_workers=STATUS_MONITOR_EKS_MAX_WORKERS) as ex:
-        futs = [ex.submit(work, r) for r in statuses]
+        futs = [ex.submit(work, r) for r in leftovers]
         for f in as_completed(futs):
             try:
                 f.result()
@@ -2058,6 +3056,7 @@ def get_arlo_services_status(force_refresh: bool = False):
         from bs4 import BeautifulSoup
         import logging
         
+        t_fetch = time.time()
         url = "https://status.arlo.com"
         response = _https_get_with_retries(
             url,
@@ -2110,10 +3109,13 @@ def get_arlo_services_status(force_refresh: bool = False):
                     })
                     seen_services.add(line)
         
-        sm_api_cache_set("arlo_platform_status", "v1", {"services": services})
+        sm_api_cache_set("arlo_platform_status", "v1", {"services": services}, compute_secs=time.time() - t_fetch)
         return services
     except Exception as e:
         print(f"❌ Error fetching Arlo platform status: {e}")
+        stale = sm_api_cache_get_stale("arlo_platform_status", "v1", cache_hard_ttl(_db_api_cache_ttl))
+        if stale:
+            return stale[0].get("services") or []
         return []
 
 
@@ -2164,17 +3166,16 @@ def _sm_status_monitor_bundled_lists_enabled() -> bool:
 
 
 def _sm_read_service_names_from_bundled_file(path: str) -> list:
-    """Non-comment, non-blank lines from a lists/*.txt file."""
-    out: list = []
+    """Non-comment, non-blank lines from a lists/*.txt file (re-read only when the file changes)."""
     try:
-        with open(path, encoding="utf-8") as f:
-            for ln in f:
-                s = ln.strip()
-                if s and not s.lstrip().startswith("#"):
-                    out.append(s)
+        return list(service_registry.list_file_names(path))
     except OSError as e:
         print(f"⚠️ status monitor: could not read bundled list {path!r}: {e}")
-    return out
+        return []
+
+
+def _sm_sorted_unique_names(names) -> tuple:
+    return tuple(sorted(set(names), key=str.lower))
 
 
 def _sm_bundled_status_monitor_service_list(environment: str) -> list | None:
@@ -2204,12 +3205,12 @@ def _sm_bundled_status_monitor_service_list(environment: str) -> list | None:
         path = _bundled_qa_apm_path()
     else:
         return None
-    if not path or not os.path.isfile(path):
+    if not path:
         return None
-    names = _sm_read_service_names_from_bundled_file(path)
+    names = service_registry.derived(path, "sorted", _sm_sorted_unique_names)
     if not names:
         return None
-    return sorted(set(names), key=str.lower)
+    return list(names)
 
 
 def _merge_samsung_dashboard_services(dynamic_services: list) -> list:
@@ -2519,6 +3520,65 @@ def _apm_wall_inactive_lookback_hours() -> int:
         return 24
 
 
+# Negative cache for (service, env) probes that came back inactive (no APM hits even over the
+# inactive lookback) or unknown: re-probed on an exponential backoff instead of on every cache miss.
+# Payload: {"status", "row" (ServiceHealth row), "streak", "until" (unix), "window_h"}
+_DD_DORMANT_KIND = "dd_service_dormant"
+_DD_DORMANT_BACKOFF_SECS = _status_monitor_int_env("STATUS_MONITOR_DORMANT_BACKOFF_SECS", 600, 0, 86400)
+_DD_DORMANT_BACKOFF_MAX_SECS = _status_monitor_int_env("STATUS_MONITOR_DORMANT_BACKOFF_MAX_SECS", 21600, 60, 604800)
+# Unknown = Datadog answered badly; back off much more gently so recovery shows quickly
+_DD_UNKNOWN_BACKOFF_SECS = _status_monitor_int_env("STATUS_MONITOR_UNKNOWN_BACKOFF_SECS", 60, 0, 3600)
+_DD_UNKNOWN_BACKOFF_MAX_SECS = 900
+
+
+def _dd_dormant_key(service: str, env: str, dd_site: str) -> str:
+    return f"{service}\x1f{env}\x1f{dd_site}"
+
+
+def _dd_dormant_entry(service: str, env: str, dd_site: str) -> dict | None:
+    """Last negative probe for (service, env), or None (also once older than the longest backoff)."""
+    if _DD_DORMANT_BACKOFF_SECS <= 0 and _DD_UNKNOWN_BACKOFF_SECS <= 0:
+        return None
+    hit = sm_api_cache_get_stale(
+        _DD_DORMANT_KIND, _dd_dormant_key(service, env, dd_site), _DD_DORMANT_BACKOFF_MAX_SECS * 2
+    )
+    if not hit or not isinstance(hit[0], dict):
+        return None
+    return hit[0]
+
+
+def _dd_dormant_record(
+    service: str, env: str, dd_site: str, row: ServiceHealth, prev: dict | None, window_h: int
+) -> None:
+    status = row.get("status")
+    if status == "inactive":
+        base, cap = _DD_DORMANT_BACKOFF_SECS, _DD_DORMANT_BACKOFF_MAX_SECS
+    else:
+        base, cap = _DD_UNKNOWN_BACKOFF_SECS, min(_DD_UNKNOWN_BACKOFF_MAX_SECS, _DD_DORMANT_BACKOFF_MAX_SECS)
+    if base <= 0:
+        return
+    streak = int(prev.get("streak") or 0) + 1 if prev and prev.get("status") == status else 1
+    # Jitter spreads re-probes of services that went dormant together across refreshes
+    delay = min(cap, base * (2 ** min(streak - 1, 16))) * random.uniform(0.85, 1.0)
+    sm_api_cache_set(
+        _DD_DORMANT_KIND,
+        _dd_dormant_key(service, env, dd_site),
+        {
+            "status": status,
+            "row": row.to_row(),
+            "streak": streak,
+            "until": time.time() + delay,
+            "window_h": int(window_h),
+        },
+    )
+
+
+def _dd_dormant_clear(service: str, env: str, dd_site: str) -> None:
+    sm_api_cache_set(
+        _DD_DORMANT_KIND, _dd_dormant_key(service, env, dd_site), {"status": None, "streak": 0, "until": 0}
+    )
+
+
 def _sm_fetch_one_service_health_cached(
     service,
     env,
@@ -2532,13 +3592,32 @@ def _sm_fetch_one_service_health_cached(
 ):
     key = _dd_health_cache_key(service, env, timerange_hours, dd_site)
     ttl = _effective_db_cache_ttl_secs(force_refresh)
-    cached = sm_api_cache_get("dd_service_health", key, ttl)
+    cached = ServiceHealth.load(sm_api_cache_get("dd_service_health", key, ttl))
     if cached is not None:
         return cached, True
+    lookback_h = _apm_wall_inactive_lookback_hours()
+    window_h = max(int(timerange_hours), lookback_h)
+    dormant = _dd_dormant_entry(service, env, dd_site)
+    if dormant and time.time() < float(dormant.get("until") or 0):
+        d_status = dormant.get("status")
+        d_row = ServiceHealth.load(dormant.get("row"))
+        if (
+            d_row is not None
+            and d_status == "inactive"
+            and not force_refresh
+            and int(timerange_hours) <= int(dormant.get("window_h") or 0)
+        ):
+            return d_row, True
+        if d_row is not None and d_status == "unknown" and not force_refresh:
+            stale = sm_api_cache_get_stale("dd_service_health", key, cache_hard_ttl(_db_api_cache_ttl))
+            stale_row = ServiceHealth.load(stale[0]) if stale else None
+            if stale_row is not None and stale_row.get("status") not in (None, "unknown"):
+                return stale_row, True
+            return d_row, True
+    t_fetch = time.time()
     out = get_service_health_status(
         service, env, dd_api_key, dd_app_key, dd_site, from_time, current_time, False
     )
-    lookback_h = _apm_wall_inactive_lookback_hours()
     if (
         lookback_h > 0
         and int(timerange_hours) < lookback_h
@@ -2554,11 +3633,13 @@ def _sm_fetch_one_service_health_cached(
             "warning",
             "critical",
         ):
-            fb_out = dict(fb_out)
+            fb_out = fb_out.copy()
             fb_out["wall_timerange_hours"] = int(timerange_hours)
             fb_out["wall_effective_lookback_hours"] = lookback_h
             out = fb_out
-    if out.get("status") == "unknown" and _UNKNOWN_RETRY_COUNT > 0:
+    # A service that was already unknown on its last probe gets no in-line sleep retries
+    retry_unknown = not (dormant and dormant.get("status") == "unknown")
+    if out.get("status") == "unknown" and _UNKNOWN_RETRY_COUNT > 0 and retry_unknown:
         for attempt in range(_UNKNOWN_RETRY_COUNT):
             delay = 0.22 * (attempt + 1)
             time.sleep(delay)
@@ -2571,7 +3652,18 @@ def _sm_fetch_one_service_health_cached(
                     f"   🔁 {service} ({env}): unknown → {retry_out.get('status')} after retry {attempt + 1}"
                 )
                 break
-    sm_api_cache_set("dd_service_health", key, out)
+    st = out.get("status")
+    if st == "unknown" or (st == "inactive" and int(out.get("requests") or 0) == 0):
+        _dd_dormant_record(service, env, dd_site, out, dormant, window_h)
+    elif dormant and dormant.get("status"):
+        _dd_dormant_clear(service, env, dd_site)
+    if st == "unknown":
+        # Datadog still failing: keep showing the last known status (within the hard TTL), uncached
+        stale = sm_api_cache_get_stale("dd_service_health", key, cache_hard_ttl(_db_api_cache_ttl))
+        stale_row = ServiceHealth.load(stale[0]) if stale else None
+        if stale_row is not None and stale_row.get("status") not in (None, "unknown"):
+            return stale_row, True
+    sm_api_cache_set("dd_service_health", key, out.to_row(), compute_secs=time.time() - t_fetch)
     return out, False
 
 
@@ -2588,42 +3680,82 @@ def _sm_fetch_parallel_service_health(
 ):
     all_statuses = []
     n_health_tasks = len(services) * len(environments)
-    max_workers = _dd_health_worker_count(n_health_tasks)
     eff_ttl = _effective_db_cache_ttl_secs(force_refresh)
+    cache_hits = 0
+    cache_miss = 0
+    tasks = [(service, env) for service in services for env in environments]
+
+    if tasks and _sm_dd_grouped_health_enabled():
+        # Batch engine: DB cache in one read, then one grouped query set per env for the misses.
+        keys = {t: _dd_health_cache_key(t[0], t[1], timerange_hours, dd_site) for t in tasks}
+        cached = sm_api_cache_get_many("dd_service_health", list(keys.values()), eff_ttl)
+        missing_by_env: dict = {}
+        for t in tasks:
+            row = ServiceHealth.load(cached.get(keys[t]))
+            if row is not None:
+                all_statuses.append(row)
+                cache_hits += 1
+            else:
+                missing_by_env.setdefault(t[1], []).append(t[0])
+        tasks = []
+        for env, env_services in missing_by_env.items():
+            t_fetch = time.time()
+            rows, leftover = _sm_fetch_grouped_env_health(
+                env_services,
+                env,
+                dd_api_key,
+                dd_app_key,
+                dd_site,
+                from_time,
+                current_time,
+                timerange_hours,
+            )
+            if rows:
+                sm_api_cache_set_many(
+                    "dd_service_health",
+                    {
+                        _dd_health_cache_key(svc, env, timerange_hours, dd_site): row.to_row()
+                        for svc, row in rows.items()
+                    },
+                    compute_secs=time.time() - t_fetch,
+                )
+                all_statuses.extend(rows.values())
+                cache_miss += len(rows)
+            tasks.extend((svc, env) for svc in leftover)
+
+    max_workers = _dd_health_worker_count(len(tasks))
     print(
-        f"📡 DD worker pool size: {max_workers} (tasks={n_health_tasks}), "
+        f"📡 DD worker pool size: {max_workers} (tasks={n_health_tasks}, per-service={len(tasks)}), "
         f"DB cache TTL={eff_ttl}s (force_refresh={force_refresh})"
     )
-    cache_hits = 0
-    cache_miss = 0
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = []
-        for service in services:
-            for env in environments:
-                futures.append(
-                    executor.submit(
-                        _sm_fetch_one_service_health_cached,
-                        service,
-                        env,
-                        dd_api_key,
-                        dd_app_key,
-                        dd_site,
-                        from_time,
-                        current_time,
-                        timerange_hours,
-                        force_refresh,
-                    )
+    if tasks:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                submit_in_context(
+                    executor,
+                    _sm_fetch_one_service_health_cached,
+                    service,
+                    env,
+                    dd_api_key,
+                    dd_app_key,
+                    dd_site,
+                    from_time,
+                    current_time,
+                    timerange_hours,
+                    force_refresh,
                 )
-        for future in as_completed(futures):
-            try:
-                row, hit = future.result()
-                all_statuses.append(row)
-                if hit:
-                    cache_hits += 1
-                else:
-                    cache_miss += 1
-            except Exception as e:
-                print(f"Error in parallel execution: {e}")
+                for service, env in tasks
+            ]
+            for future in as_completed(futures):
+                try:
+                    row, hit = future.result()
+                    all_statuses.append(row)
+                    if hit:
+                        cache_hits += 1
+                    else:
+                        cache_miss += 1
+                except Exception as e:
+                    print(f"Error in parallel execution: {e}")
     if cache_hits:
         print(
             f"🗄️ Datadog service health: {cache_hits} from DB cache, {cache_miss} live API "
@@ -2684,34 +3816,18 @@ def _sm_pd_incident_looks_streaming(title_lower: str, service_summary_lower: str
     return False
 
 
-# Escalation policy name (e.g. savant-ep) → substring that should appear in the APM service name
-_PD_STREAMING_EP_SVC_RULES = (
-    ("savant", "savant"),
-    ("cvr", "cvr"),
-    ("adt", "adt"),
-    ("samsung", "samsung"),
-    ("cat", "cat"),
-    ("comcast", "comcast"),
-)
-
-
-def _sm_pd_streaming_ep_team_services(ep_summary: str, services: list) -> list:
+def _sm_pd_streaming_ep_team_services(ep_summary: str, index: ServiceIndex) -> list:
     """
     If the incident is streaming-related and the escalation policy names the team (e.g. savant-ep),
     return monitored services that belong to that stack.
     """
-    if not ep_summary or not services:
+    if not ep_summary or not index.services:
         return []
     esl = ep_summary.lower().strip()
-    found: list = []
-    seen = set()
-    for ep_sub, svc_sub in _PD_STREAMING_EP_SVC_RULES:
+    for ep_sub, svc_sub in PD_STREAMING_EP_SVC_RULES:
         if ep_sub not in esl:
             continue
-        for svc in services:
-            if svc_sub in svc.lower() and svc not in seen:
-                seen.add(svc)
-                found.append(svc)
+        found = index.containing(svc_sub)
         if found:
             return found
     return []
@@ -2741,12 +3857,12 @@ def _sm_pd_incident_search_blob(incident: dict) -> str:
     return " ".join(chunks)
 
 
-def _sm_pd_resolve_fuzzy_pd_services(search_blob: str, services: list) -> list:
+def _sm_pd_resolve_fuzzy_pd_services(search_blob: str, index: ServiceIndex) -> list:
     """
     When the PD title mentions Savant / smart notifications but not the exact DD name,
-    infer monitored services and return names that exist in `services`.
+    infer monitored services and return names that exist in the indexed service list.
     """
-    if not search_blob or not services:
+    if not search_blob or not index.services:
         return []
     combined_lower = search_blob.lower()
     triggers = (
@@ -2760,11 +3876,11 @@ def _sm_pd_resolve_fuzzy_pd_services(search_blob: str, services: list) -> list:
     found: list = []
     seen = set()
 
-    def _add(svc: str) -> None:
-        if svc in seen:
-            return
-        seen.add(svc)
-        found.append(svc)
+    def _add(svcs: list) -> None:
+        for svc in svcs:
+            if svc not in seen:
+                seen.add(svc)
+                found.append(svc)
 
     # 1) Tokens estilo backend-* o servicio con guiones en el texto
     for m in re.finditer(
@@ -2772,64 +3888,22 @@ def _sm_pd_resolve_fuzzy_pd_services(search_blob: str, services: list) -> list:
         search_blob,
         re.I,
     ):
-        tok = m.group(1).lower()
-        for svc in services:
-            sl = svc.lower()
-            if sl == tok or sl.startswith(tok + "-") or tok == sl:
-                _add(svc)
+        _add(index.named_or_prefixed(m.group(1).lower()))
 
     # 2) Savant → cualquier servicio monitorizado con "savant" en el nombre
     if "savant" in combined_lower:
-        for svc in services:
-            if "savant" in svc.lower():
-                _add(svc)
+        _add(index.containing("savant"))
 
     # 3) Smart notification(s) → stack de notificaciones (nombres típicos en APM)
     if any(
         x in combined_lower
         for x in ("smart notification", "smart notifications", "smart-notification")
     ):
-        subs = ("hmsnotification", "partner-notifications", "notificationservice")
-        for svc in services:
-            sl = svc.lower()
-            if any(sub in sl for sub in subs):
-                _add(svc)
+        _add(index.containing("hmsnotification", "partner-notifications", "notificationservice"))
 
     return found
 
 
-# Hyphen segments shared by many monitored service names. If we match `part in title` for these,
-# a title like "backend-hmsgoogleapi ..." flags every `backend-*` service (false positives).
-_PD_FUZZY_PART_BLOCKLIST = frozenset(
-    {
-        "backend",
-        "nginx",
-        "device",
-        "oauth",
-        "partner",
-        "proxy",
-        "logger",
-        "hmsweb",
-        "secret",
-        "mqtt",
-        "broker",
-        "privacy",
-        "registration",
-        "support",
-        "discovery",
-        "directory",
-        "presence",
-        "messaging",
-        "history",
-        "advisor",
-        "geolocation",
-        "mediamigrationscheduler",
-        "automation",  # backend-hmsautomation, scheduler, arloautomation-leader, etc.
-        "arlo",
-    }
-)
-
-
 def _sm_apply_pagerduty_correlation(
     all_statuses, services, environments, environment_slug, pd_incidents, silent: bool = False
 ):
@@ -2840,6 +3914,7 @@ def _sm_apply_pagerduty_correlation(
         if not silent:
             print(f"🔍 Filtering {len(pd_incidents)} PagerDuty incidents (triggered + acknowledged only, last 24h)...")
         recent_active_incidents = []
+        index = service_index(services)
         cutoff_time = datetime.utcnow() - timedelta(hours=24)
         for incident in pd_incidents:
             incident_status = incident.get("status", "").lower()
@@ -2892,32 +3967,17 @@ def _sm_apply_pagerduty_correlation(
                     detected_environments.append("cat_prod")
             if not detected_environments:
                 detected_environments = environments.copy()
-            matched_services = []
-            for service in services:
-                service_lower = service.lower()
-                if service_lower in title or service_lower in service_summary:
-                    for env in detected_environments:
-                        pd_affected_services.add((service, env))
-                        _note_pd_url(service, env)
-                    matched_services.append(service)
-            for service in services:
-                if service not in matched_services:
-                    service_parts = service.split("-")
-                    for part in service_parts:
-                        pl = part.lower()
-                        if (
-                            len(pl) > 4
-                            and pl not in _PD_FUZZY_PART_BLOCKLIST
-                            and pl in title
-                        ):
-                            for env in detected_environments:
-                                pd_affected_services.add((service, env))
-                                _note_pd_url(service, env)
-                            matched_services.append(service)
-                            break
+            # Service name in title / PD service, then a distinctive name part in the title
+            matched_services = index.name_matches(title, service_summary)
+            named = set(matched_services)
+            matched_services += [svc for svc in index.part_matches(title) if svc not in named]
+            for service in matched_services:
+                for env in detected_environments:
+                    pd_affected_services.add((service, env))
+                    _note_pd_url(service, env)
             blob = _sm_pd_incident_search_blob(incident)
             if not matched_services:
-                for svc in _sm_pd_resolve_fuzzy_pd_services(blob, services):
+                for svc in _sm_pd_resolve_fuzzy_pd_services(blob, index):
                     for env in detected_environments:
                         pd_affected_services.add((svc, env))
                         _note_pd_url(svc, env)
@@ -2927,7 +3987,7 @@ def _sm_apply_pagerduty_correlation(
                 ep_summary
                 and _sm_pd_incident_looks_streaming(title, service_summary, blob)
             ):
-                ep_svcs = _sm_pd_streaming_ep_team_services(ep_summary, services)
+                ep_svcs = _sm_pd_streaming_ep_team_services(ep_summary, index)
                 if ep_svcs:
                     for svc in ep_svcs:
                         for env in detected_environments:
@@ -2991,154 +4051,177 @@ def _sm_apply_pagerduty_correlation(
             status_obj["pd_incident_url"] = None
 
 
-def collect_hub_statuses_aligned_with_dashboard(
-    timerange: int, environment_slug: str, pd_incidents_preloaded=None, force_refresh: bool = False
-) -> list:
-    """
-    Same per-service Datadog APM checks + PagerDuty overrides as /statusmonitor/<slug> Summary
-    (no HTML / EKS / Splunk). Hub cards match drill-down counts for the same timerange.
+# Canonical per-environment snapshot: service list, Datadog health (incl. monitor overrides),
+# PagerDuty correlation and EKS clusters computed once per (env slug, timerange). The hub, classic
+# wall, APM catalog wall and dashboard project copies of it, so opening several views at once
+# fetches each environment once. Stored in the view snapshot backend under the same single-flight.
+_ENV_SNAPSHOT_SECS = _status_monitor_int_env("STATUS_MONITOR_ENV_SNAPSHOT_SECS", 60, 10, 900)
 
-    If pd_incidents_preloaded is not None, PagerDuty is not fetched again (hub summary passes one shared list).
-    """
-    dd_api_key = os.getenv("DATADOG_API_KEY")
-    dd_app_key = os.getenv("DATADOG_APP_KEY")
-    dd_site = os.getenv("DATADOG_SITE", "arlo.datadoghq.com")
+
+def _sm_pd_snapshot(force_refresh: bool) -> tuple[dict | None, list]:
+    """(counts, incidents) for correlation; (None, []) without a token or when the pull fails."""
     pd_api_key = os.getenv("PAGERDUTY_API_TOKEN")
-    if not dd_api_key or not dd_app_key:
-        return []
+    if not pd_api_key:
+        return None, []
     try:
-        services, environments = _sm_resolve_services_and_environments(environment_slug)
-    except ValueError as e:
-        print(f"⚠️ Hub aligned: {e}")
-        return []
-    current_time = int(time.time())
-    from_time = current_time - (timerange * 3600)
-    if pd_incidents_preloaded is None:
-        print(
-            f"🧭 Hub (aligned with dashboard): {environment_slug} — {len(services)} services × "
-            f"{len(environments)} env(s), {timerange}h"
-        )
-    all_statuses = _sm_fetch_parallel_service_health(
-        services,
-        environments,
-        dd_api_key,
-        dd_app_key,
-        dd_site,
-        from_time,
-        current_time,
-        int(timerange),
-        force_refresh,
-    )
-    if pd_incidents_preloaded is not None:
-        pd_incidents = list(pd_incidents_preloaded)
-    else:
-        pd_incidents = []
-        if pd_api_key:
-            try:
-                _pd_counts, pd_incidents = get_pagerduty_status_counts(pd_api_key, force_refresh)
-            except Exception as e:
-                print(f"⚠️ Hub: PagerDuty fetch failed: {e}")
-    _sm_apply_pagerduty_correlation(
-        all_statuses,
-        services,
-        environments,
-        environment_slug,
-        pd_incidents,
-        silent=pd_incidents_preloaded is not None,
-    )
-    return all_statuses
+        with perf_phase("pagerduty"):
+            counts, incidents = get_pagerduty_status_counts(pd_api_key, force_refresh)
+        return counts, list(incidents or [])
+    except Exception as e:
+        print(f"⚠️ Env snapshot: PagerDuty fetch failed: {e}")
+        return None, []
 
 
-def _hub_collect_main_three_envs_batched(timerange: int, pd_incidents_preloaded, force_refresh: bool = False) -> dict:
-    """
-    Production + goldendev + goldenqa: one parallel wave each (per-env service list; same
-    as drill-down / bundled lists/ when STATUS_MONITOR_USE_BUNDLED_LISTS=1).
-    """
+def _sm_env_snapshot_compute(slug: str, timerange: int, force_refresh: bool, pd_source=None) -> dict:
     dd_api_key = os.getenv("DATADOG_API_KEY")
     dd_app_key = os.getenv("DATADOG_APP_KEY")
     dd_site = os.getenv("DATADOG_SITE", "arlo.datadoghq.com")
     if not dd_api_key or not dd_app_key:
-        return {"production": [], "goldendev": [], "goldenqa": []}
-    sp, ep = _sm_resolve_services_and_environments("production")
-    sg, eg = _sm_resolve_services_and_environments("goldendev")
-    sq, eq = _sm_resolve_services_and_environments("goldenqa")
-    if len(ep) != 1 or len(eg) != 1 or len(eq) != 1:
-        return {"production": [], "goldendev": [], "goldenqa": []}
-    eprod, egdev, egqa = ep[0], eg[0], eq[0]
+        return {"success": False, "slug": slug, "error": "Datadog API keys not configured", "statuses": []}
+    # Same resolution as _sm_resolve_services_and_environments; the APM resolver source is kept
+    # because the catalog wall reports it (and refuses to build without it).
+    wall_dde = _sm_page_environment_to_wall_dd_env(slug)
+    with perf_phase("services", slug):
+        services, source = resolve_software_catalog_wall_service_names(wall_dde) if wall_dde else ([], None)
+        if services:
+            environments = [_sm_wall_dd_env_to_dd_tag(wall_dde)]
+        else:
+            source = None
+            try:
+                services, environments = _sm_resolve_services_and_environments(slug)
+            except ValueError as e:
+                return {"success": False, "slug": slug, "error": str(e), "statuses": []}
     current_time = int(time.time())
     from_time = current_time - (timerange * 3600)
-    n_tasks = len(sp) + len(sg) + len(sq)
-    if pd_incidents_preloaded is None:
-        print(
-            f"🧭 Hub batch: main 3 envs — {len(sp)}+{len(sg)}+{len(sq)} = {n_tasks} "
-            f"DD tasks, {timerange}h (bundled per env when enabled)"
-        )
-    all_statuses: list = []
+    print(f"🧩 Env snapshot {slug}: {len(services)} services × {len(environments)} env(s), {timerange}h")
+    # PagerDuty overlaps the Datadog fan-out
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        f_pd = submit_in_context(ex, pd_source or (lambda: _sm_pd_snapshot(force_refresh)))
+        with perf_phase("dd_health", slug):
+            statuses = _sm_fetch_parallel_service_health(
+                services,
+                environments,
+                dd_api_key,
+                dd_app_key,
+                dd_site,
+                from_time,
+                current_time,
+                int(timerange),
+                force_refresh,
+            )
+        pd_counts, pd_incidents = f_pd.result()
+    with perf_phase("pd_correlation", slug):
+        _sm_apply_pagerduty_correlation(statuses, services, environments, slug, pd_incidents)
+    eks: list = []
+    if (
+        _classic_status_wall_attach_eks()
+        or _apm_status_wall_attach_eks(wall_dde or "")
+        or _status_monitor_dashboard_attach_eks()
+    ):
+        # Resolved on copies: each view decides whether its rows carry cluster names
+        eks_cache: dict = {}
+        with perf_phase("eks", slug):
+            _attach_eks_clusters_wall([s.copy() for s in statuses], timerange, eks_cache, force_refresh)
+        eks = [[svc, env, names] for (svc, env), names in eks_cache.items()]
+    return {
+        "success": True,
+        "slug": slug,
+        "timerange": int(timerange),
+        "services": list(services),
+        "environments": list(environments),
+        "service_source": source,
+        "statuses": [s.to_row() for s in statuses],
+        "pd_counts": pd_counts,
+        "pd_incidents": pd_incidents,
+        "eks": eks,
+    }
 
-    def _one_fetch(svcs, envs):
-        return _sm_fetch_parallel_service_health(
-            svcs,
-            envs,
-            dd_api_key,
-            dd_app_key,
-            dd_site,
-            from_time,
-            current_time,
-            int(timerange),
-            force_refresh,
-        )
 
-    with ThreadPoolExecutor(max_workers=3) as ex:
-        f1 = ex.submit(_one_fetch, sp, ep)
-        f2 = ex.submit(_one_fetch, sg, eg)
-        f3 = ex.submit(_one_fetch, sq, eq)
-        for fut in as_completed((f1, f2, f3)):
-            try:
-                all_statuses.extend(fut.result())
-            except Exception as e:
-                print(f"❌ Hub batch partial fetch error: {e}")
-    services_union = list(dict.fromkeys([*sp, *sg, *sq]))
-    envs_for_pd = list(dict.fromkeys([*ep, *eg, *eq]))
-    pd_incidents = list(pd_incidents_preloaded) if pd_incidents_preloaded is not None else []
-    if pd_incidents_preloaded is None:
-        pd_api_key = os.getenv("PAGERDUTY_API_TOKEN")
-        if pd_api_key:
+def _sm_env_snapshot(slug: str, timerange: int, force_refresh: bool = False, pd_source=None) -> dict:
+    """
+    Shared snapshot for one environment slug (see _sm_env_snapshot_compute). Reused while younger
+    than STATUS_MONITOR_ENV_SNAPSHOT_SECS (Refresh: the force-refresh grace window); concurrent
+    callers in this process and other workers wait for a single computation.
+    pd_source() may supply (counts, incidents) so a batch of environments shares one PagerDuty pull.
+    """
+    cache_key = f"env_snapshot_v1_{slug}_{int(timerange)}"
+    ttl = float(_ENV_SNAPSHOT_SECS)
+    hit = _sm_snapshot_cache().get(cache_key)
+    if hit is None or time.time() - hit[1] >= ttl:
+        hit = _sm_adopt_shared_snapshot(cache_key) or hit
+    if hit is not None:
+        snap, saved = hit
+        now = time.time()
+        if force_refresh:
+            if now - saved < _FORCE_REFRESH_GRACE_SECS:
+                return snap
+        else:
+            with _swr_lock:
+                compute_secs = _swr_compute_secs.get(cache_key, 0.0)
+            if entry_is_fresh(cache_key, saved, ttl, compute_secs, now=now):
+                return snap
+    snap, _saved = _sm_swr_refresh(
+        cache_key,
+        lambda fr: _sm_env_snapshot_compute(slug, int(timerange), fr, pd_source),
+        lambda o: isinstance(o, dict) and o.get("success") is True,
+        force_refresh,
+        ttl,
+    )
+    return snap
+
+
+def _sm_env_snapshots(slugs, timerange: int, force_refresh: bool = False) -> dict:
+    """{slug: snapshot} for several environments in parallel, sharing one PagerDuty pull."""
+    slugs = list(dict.fromkeys(slugs))
+    pd_lock = threading.Lock()
+    pd_box: list = []
+
+    def pd_once():
+        with pd_lock:
+            if not pd_box:
+                pd_box.append(_sm_pd_snapshot(force_refresh))
+            return pd_box[0]
+
+    out: dict = {}
+    if not slugs:
+        return out
+    with ThreadPoolExecutor(max_workers=max(1, min(STATUS_MONITOR_HUB_PARALLEL_ENVS, len(slugs)))) as ex:
+        futs = {
+            slug: submit_in_context(ex, _sm_env_snapshot, slug, timerange, force_refresh, pd_once)
+            for slug in slugs
+        }
+        for slug, fut in futs.items():
             try:
-                _pd_counts, pd_incidents = get_pagerduty_status_counts(pd_api_key, force_refresh)
+                out[slug] = fut.result()
             except Exception as e:
-                print(f"⚠️ Hub batch: PagerDuty fetch failed: {e}")
-    _sm_apply_pagerduty_correlation(
-        all_statuses, services_union, envs_for_pd, None, pd_incidents, silent=pd_incidents_preloaded is not None
-    )
-    out = {"production": [], "goldendev": [], "goldenqa": []}
+                print(f"❌ Env snapshot error for {slug}: {e}")
+                out[slug] = {"success": False, "slug": slug, "error": str(e), "statuses": []}
+    return out
 
-    def _hub_main_three_bucket_key(env) -> str | None:
-        """Map DD env tag onto hub keys so Status wall / hub batch never drops rows on alias mismatch."""
-        if env is None:
-            return None
-        s = str(env).strip().lower()
-        if s in ("production", "prod"):
-            return "production"
-        if s == "goldendev":
-            return "goldendev"
-        if s == "goldenqa":
-            return "goldenqa"
-        return None
 
-    for s in all_statuses:
-        key = _hub_main_three_bucket_key(s.get("environment"))
-        if key in out:
-            out[key].append(s)
+def _sm_env_snapshot_rows(snap: dict) -> list:
+    """Fresh ServiceHealth records for a snapshot's rows (views sort, filter and annotate them in place)."""
+    rows = (ServiceHealth.load(r) for r in (snap or {}).get("statuses") or [])
+    return [r for r in rows if r is not None]
+
+
+def _sm_env_snapshot_eks(snaps) -> dict:
+    """(service, env) -> cluster names from snapshots, shaped as an _attach_eks_clusters_wall cache."""
+    out: dict = {}
+    for snap in snaps:
+        for svc, env, names in (snap or {}).get("eks") or []:
+            out[(svc, env)] = list(names or [])
     return out
 
 
-def _fetch_datadog_statuses_for_mode(
-    timerange: int, mode: str, pd_incidents_preloaded=None, force_refresh: bool = False
+def collect_hub_statuses_aligned_with_dashboard(
+    timerange: int, environment_slug: str, force_refresh: bool = False
 ) -> list:
-    """Hub summary: same logic as drill-down for this environment slug."""
-    return collect_hub_statuses_aligned_with_dashboard(
-        timerange, mode, pd_incidents_preloaded, force_refresh
-    )
+    """
+    Same per-service Datadog APM checks + PagerDuty overrides as /statusmonitor/<slug> Summary
+    (no HTML / Splunk): rows of the shared env snapshot, so hub cards match drill-down counts.
+    """
+    return _sm_env_snapshot_rows(_sm_env_snapshot(environment_slug, int(timerange), force_refresh))
 
 
 def _hub_service_alert_count(s: dict) -> int:
@@ -3370,70 +4453,14 @@ def _hub_dd_alerts_rollup(statuses: list) -> tuple[int, int]:
     n_svcs = 0
     for s in statuses or []:
         n_c = int(s.get("dd_monitor_alert_count") or 0) or len(s.get("dd_monitor_alerts") or [])
-        n_s = int(s.get("dd_monitor_alert_suffix_count") or 0) or len(
-            s.get("dd_monitor_alerts_suffix_ab") or []
-        )
-        n = n_c + n_s
-        if n > 0:
-            n_svcs += 1
-        tot += n
-    return int(tot), int(n_svcs)
-
-
-def _hub_collect_statuses_by_mode(
-    timerange: int, log_label: str = "Hub summary", force_refresh: bool = False
-) -> dict:
-    """
-    One shared PagerDuty pull + parallel Datadog per hub mode (same layout as hub drill-down).
-    Returns dict mode -> list of per-service status dicts.
-    """
-    pd_api_key = os.getenv("PAGERDUTY_API_TOKEN")
-    pd_incidents_shared = []
-    if pd_api_key:
-        try:
-            _pd_counts_hub, pd_incidents_shared = get_pagerduty_status_counts(
-                pd_api_key, force_refresh
-            )
-            print(
-                f"🧭 {log_label}: shared PagerDuty pull — {len(pd_incidents_shared)} incident(s) "
-                f"(triggered/ack for correlation)"
-            )
-        except Exception as e:
-            print(f"⚠️ {log_label}: PagerDuty fetch failed: {e}")
-
-    statuses_by_mode = {}
-    with ThreadPoolExecutor(max_workers=STATUS_MONITOR_HUB_PARALLEL_ENVS) as ex:
-        f_batch = ex.submit(
-            _hub_collect_main_three_envs_batched, timerange, pd_incidents_shared, force_refresh
+        n_s = int(s.get("dd_monitor_alert_suffix_count") or 0) or len(
+            s.get("dd_monitor_alerts_suffix_ab") or []
         )
-        f_extra = {}
-        for row in HUB_ENV_ROWS:
-            if row["mode"] in ("production", "goldendev", "goldenqa"):
-                continue
-            f_extra[row["mode"]] = ex.submit(
-                _fetch_datadog_statuses_for_mode,
-                timerange,
-                row["mode"],
-                pd_incidents_shared,
-                force_refresh,
-            )
-        try:
-            main_three = f_batch.result()
-            statuses_by_mode["production"] = main_three.get("production", [])
-            statuses_by_mode["goldendev"] = main_three.get("goldendev", [])
-            statuses_by_mode["goldenqa"] = main_three.get("goldenqa", [])
-        except Exception as e:
-            print(f"❌ Hub batch (main 3 envs) error: {e}")
-            statuses_by_mode["production"] = []
-            statuses_by_mode["goldendev"] = []
-            statuses_by_mode["goldenqa"] = []
-        for mode, fut in f_extra.items():
-            try:
-                statuses_by_mode[mode] = fut.result()
-            except Exception as e:
-                print(f"❌ {log_label} error for {mode}: {e}")
-                statuses_by_mode[mode] = []
-    return statuses_by_mode
+        n = n_c + n_s
+        if n > 0:
+            n_svcs += 1
+        tot += n
+    return int(tot), int(n_svcs)
 
 
 def _wall_status_reason_plain(s: dict) -> str:
@@ -3621,7 +4648,8 @@ def _wall_fetch_monitor_badges(timerange: int, force_refresh: bool) -> dict:
         from tools.splunk_tool import splunk_outliers_monitor_payload
 
         # P0 semaphore: default P0 lookback (splunk_p0_default_timerange_hours), not the wall’s DD timerange
-        spl = splunk_outliers_monitor_payload()
+        with perf_phase("splunk"):
+            spl = splunk_outliers_monitor_payload()
         spl_badge = _wall_splunk_badge(spl)
     except Exception as e:
         spl_badge = {
@@ -3712,26 +4740,46 @@ def status_monitor_wall_data(timerange: int = 1, force_refresh: bool = False) ->
 
     Wall shows only operational tiles (healthy / warning / critical). inactive and
     unknown are omitted so the screen stays focused on live APM signal + issues.
+    Served stale-while-revalidate; ``snapshot`` carries the payload age.
     """
-    global _wall_data_cache
-    cache_version = "wall_v22_dd_ab_green_pill"
-    cache_key = f"{cache_version}_{timerange}_{int(time.time() // _cache_ttl)}"
-    hit = _read_sm_mem_cache(_wall_data_cache, cache_key, force_refresh)
-    if hit is not None:
-        return dict(hit)
+    cache_key, ttl, compute, cacheable = _sm_wall_view_spec("wall", timerange)
+    out, meta = _sm_swr_serve(cache_key, ttl, compute, force_refresh, cacheable=cacheable)
+    return {**out, "snapshot": meta}
 
-    # Overlap hub Datadog fan-out with PD+Splunk badge fetch (saves wall-clock vs sequential).
+
+def _sm_wall_view_spec(view: str, timerange: int, dd_env: str = "all"):
+    """(cache_key, ttl, compute, cacheable) for the /statuswall ("wall") or /apm-services ("apm") view."""
+    if view == "wall":
+        return (
+            f"wall_v22_dd_ab_green_pill_{timerange}",
+            _cache_ttl,
+            lambda fr: _status_monitor_wall_data_compute(timerange, fr),
+            None,
+        )
+    dde = normalize_software_catalog_wall_dd_env(dd_env)
+    return (
+        f"sc_wall_v50_adt_splunk_light_{dde}_{timerange}",
+        _apm_status_wall_cache_bucket_secs(),
+        lambda fr: _status_monitor_software_catalog_wall_data_compute(dde, timerange, fr),
+        lambda o: isinstance(o, dict) and o.get("success") is not False and "groups" in o,
+    )
+
+
+def _status_monitor_wall_data_compute(timerange: int, force_refresh: bool) -> dict:
+    # Overlap the env snapshots (Datadog fan-out) with PD+Splunk badge fetch (saves wall-clock vs sequential).
     with ThreadPoolExecutor(max_workers=2) as _wall_pool:
-        f_hub = _wall_pool.submit(_hub_collect_statuses_by_mode, timerange, "Status wall", force_refresh)
-        f_badges = _wall_pool.submit(_wall_fetch_monitor_badges, timerange, force_refresh)
-        statuses_by_mode = f_hub.result()
+        f_snaps = submit_in_context(
+            _wall_pool, _sm_env_snapshots, [g["mode"] for g in WALL_DISPLAY_GROUPS], timerange, force_refresh
+        )
+        f_badges = submit_in_context(_wall_pool, _wall_fetch_monitor_badges, timerange, force_refresh)
+        snaps = f_snaps.result()
         monitors = f_badges.result()
     dd_site = os.getenv("DD_SITE", "datadoghq.com")
     groups = []
-    eks_wall_cache = {}
+    eks_wall_cache = _sm_env_snapshot_eks(snaps.values())
     for g in WALL_DISPLAY_GROUPS:
         mode = g["mode"]
-        statuses = list(statuses_by_mode.get(mode) or [])
+        statuses = _sm_env_snapshot_rows(snaps.get(mode))
         if mode == "samsung":
             _blw = _sm_bundled_status_monitor_service_list("samsung")
             canon = set(_blw) if _blw is not None else set(SAMSUNG_MONITOR_SERVICES)
@@ -3757,7 +4805,8 @@ def status_monitor_wall_data(timerange: int = 1, force_refresh: bool = False) ->
         else:
             overall = "healthy"
 
-        ser = [_wall_serialize_status(s, dd_site, mode, timerange) for s in statuses]
+        with perf_phase("render", mode):
+            ser = [_wall_serialize_status(s, dd_site, mode, timerange) for s in statuses]
         if mode in ("adt", "samsung", "cat", "comcast"):
             region_columns = [
                 {
@@ -3803,9 +4852,7 @@ def status_monitor_wall_data(timerange: int = 1, force_refresh: bool = False) ->
             }
         )
 
-    out = {"success": True, "timerange": timerange, "monitors": monitors, "groups": groups}
-    _write_sm_mem_cache(_wall_data_cache, cache_key, out)
-    return dict(out)
+    return {"success": True, "timerange": timerange, "monitors": monitors, "groups": groups}
 
 
 def _software_catalog_fallback_service_names() -> list:
@@ -3847,8 +4894,6 @@ def _fetch_datadog_apm_service_names_for_env(
     Services registered in Datadog APM for this env (Software Catalog /software?env=…).
     GET /api/v2/apm/services — matches the production list (~129–133), not a static file.
     """
-    import requests
-
     env = (dd_env or "production").strip() or "production"
     base = f"{datadog_rest_api_base(dd_site)}/api/v2/apm/services"
     headers = {
@@ -3857,7 +4902,7 @@ def _fetch_datadog_apm_service_names_for_env(
         "Accept": "application/json",
     }
     try:
-        r = requests.get(
+        r = datadog_get(
             base,
             headers=headers,
             params={"filter[env]": env},
@@ -3983,7 +5028,6 @@ def _fetch_software_catalog_service_names_from_api(
         except (TypeError, ValueError):
             max_entities = 150
     max_entities = max(10, min(int(max_entities), 500))
-    import requests
 
     base = f"{datadog_rest_api_base(dd_site)}/api/v2/catalog/entity"
     headers = {
@@ -4002,7 +5046,7 @@ def _fetch_software_catalog_service_names_from_api(
             "includeDiscovered": "true",
         }
         try:
-            r = requests.get(base, headers=headers, params=params, timeout=(15, 60))
+            r = datadog_get(base, headers=headers, params=params, timeout=(15, 60))
         except Exception as e:
             print(f"⚠️ Software catalog API request failed: {e}")
             return None
@@ -4220,6 +5264,48 @@ def normalize_software_catalog_wall_dd_env(raw: str | None) -> str:
     return "production"
 
 
+# Env vars that change what the wall service resolver returns (part of its memo key)
+_SM_SERVICE_LIST_ENV_PREFIXES = (
+    "SOFTWARE_CATALOG_",
+    "APM_STATUS_WALL_",
+    "SAMSUNG_",
+    "STATUS_MONITOR_USE_BUNDLED_LISTS",
+)
+# Datadog APM list expected but a bundled fallback answered: retry the API sooner than the full TTL
+_SM_SERVICE_LIST_FALLBACK_TTL_SECS = 30
+
+
+def _sm_service_list_deps() -> tuple:
+    """List files the resolver may read; a change to any of them invalidates memoized lists."""
+    return (
+        _bundled_production_apm_127_path(),
+        _bundled_goldendev_apm_path(),
+        _bundled_goldenqa_apm_path(),
+        _bundled_adt_apm_path(),
+        _bundled_cat_apm_path(),
+        _bundled_comcast_apm_path(),
+        _bundled_qa_apm_path(),
+        _bundled_samsung_apm_path(),
+        (os.getenv("SOFTWARE_CATALOG_SERVICE_LIST_FILE") or "").strip() or None,
+    )
+
+
+_sm_service_list_inputs_memo: list = [-2.0, (), ()]
+
+
+def _sm_service_list_inputs() -> tuple[tuple, tuple]:
+    """(env key, dependency paths) — env is scanned at most once a second, not once per lookup."""
+    now = time.monotonic()
+    memo = _sm_service_list_inputs_memo
+    if now - memo[0] > 1.0:
+        scoped = sorted((k, v) for k, v in os.environ.items() if k.startswith(_SM_SERVICE_LIST_ENV_PREFIXES))
+        has_keys = bool(os.getenv("DATADOG_API_KEY") and os.getenv("DATADOG_APP_KEY"))
+        memo[1] = (tuple(scoped), os.getenv("DATADOG_SITE"), has_keys)
+        memo[2] = _sm_service_list_deps()
+        memo[0] = now
+    return memo[1], memo[2]
+
+
 def resolve_software_catalog_wall_service_names(
     dd_env: str = "production",
 ) -> tuple[list, str]:
@@ -4231,7 +5317,33 @@ def resolve_software_catalog_wall_service_names(
     disable with USE_BUNDLED_127, USE_BUNDLED_GOLDENDEV, USE_BUNDLED_GOLDENQA, USE_BUNDLED_ADT,
     USE_BUNDLED_QA, USE_BUNDLED_SAMSUNG=0
     → optional catalog API → ADT+GENERAL union.
+
+    Memoized in the service registry for STATUS_MONITOR_SERVICE_LIST_TTL_SECS; a list file
+    change or a service-list env var change resolves again.
     """
+    ttl = service_registry.SERVICE_LIST_TTL_SECS
+    if ttl <= 0:
+        return _resolve_software_catalog_wall_service_names_uncached(dd_env)
+    dde = normalize_software_catalog_wall_dd_env(dd_env)
+
+    def _build():
+        names, source = _resolve_software_catalog_wall_service_names_uncached(dde)
+        keep = ttl
+        if (
+            _software_catalog_wall_use_dd_apm_list(dde)
+            and os.getenv("DATADOG_API_KEY")
+            and os.getenv("DATADOG_APP_KEY")
+            and not str(source).startswith(("dd_apm", "env_csv", "file"))
+        ):
+            keep = min(ttl, _SM_SERVICE_LIST_FALLBACK_TTL_SECS)
+        return (tuple(names), source), keep
+
+    env_key, deps = _sm_service_list_inputs()
+    names, source = service_registry.resolved(("apm_wall_services", dde, env_key), deps, _build)
+    return list(names), source
+
+
+def _resolve_software_catalog_wall_service_names_uncached(dd_env: str) -> tuple[list, str]:
     _dd_env = normalize_software_catalog_wall_dd_env(dd_env)
     if _dd_env == "all":
         return (
@@ -4610,11 +5722,11 @@ def _software_catalog_wall_payload_for_single_env(
     dde: str,
     timerange: int,
     force_refresh: bool,
-    pre_pd: tuple[dict, list] | None = None,
+    snap: dict | None = None,
 ) -> dict:
     """
     One APM software-catalog wall response (one `groups` item). `dde` is never "all".
-    If `pre_pd` is (PagerDuty counts dict, incidents list), reuses that fetch (for all-env build).
+    Projects the shared env snapshot; `snap` skips the lookup when the caller already holds it.
     """
     dd_api_key = os.getenv("DATADOG_API_KEY")
     dd_app_key = os.getenv("DATADOG_APP_KEY")
@@ -4628,70 +5740,41 @@ def _software_catalog_wall_payload_for_single_env(
             "groups": [],
         }
 
-    services, _source = resolve_software_catalog_wall_service_names(dde)
-    if not services:
+    pd_slug = _sm_wall_dde_to_page_slug(dde)
+    wall_mode = pd_slug
+    if snap is None:
+        snap = _sm_env_snapshot(pd_slug, int(timerange), force_refresh)
+    services = list(snap.get("services") or [])
+    _source = snap.get("service_source")
+    if not snap.get("success") or not services or _source is None:
         return {
             "success": False,
-            "error": f"No services resolved for APM software catalog wall (env={dde})",
+            "error": snap.get("error") or f"No services resolved for APM software catalog wall (env={dde})",
             "timerange": timerange,
             "dd_env": dde,
             "groups": [],
         }
 
-    current_time = int(time.time())
-    from_time = current_time - (timerange * 3600)
-    environments = [_sm_wall_dd_env_to_dd_tag(dde)]
-    pd_slug = _sm_wall_dde_to_page_slug(dde)
-    wall_mode = pd_slug
-
+    environments = list(snap.get("environments") or [])
     pd_api_key = os.getenv("PAGERDUTY_API_TOKEN")
-    if pre_pd is not None:
-        _pd_c, pd_incidents = pre_pd
-    else:
-        _pd_c = {"triggered": 0, "acknowledged": 0, "resolved": 0}
-        pd_incidents: list = []
-        if pd_api_key:
-            try:
-                _pd_c, pd_incidents = get_pagerduty_status_counts(
-                    pd_api_key, force_refresh
-                )
-            except Exception as e:
-                print(f"⚠️ Software catalog wall: PagerDuty fetch failed: {e}")
-
-    all_statuses = _sm_fetch_parallel_service_health(
-        services,
-        environments,
-        dd_api_key,
-        dd_app_key,
-        dd_site,
-        from_time,
-        current_time,
-        int(timerange),
-        force_refresh,
-    )
-    _sm_apply_pagerduty_correlation(
-        all_statuses,
-        services,
-        environments,
-        pd_slug,
-        pd_incidents,
-        silent=False,
-    )
+    _pd_c = snap.get("pd_counts")
+    all_statuses = _sm_env_snapshot_rows(snap)
     n_inactive = sum(1 for s in all_statuses if s.get("status") == "inactive")
     n_unknown = sum(1 for s in all_statuses if s.get("status") == "unknown")
-    statuses, wall_meta = _apm_wall_finalize_statuses(
-        all_statuses,
-        services,
-        dde,
-        environments[0] if environments else dde,
-        dd_api_key=dd_api_key,
-        dd_app_key=dd_app_key,
-        dd_site=dd_site,
-    )
+    with perf_phase("finalize", dde):
+        statuses, wall_meta = _apm_wall_finalize_statuses(
+            all_statuses,
+            services,
+            dde,
+            environments[0] if environments else dde,
+            dd_api_key=dd_api_key,
+            dd_app_key=dd_app_key,
+            dd_site=dd_site,
+        )
     n_dropped_other = int(wall_meta.get("dropped_other") or 0)
     owner_by_service = wall_meta.get("owner_by_service")
     if _apm_status_wall_attach_eks(dde):
-        eks_wall_cache: dict = {}
+        eks_wall_cache = _sm_env_snapshot_eks([snap])
         _attach_eks_clusters_wall(statuses, timerange, eks_wall_cache, force_refresh)
 
     h = sum(1 for s in statuses if s.get("status") == "healthy")
@@ -4707,7 +5790,8 @@ def _software_catalog_wall_payload_for_single_env(
         overall = "healthy"
 
     dd_site_ser = os.getenv("DD_SITE", "datadoghq.com")
-    ser = [_wall_serialize_status(s, dd_site_ser, wall_mode, timerange) for s in statuses]
+    with perf_phase("render", dde):
+        ser = [_wall_serialize_status(s, dd_site_ser, wall_mode, timerange) for s in statuses]
     if dde == "samsung_prod":
         region_columns = [
             {
@@ -4813,16 +5897,8 @@ def _status_monitor_software_catalog_wall_data_all_envs(
 ) -> dict:
     """
     APM /apm-services: one `groups` section per env in SOFTWARE_CATALOG_WALL_APM_ENVS.
-    PagerDuty is fetched once and reused.
+    Env snapshots are built together, sharing one PagerDuty pull.
     """
-    pre_pd: tuple[dict, list] | None = None
-    pd_api_key = os.getenv("PAGERDUTY_API_TOKEN")
-    if pd_api_key:
-        try:
-            pre_pd = get_pagerduty_status_counts(pd_api_key, force_refresh)
-        except Exception as e:
-            print(f"⚠️ Software catalog wall (all): PagerDuty fetch failed: {e}")
-
     groups: list = []
     per_env_sources: list = []
     tot_in = 0
@@ -4831,17 +5907,24 @@ def _status_monitor_software_catalog_wall_data_all_envs(
     tot_du = 0
     monitors: dict = {}
 
+    snaps = _sm_env_snapshots(
+        [_sm_wall_dde_to_page_slug(d) for d in SOFTWARE_CATALOG_WALL_APM_ENVS], timerange, force_refresh
+    )
     with ThreadPoolExecutor(
         max_workers=max(1, min(6, len(SOFTWARE_CATALOG_WALL_APM_ENVS)))
     ) as ex:
-        results: list[dict] = list(
-            ex.map(
-                lambda d: _software_catalog_wall_payload_for_single_env(
-                    d, timerange, force_refresh, pre_pd=pre_pd
-                ),
-                list(SOFTWARE_CATALOG_WALL_APM_ENVS),
+        futs = [
+            submit_in_context(
+                ex,
+                _software_catalog_wall_payload_for_single_env,
+                d,
+                timerange,
+                force_refresh,
+                snaps.get(_sm_wall_dde_to_page_slug(d)),
             )
-        )
+            for d in SOFTWARE_CATALOG_WALL_APM_ENVS
+        ]
+        results: list[dict] = [f.result() for f in futs]
     for i, dde in enumerate(SOFTWARE_CATALOG_WALL_APM_ENVS):
         part = results[i]
         if not part.get("success"):
@@ -4906,14 +5989,6 @@ def _status_monitor_software_catalog_wall_data_golden_envs(
     """
     APM /apm-services Golden tab: goldendev then goldenqa only.
     """
-    pre_pd: tuple[dict, list] | None = None
-    pd_api_key = os.getenv("PAGERDUTY_API_TOKEN")
-    if pd_api_key:
-        try:
-            pre_pd = get_pagerduty_status_counts(pd_api_key, force_refresh)
-        except Exception as e:
-            print(f"⚠️ Software catalog wall (golden): PagerDuty fetch failed: {e}")
-
     groups: list = []
     per_env_sources: list = []
     tot_in = 0
@@ -4923,17 +5998,22 @@ def _status_monitor_software_catalog_wall_data_golden_envs(
     monitors: dict = {}
 
     golden_envs = SOFTWARE_CATALOG_WALL_GOLDEN_ENVS
+    snaps = _sm_env_snapshots([_sm_wall_dde_to_page_slug(d) for d in golden_envs], timerange, force_refresh)
     with ThreadPoolExecutor(
         max_workers=max(1, min(4, len(golden_envs)))
     ) as ex:
-        results: list[dict] = list(
-            ex.map(
-                lambda d: _software_catalog_wall_payload_for_single_env(
-                    d, timerange, force_refresh, pre_pd=pre_pd
-                ),
-                list(golden_envs),
+        futs = [
+            submit_in_context(
+                ex,
+                _software_catalog_wall_payload_for_single_env,
+                d,
+                timerange,
+                force_refresh,
+                snaps.get(_sm_wall_dde_to_page_slug(d)),
             )
-        )
+            for d in golden_envs
+        ]
+        results: list[dict] = [f.result() for f in futs]
     for i, dde in enumerate(golden_envs):
         part = results[i]
         if not part.get("success"):
@@ -4998,17 +6078,14 @@ def status_monitor_software_catalog_wall_data(
     """
     APM /apm-services: default `all` = one `groups` section per env; or a single `dd_env`
     (production, goldendev, …) for a focused list only.
-    Same APM+PD+health rules. Inactive/unknown omitted.
+    Same APM+PD+health rules. Inactive/unknown omitted. Served stale-while-revalidate.
     """
-    global _software_catalog_wall_cache
-    dde = normalize_software_catalog_wall_dd_env(dd_env)
-    cache_version = "sc_wall_v50_adt_splunk_light"
-    apm_bucket = _apm_status_wall_cache_bucket_secs()
-    cache_key = f"{cache_version}_{dde}_{timerange}_{int(time.time() // apm_bucket)}"
-    hit = _read_sm_mem_cache(_software_catalog_wall_cache, cache_key, force_refresh)
-    if hit is not None:
-        return dict(hit)
+    cache_key, ttl, compute, cacheable = _sm_wall_view_spec("apm", timerange, dd_env)
+    out, meta = _sm_swr_serve(cache_key, ttl, compute, force_refresh, cacheable=cacheable)
+    return {**out, "snapshot": meta}
+
 
+def _status_monitor_software_catalog_wall_data_compute(dde: str, timerange: int, force_refresh: bool) -> dict:
     if dde == "all":
         out = _status_monitor_software_catalog_wall_data_all_envs(
             timerange, force_refresh
@@ -5018,12 +6095,8 @@ def status_monitor_software_catalog_wall_data(
             timerange, force_refresh
         )
     else:
-        out = _software_catalog_wall_payload_for_single_env(
-            dde, timerange, force_refresh, pre_pd=None
-        )
-    if out.get("success") is not False and isinstance(out, dict) and "groups" in out:
-        _write_sm_mem_cache(_software_catalog_wall_cache, cache_key, out)
-    return dict(out)
+        out = _software_catalog_wall_payload_for_single_env(dde, timerange, force_refresh)
+    return out
 
 
 def status_monitor_hub_summary(timerange: int = 1, force_refresh: bool = False) -> dict:
@@ -5032,33 +6105,34 @@ def status_monitor_hub_summary(timerange: int = 1, force_refresh: bool = False)
 
     Production, Samsung, and ADT cards reuse the APM Status Wall pipeline so overall
     colors match /apm-services. Other environments use the legacy hub resolver.
+    Served stale-while-revalidate; ``snapshot`` carries the payload age.
     """
-    global _hub_summary_cache
-    cache_version = "hub_v22_issue_services"
-    cache_key = f"{cache_version}_{timerange}_{int(time.time() // _cache_ttl)}"
-    hit = _read_sm_mem_cache(_hub_summary_cache, cache_key, force_refresh)
-    if hit is not None:
-        return dict(hit)
+    cache_key = f"hub_v22_issue_services_{timerange}"
+    out, meta = _sm_swr_serve(
+        cache_key,
+        _cache_ttl,
+        lambda fr: _status_monitor_hub_summary_compute(timerange, fr),
+        force_refresh,
+    )
+    return {**out, "snapshot": meta}
 
-    pre_pd: tuple[dict, list] | None = None
-    pd_api_key = os.getenv("PAGERDUTY_API_TOKEN")
-    if pd_api_key:
-        try:
-            pre_pd = get_pagerduty_status_counts(pd_api_key, force_refresh)
-        except Exception as e:
-            print(f"⚠️ Hub summary: PagerDuty fetch failed: {e}")
+
+def _status_monitor_hub_summary_compute(timerange: int, force_refresh: bool) -> dict:
+    # Every card projects the same env snapshots the walls and dashboards use
+    snaps = _sm_env_snapshots([row["mode"] for row in HUB_ENV_ROWS], timerange, force_refresh)
 
     wall_by_slug: dict[str, dict] = {}
     wall_rows = [r for r in HUB_ENV_ROWS if r["slug"] in HUB_WALL_ALIGNED_SLUGS]
     if wall_rows:
         with ThreadPoolExecutor(max_workers=max(1, len(wall_rows))) as ex:
             futs = {
-                row["slug"]: ex.submit(
+                row["slug"]: submit_in_context(
+                    ex,
                     _software_catalog_wall_payload_for_single_env,
                     HUB_SLUG_TO_WALL_DD_ENV[row["slug"]],
                     timerange,
                     force_refresh,
-                    pre_pd,
+                    snaps.get(row["mode"]),
                 )
                 for row in wall_rows
             }
@@ -5069,8 +6143,6 @@ def status_monitor_hub_summary(timerange: int = 1, force_refresh: bool = False)
                     print(f"❌ Hub wall-aligned fetch error for {slug}: {e}")
                     wall_by_slug[slug] = {"success": False, "error": str(e)}
 
-    statuses_by_mode = _hub_collect_statuses_by_mode(timerange, "Hub summary", force_refresh)
-
     env_payload = []
     for row in HUB_ENV_ROWS:
         if row["slug"] in HUB_WALL_ALIGNED_SLUGS:
@@ -5078,7 +6150,7 @@ def status_monitor_hub_summary(timerange: int = 1, force_refresh: bool = False)
             if wall_payload.get("success") is not False and wall_payload.get("groups"):
                 env_payload.append(_hub_entry_from_wall_payload(row, wall_payload))
                 continue
-        statuses = statuses_by_mode.get(row["mode"], [])
+        statuses = _sm_env_snapshot_rows(snaps.get(row["mode"]))
         if row["slug"] == "samsung":
             _bl = _sm_bundled_status_monitor_service_list("samsung")
             canon = set(_bl) if _bl is not None else set(SAMSUNG_MONITOR_SERVICES)
@@ -5090,9 +6162,7 @@ def status_monitor_hub_summary(timerange: int = 1, force_refresh: bool = False)
     order = {row["slug"]: i for i, row in enumerate(HUB_ENV_ROWS)}
     env_payload.sort(key=lambda r: order.get(r["slug"], 99))
 
-    out = {"success": True, "timerange": timerange, "environments": env_payload}
-    _write_sm_mem_cache(_hub_summary_cache, cache_key, out)
-    return dict(out)
+    return {"success": True, "timerange": timerange, "environments": env_payload}
 
 
 def _splunk_p0_zone_hover_title(label: str, zones_list) -> str:
@@ -5327,17 +6397,30 @@ def _samsung_splunk_embed_aside_html() -> str:
 
 
 # Incremental /statusmonitor loads: merge per-env APM before command center + summary.
+# Partial POSTs can land on any gunicorn worker, so shared sessions also write each fetched piece
+# (one row per env, one for PagerDuty/Arlo) to status_monitor_api_cache; a worker that did not
+# fetch a piece reads it from there. The single-request stream keeps its session in-process only.
 _sm_incr_sessions: dict = {}
 _sm_incr_lock = threading.Lock()
 _SM_INCR_TTL_SECS = 900
+_SM_INCR_KIND = "sm_incr_session"
+_SM_INCR_STREAM_WORKERS = _status_monitor_int_env("STATUS_MONITOR_INCR_STREAM_WORKERS", 8, 1, 32)
+_SM_INCR_STREAM_KEEPALIVE_SECS = 15
+_sm_incr_db_purged_at = 0.0
 
 
 def _sm_incr_purge_sessions() -> None:
+    global _sm_incr_db_purged_at
     now = time.time()
     with _sm_incr_lock:
         dead = [k for k, v in _sm_incr_sessions.items() if now - float(v.get("created") or 0) > _SM_INCR_TTL_SECS]
         for k in dead:
             _sm_incr_sessions.pop(k, None)
+        purge_db = now - _sm_incr_db_purged_at > 60
+        if purge_db:
+            _sm_incr_db_purged_at = now
+    if purge_db:
+        sm_api_cache_purge(_SM_INCR_KIND, _SM_INCR_TTL_SECS)
 
 
 def _sm_incr_session_ensure(
@@ -5348,6 +6431,7 @@ def _sm_incr_session_ensure(
     force_refresh: bool,
     services: list,
     dd_environments: list,
+    shared: bool = True,
 ) -> dict:
     _sm_incr_purge_sessions()
     with _sm_incr_lock:
@@ -5360,7 +6444,9 @@ def _sm_incr_session_ensure(
                 "force_refresh": bool(force_refresh),
                 "services": list(services),
                 "dd_environments": list(dd_environments),
+                "shared": bool(shared),
                 "statuses_by_env": {},
+                "pd_loaded": False,
                 "pd_counts": {"triggered": 0, "acknowledged": 0, "resolved": 0},
                 "pd_incidents": [],
                 "arlo_services_status": [],
@@ -5369,11 +6455,72 @@ def _sm_incr_session_ensure(
         return sess
 
 
+def _sm_incr_store_env(session_id: str, dd_env: str, statuses: list) -> None:
+    sess = _sm_incr_sessions.get(session_id)
+    if sess is None:
+        return
+    with _sm_incr_lock:
+        sess.setdefault("statuses_by_env", {})[dd_env] = list(statuses)
+    if sess.get("shared"):
+        sm_api_cache_set(_SM_INCR_KIND, f"{session_id}:env:{dd_env}", [s.to_row() for s in statuses])
+
+
+def _sm_incr_store_sidebar(session_id: str, pd_counts: dict, pd_incidents: list, arlo_services_status: list) -> None:
+    sess = _sm_incr_sessions.get(session_id)
+    if sess is None:
+        return
+    row = {
+        "pd_counts": dict(pd_counts),
+        "pd_incidents": list(pd_incidents),
+        "arlo_services_status": list(arlo_services_status),
+    }
+    with _sm_incr_lock:
+        sess.update(row)
+        sess["pd_loaded"] = True
+    if sess.get("shared"):
+        sm_api_cache_set(_SM_INCR_KIND, f"{session_id}:sidebar", row)
+
+
+def _sm_incr_sidebar_state(session_id: str) -> dict:
+    """Session with pd_counts / pd_incidents / arlo_services_status (pulled from the DB if another worker fetched them)."""
+    sess = _sm_incr_sessions.get(session_id) or {}
+    if sess and not sess.get("pd_loaded") and sess.get("shared"):
+        row = sm_api_cache_get(_SM_INCR_KIND, f"{session_id}:sidebar", _SM_INCR_TTL_SECS)
+        if row:
+            with _sm_incr_lock:
+                sess.update(row)
+                sess["pd_loaded"] = True
+    return sess
+
+
+def _sm_incr_statuses_by_env(session_id: str) -> dict:
+    """{dd_env: statuses} fetched so far in this session, by any worker."""
+    sess = _sm_incr_sessions.get(session_id) or {}
+    with _sm_incr_lock:
+        out = dict(sess.get("statuses_by_env") or {})
+    missing = [e for e in sess.get("dd_environments") or [] if e not in out]
+    if missing and sess.get("shared"):
+        rows = sm_api_cache_get_many(
+            _SM_INCR_KIND, [f"{session_id}:env:{e}" for e in missing], _SM_INCR_TTL_SECS
+        )
+        found = {
+            e: [r for r in map(ServiceHealth.load, rows[f"{session_id}:env:{e}"]) if r is not None]
+            for e in missing
+            if f"{session_id}:env:{e}" in rows
+        }
+        if found:
+            with _sm_incr_lock:
+                sess.setdefault("statuses_by_env", {}).update(found)
+            out.update(found)
+    return out
+
+
 def _sm_incr_merged_statuses(session_id: str) -> list:
     sess = _sm_incr_sessions.get(session_id) or {}
+    by_env = _sm_incr_statuses_by_env(session_id)
     out: list = []
     for env in sess.get("dd_environments") or []:
-        out.extend(list((sess.get("statuses_by_env") or {}).get(env) or []))
+        out.extend(list(by_env.get(env) or []))
     return out
 
 
@@ -5571,6 +6718,19 @@ def _sm_org_wall_tile_html(
     raw_svc: dict,
     env: str,
     page_environment: str | None,
+) -> str:
+    return _sm_cached_tile_html(
+        "org",
+        (ser, raw_svc, env, page_environment),
+        lambda: _sm_render_org_wall_tile_html(ser, raw_svc, env, page_environment),
+    )
+
+
+def _sm_render_org_wall_tile_html(
+    ser: dict,
+    raw_svc: dict,
+    env: str,
+    page_environment: str | None,
 ) -> str:
     label = html.escape(str(ser.get("service") or "—"))
     wrap_cls = _sm_org_wall_tile_wrap_class(ser)
@@ -5769,6 +6929,77 @@ def _sm_render_engineering_mosaic_html(
     return "".join(layout_parts)
 
 
+def _sm_op_issue_tile_html(svc: dict, env: str, page_environment: str | None) -> str:
+    dd_site_tile = os.getenv("DD_SITE", "datadoghq.com")
+    service_name = svc["service"]
+    dd_url = (
+        f"{datadog_ui_origin(dd_site_tile)}/apm/service/"
+        f"{quote(service_name, safe='')}/overview?env={quote(env, safe='')}"
+    )
+    is_crit = svc["status"] == "critical"
+    tile_mod = "sm-op-tile--crit" if is_crit else "sm-op-tile--warn"
+    alert_tile = " service-box-alert" if svc["status"] in ("warning", "critical") else ""
+    icon = "✕" if is_crit else "⚠"
+    t_name = html.escape(svc["service"])
+    t_err = html.escape(f"{svc['error_rate']}")
+    url_attr = html.escape(dd_url, quote=True)
+    hover_j = _sm_hover_json_attr(_sm_hover_service_payload(svc, env, page_environment=page_environment))
+    return f"""
+                <div class='sm-tip-wrap' data-sm-hover="{hover_j}">
+                <a class='sm-op-tile {tile_mod}{alert_tile}' href="{url_attr}" target="_blank" rel="noopener">
+                    <div class='sm-op-tile-icon'>{icon}</div>
+                    <div class='sm-op-tile-name'>{t_name}</div>
+                    <div class='sm-op-tile-metric'>{t_err}%</div>
+                    <div class='sm-op-tile-metric-lbl'>ERR</div>
+                </a>
+                </div>
+                """
+
+
+def _sm_op_healthy_tile_html(hsvc: dict, env: str, page_environment: str | None) -> str:
+    dd_site_chips = os.getenv("DD_SITE", "datadoghq.com")
+    t_url = f"{datadog_ui_origin(dd_site_chips)}/apm/service/{hsvc['service']}/overview?env={env}"
+    t_name = html.escape(hsvc["service"])
+    t_met, t_lbl = _sm_op_tile_metric_html(hsvc)
+    met_suffix = "" if t_lbl == "OK" else "%"
+    hover_j = _sm_hover_json_attr(_sm_hover_service_payload(hsvc, env, page_environment=page_environment))
+    return f"""
+                <div class='sm-tip-wrap' data-sm-hover="{hover_j}">
+                <div class='sm-op-tile' onclick="window.open('{t_url}', '_blank')">
+                    <div class='sm-op-tile-icon'>✓</div>
+                    <div class='sm-op-tile-name'>{t_name}</div>
+                    <div class='sm-op-tile-metric'>{t_met}{met_suffix}</div>
+                    <div class='sm-op-tile-metric-lbl'>{html.escape(t_lbl)}</div>
+                </div>
+                </div>
+                """
+
+
+def _sm_op_nosig_tile_html(svc: dict, env: str, page_environment: str | None) -> str:
+    dd_site_nosig = os.getenv("DD_SITE", "datadoghq.com")
+    service_name = svc["service"]
+    dd_url = (
+        f"{datadog_ui_origin(dd_site_nosig)}/apm/service/"
+        f"{quote(service_name, safe='')}/overview?env={quote(env, safe='')}"
+    )
+    st = svc.get("status") or "unknown"
+    icon = "○" if st == "inactive" else "?"
+    t_name = html.escape(service_name)
+    url_attr = html.escape(dd_url, quote=True)
+    lbl = "idle" if st == "inactive" else "unknown"
+    hover_j = _sm_hover_json_attr(_sm_hover_service_payload(svc, env, page_environment=page_environment))
+    return f"""
+                <div class="sm-tip-wrap" data-sm-hover="{hover_j}">
+                <a class="sm-op-tile sm-op-tile--nosig" href="{url_attr}" target="_blank" rel="noopener">
+                    <div class="sm-op-tile-icon">{icon}</div>
+                    <div class="sm-op-tile-name">{t_name}</div>
+                    <div class="sm-op-tile-metric">—</div>
+                    <div class="sm-op-tile-metric-lbl">{html.escape(lbl)}</div>
+                </a>
+                </div>
+                """
+
+
 def _sm_render_dd_env_column_html(
     env: str,
     all_statuses: list,
@@ -5863,7 +7094,6 @@ def _sm_render_dd_env_column_html(
             key=lambda s: (0 if s["status"] == "critical" else 1, -s["error_rate"], -s["errors"]),
         )
         healthy_svcs = sorted([s for s in group_services if s["status"] == "healthy"], key=lambda x: x["service"].lower())
-        dd_site_chips = os.getenv("DD_SITE", "datadoghq.com")
         op_tile_count = len(issue_svcs) + len(healthy_svcs)
         if op_tile_count:
             out += """
@@ -5872,46 +7102,17 @@ def _sm_render_dd_env_column_html(
             <div class='sm-op-tiles'>
         """
         for svc in issue_svcs:
-            dd_site_tile = os.getenv("DD_SITE", "datadoghq.com")
-            service_name = svc["service"]
-            dd_url = (
-                f"{datadog_ui_origin(dd_site_tile)}/apm/service/"
-                f"{quote(service_name, safe='')}/overview?env={quote(env, safe='')}"
+            out += _sm_cached_tile_html(
+                "op_issue",
+                (svc, env, page_environment),
+                lambda svc=svc: _sm_op_issue_tile_html(svc, env, page_environment),
             )
-            is_crit = svc["status"] == "critical"
-            tile_mod = "sm-op-tile--crit" if is_crit else "sm-op-tile--warn"
-            alert_tile = " service-box-alert" if svc["status"] in ("warning", "critical") else ""
-            icon = "✕" if is_crit else "⚠"
-            t_name = html.escape(svc["service"])
-            t_err = html.escape(f"{svc['error_rate']}")
-            url_attr = html.escape(dd_url, quote=True)
-            hover_j = _sm_hover_json_attr(_sm_hover_service_payload(svc, env, page_environment=page_environment))
-            out += f"""
-                <div class='sm-tip-wrap' data-sm-hover="{hover_j}">
-                <a class='sm-op-tile {tile_mod}{alert_tile}' href="{url_attr}" target="_blank" rel="noopener">
-                    <div class='sm-op-tile-icon'>{icon}</div>
-                    <div class='sm-op-tile-name'>{t_name}</div>
-                    <div class='sm-op-tile-metric'>{t_err}%</div>
-                    <div class='sm-op-tile-metric-lbl'>ERR</div>
-                </a>
-                </div>
-                """
         for hsvc in healthy_svcs:
-            t_url = f"{datadog_ui_origin(dd_site_chips)}/apm/service/{hsvc['service']}/overview?env={env}"
-            t_name = html.escape(hsvc["service"])
-            t_met, t_lbl = _sm_op_tile_metric_html(hsvc)
-            met_suffix = "" if t_lbl == "OK" else "%"
-            hover_j = _sm_hover_json_attr(_sm_hover_service_payload(hsvc, env, page_environment=page_environment))
-            out += f"""
-                <div class='sm-tip-wrap' data-sm-hover="{hover_j}">
-                <div class='sm-op-tile' onclick="window.open('{t_url}', '_blank')">
-                    <div class='sm-op-tile-icon'>✓</div>
-                    <div class='sm-op-tile-name'>{t_name}</div>
-                    <div class='sm-op-tile-metric'>{t_met}{met_suffix}</div>
-                    <div class='sm-op-tile-metric-lbl'>{html.escape(t_lbl)}</div>
-                </div>
-                </div>
-                """
+            out += _sm_cached_tile_html(
+                "op_healthy",
+                (hsvc, env, page_environment),
+                lambda hsvc=hsvc: _sm_op_healthy_tile_html(hsvc, env, page_environment),
+            )
         if op_tile_count:
             out += """
             </div>
@@ -5922,34 +7123,17 @@ def _sm_render_dd_env_column_html(
             key=lambda x: (x.get("service") or "").lower(),
         )
         if page_environment == "samsung" and nosig_svcs:
-            dd_site_nosig = os.getenv("DD_SITE", "datadoghq.com")
             out += f"""
             <div class="sm-band-nosig">
             <div class="sm-section-label" style="margin-top:0;">No APM signal — {len(nosig_svcs)}</div>
             <div class="sm-op-tiles">
         """
             for svc in nosig_svcs:
-                service_name = svc["service"]
-                dd_url = (
-                    f"{datadog_ui_origin(dd_site_nosig)}/apm/service/"
-                    f"{quote(service_name, safe='')}/overview?env={quote(env, safe='')}"
+                out += _sm_cached_tile_html(
+                    "op_nosig",
+                    (svc, env, page_environment),
+                    lambda svc=svc: _sm_op_nosig_tile_html(svc, env, page_environment),
                 )
-                st = svc.get("status") or "unknown"
-                icon = "○" if st == "inactive" else "?"
-                t_name = html.escape(service_name)
-                url_attr = html.escape(dd_url, quote=True)
-                lbl = "idle" if st == "inactive" else "unknown"
-                hover_j = _sm_hover_json_attr(_sm_hover_service_payload(svc, env, page_environment=page_environment))
-                out += f"""
-                <div class="sm-tip-wrap" data-sm-hover="{hover_j}">
-                <a class="sm-op-tile sm-op-tile--nosig" href="{url_attr}" target="_blank" rel="noopener">
-                    <div class="sm-op-tile-icon">{icon}</div>
-                    <div class="sm-op-tile-name">{t_name}</div>
-                    <div class="sm-op-tile-metric">—</div>
-                    <div class="sm-op-tile-metric-lbl">{html.escape(lbl)}</div>
-                </a>
-                </div>
-                """
             out += """
             </div>
             </div>
@@ -5982,22 +7166,52 @@ def status_monitor_dashboard(
     Returns:
         HTML string for the dashboard
     """
-    global _status_cache
-    
     frag = (fragment or "").strip().lower() or None
-    is_full = frag is None
+    if frag is None:
+        html_out, _meta = status_monitor_dashboard_snapshot(timerange, environment, force_refresh)
+        return html_out
+    return _status_monitor_dashboard_render(
+        timerange,
+        environment,
+        force_refresh,
+        fragment=frag,
+        only_dd_env=only_dd_env,
+        all_statuses_override=all_statuses_override,
+        incr_session_id=incr_session_id,
+        skip_splunk=skip_splunk,
+    )
 
-    # Check cache first - include version to invalidate cache when logic changes
-    cache_version = "v3.4.27_eng_mosaic_green"  # Change this when logic changes
-    cache_key = f"{cache_version}_{timerange}_{environment}_{int(time.time() // _cache_ttl)}"
-    if is_full:
-        hit = _read_sm_mem_cache(_status_cache, cache_key, force_refresh)
-        if hit is not None:
-            print(f"✅ Using cached dashboard data (cache key: {cache_key}, force_refresh={force_refresh})")
-            return hit
-    
+
+def status_monitor_dashboard_snapshot(
+    timerange: int = 1, environment: str = None, force_refresh: bool = False
+) -> tuple[str, dict]:
+    """Full dashboard HTML served stale-while-revalidate, plus its snapshot meta (age, stale)."""
+    # Version in key invalidates cached HTML when logic changes
+    cache_key = f"v3.4.27_eng_mosaic_green_{timerange}_{environment}"
+    html_out, meta = _sm_swr_serve(
+        cache_key,
+        _cache_ttl,
+        lambda fr: _status_monitor_dashboard_render(timerange, environment, fr),
+        force_refresh,
+    )
+    return html_out, meta
+
+
+def _status_monitor_dashboard_render(
+    timerange: int,
+    environment: str | None,
+    force_refresh: bool,
+    *,
+    fragment: str | None = None,
+    only_dd_env: str | None = None,
+    all_statuses_override: list | None = None,
+    incr_session_id: str | None = None,
+    skip_splunk: bool = False,
+) -> str:
+    frag = fragment
+    is_full = frag is None
     if is_full:
-        print(f"🔄 Cache miss - fetching fresh data (key: {cache_key}, force_refresh={force_refresh})")
+        print(f"🔄 Building dashboard (timerange={timerange}, environment={environment}, force_refresh={force_refresh})")
 
     current_time = int(time.time())
     from_time = current_time - (timerange * 3600)
@@ -6495,7 +7709,8 @@ def status_monitor_dashboard(
         """
     
     try:
-        services, environments = _sm_resolve_services_and_environments(environment)
+        with perf_phase("services", environment or "hub"):
+            services, environments = _sm_resolve_services_and_environments(environment)
     except ValueError:
         return f"<p style='color: #dc2626;'>⚠️ Error: Invalid environment '{html.escape(str(environment))}'</p>"
 
@@ -6520,33 +7735,40 @@ def status_monitor_dashboard(
         need_apm = False
         need_pd_arlo = False
 
+    # Full single-environment render: the shared env snapshot already carries DD health + PD correlation
+    env_snap = None
+    if is_full and need_apm and all_statuses_override is None and environment is not None and not only_dd_env:
+        env_snap = _sm_env_snapshot(environment, int(timerange), force_refresh)
+        if not env_snap.get("success"):
+            env_snap = None
+
     if need_apm and all_statuses_override is not None:
         all_statuses = list(all_statuses_override)
+    elif env_snap is not None:
+        all_statuses = _sm_env_snapshot_rows(env_snap)
     elif need_apm and frag != "finalize":
         print(f"📡 Fetching health for {len(services)} services across {len(environments)} environment(s): {environments}...")
-        all_statuses = _sm_fetch_parallel_service_health(
-            services,
-            environments,
-            dd_api_key,
-            dd_app_key,
-            dd_site,
-            from_time,
-            current_time,
-            int(timerange),
-            force_refresh,
-        )
+        with perf_phase("dd_health", only_dd_env or environment or "hub"):
+            all_statuses = _sm_fetch_parallel_service_health(
+                services,
+                environments,
+                dd_api_key,
+                dd_app_key,
+                dd_site,
+                from_time,
+                current_time,
+                int(timerange),
+                force_refresh,
+            )
         if incr_session_id and only_dd_env:
-            sess = _sm_incr_sessions.get(incr_session_id)
-            if sess is not None:
-                with _sm_incr_lock:
-                    sess.setdefault("statuses_by_env", {})[only_dd_env] = list(all_statuses)
+            _sm_incr_store_env(incr_session_id, only_dd_env, all_statuses)
     elif frag == "finalize" and incr_session_id:
         all_statuses = _sm_incr_merged_statuses(incr_session_id)
     else:
         all_statuses = []
 
     if frag == "env_column" and only_dd_env and incr_session_id:
-        sess = _sm_incr_sessions.get(incr_session_id) or {}
+        sess = _sm_incr_sidebar_state(incr_session_id)
         pd_incidents = list(sess.get("pd_incidents") or [])
         _sm_apply_pagerduty_correlation(all_statuses, services, [only_dd_env], environment, pd_incidents)
         all_statuses = _sm_apply_wall_display_statuses(
@@ -6567,9 +7789,13 @@ def status_monitor_dashboard(
 
     if need_pd_arlo and frag in ("sidebar_fast", None):
         print(f"🔄 Fetching PagerDuty and Arlo status (sequential, resilient)...")
-        if pd_api_key:
+        if env_snap is not None and env_snap.get("pd_counts") is not None:
+            pd_counts = dict(env_snap["pd_counts"])
+            pd_incidents = list(env_snap.get("pd_incidents") or [])
+        elif pd_api_key:
             try:
-                pd_counts, pd_incidents = get_pagerduty_status_counts(pd_api_key, force_refresh)
+                with perf_phase("pagerduty"):
+                    pd_counts, pd_incidents = get_pagerduty_status_counts(pd_api_key, force_refresh)
             except Exception as e:
                 print(f"⚠️ Error fetching PagerDuty status: {e}")
         else:
@@ -6581,27 +7807,24 @@ def status_monitor_dashboard(
         except Exception as e:
             print(f"⚠️ Error fetching Arlo status: {e}")
         if incr_session_id:
-            sess = _sm_incr_sessions.get(incr_session_id)
-            if sess is not None:
-                with _sm_incr_lock:
-                    sess["pd_counts"] = dict(pd_counts)
-                    sess["pd_incidents"] = list(pd_incidents)
-                    sess["arlo_services_status"] = list(arlo_services_status)
+            _sm_incr_store_sidebar(incr_session_id, pd_counts, pd_incidents, arlo_services_status)
         if frag == "sidebar_fast":
             return _sm_incr_sidebar_fast_html(pd_counts, arlo_services_status, int(timerange))
     elif frag == "env_column" and incr_session_id:
-        sess = _sm_incr_sessions.get(incr_session_id) or {}
+        sess = _sm_incr_sidebar_state(incr_session_id)
         pd_counts = dict(sess.get("pd_counts") or pd_counts)
         pd_incidents = list(sess.get("pd_incidents") or [])
         arlo_services_status = list(sess.get("arlo_services_status") or [])
     elif frag == "finalize" and incr_session_id:
-        sess = _sm_incr_sessions.get(incr_session_id) or {}
+        sess = _sm_incr_sidebar_state(incr_session_id)
         pd_counts = dict(sess.get("pd_counts") or pd_counts)
         pd_incidents = list(sess.get("pd_incidents") or [])
         arlo_services_status = list(sess.get("arlo_services_status") or [])
 
     if need_apm and frag != "env_column":
-        _sm_apply_pagerduty_correlation(all_statuses, services, environments, environment, pd_incidents)
+        if env_snap is None:
+            with perf_phase("pd_correlation", environment or "hub"):
+                _sm_apply_pagerduty_correlation(all_statuses, services, environments, environment, pd_incidents)
         if environment and all_statuses and environments:
             all_statuses = _sm_apply_wall_display_statuses(
                 all_statuses,
@@ -6622,6 +7845,7 @@ def status_monitor_dashboard(
     
     # EKS cluster lookup: off by default (heavy); STATUS_MONITOR_DASHBOARD_ATTACH_EKS=1 to re-enable.
     cluster_service_map = {}
+    eks_known = _sm_env_snapshot_eks([env_snap]) if env_snap is not None else {}
     if is_full and _status_monitor_dashboard_attach_eks():
         eks_tr_h = max(1, int(timerange))
         operational_ct = sum(
@@ -6639,6 +7863,8 @@ def status_monitor_dashboard(
             service_env = status_obj["environment"]
             if status_obj.get("status") in ("inactive", "unknown"):
                 return (status_obj, [], service_name, service_env, None)
+            if (service_name, service_env) in eks_known:
+                return (status_obj, eks_known[(service_name, service_env)], service_name, service_env, True)
             cluster_names, from_db = _resolve_eks_cluster_names(
                 service_name, service_env, eks_tr_h, force_refresh
             )
@@ -6647,6 +7873,7 @@ def status_monitor_dashboard(
         eks_attached = 0
         eks_cluster_rows_db = 0
         eks_cluster_rows_live = 0
+        t_eks = time.perf_counter()
         with ThreadPoolExecutor(max_workers=STATUS_MONITOR_EKS_MAX_WORKERS) as executor:
             futures = [executor.submit(fetch_clusters_for_service, status_obj) for status_obj in all_statuses]
 
@@ -6670,6 +7897,7 @@ def status_monitor_dashboard(
 
                 except Exception as e:
                     print(f"   ❌ Error fetching clusters: {e}")
+        perf_record("eks", environment or "hub", time.perf_counter() - t_eks)
         print(
             f"☸️  EKS: kube_cluster_name resolved for {eks_attached} / {operational_ct} operational service(s) "
             f"(rows from SQLite={eks_cluster_rows_db}, live Datadog={eks_cluster_rows_live})."
@@ -6702,7 +7930,8 @@ def status_monitor_dashboard(
     }
     if frag in ("sidebar_splunk",) or (is_full and not skip_splunk):
         try:
-            spl_data = splunk_outliers_monitor_payload()
+            with perf_phase("splunk"):
+                spl_data = splunk_outliers_monitor_payload()
         except Exception as e:
             print(f"⚠️ Splunk outliers (status monitor sidebar): {e}")
             spl_data = {
@@ -6716,6 +7945,7 @@ def status_monitor_dashboard(
         return _splunk_p0_sidebar_widget_html(spl_data)
 
     # Build dashboard
+    t_render = time.perf_counter()
     # Get current time (will be replaced by client-side timezone)
     current_dt = datetime.utcnow()
     
@@ -7447,7 +8677,8 @@ def status_monitor_dashboard(
     </div>
     </div>
     """
-    
+    perf_record("render", environment or "hub", time.perf_counter() - t_render)
+
     # Generate detailed alert summary for logging
     critical_services = [s for s in all_statuses if s['status'] == 'critical']
     warning_services = [s for s in all_statuses if s['status'] == 'warning']
@@ -7506,16 +8737,6 @@ def status_monitor_dashboard(
     except Exception as e:
         print(f"⚠️ Error saving metrics to database: {e}")
     
-    # Cache the result
-    if is_full:
-        _write_sm_mem_cache(_status_cache, cache_key, output)
-    
-    # Clean old cache entries (keep only last 5)
-    if len(_status_cache) > 5:
-        oldest_key = min(_status_cache.keys())
-        del _status_cache[oldest_key]
-        _mem_cache_saved_at.pop(oldest_key, None)
-    
     return output
 
 
@@ -7587,9 +8808,11 @@ def status_monitor_partial(
     force_refresh: bool = False,
     session_id: str | None = None,
     dd_env: str | None = None,
+    share_session: bool = True,
 ) -> dict:
     """
     Incremental /statusmonitor/<env> fragments. Client loads bootstrap first, then parallel parts.
+    share_session=False keeps session state in this process (status_monitor_incremental_stream).
     """
     part = (part or "").strip().lower()
     try:
@@ -7605,6 +8828,7 @@ def status_monitor_partial(
         force_refresh=force_refresh,
         services=services,
         dd_environments=dd_environments,
+        shared=share_session,
     )
 
     if part == "meta":
@@ -7660,8 +8884,7 @@ def status_monitor_partial(
             incr_session_id=sid,
             skip_splunk=True,
         )
-        sess = _sm_incr_sessions.get(sid) or {}
-        ready = len(sess.get("statuses_by_env") or {}) >= len(dd_environments)
+        ready = len(_sm_incr_statuses_by_env(sid)) >= len(dd_environments)
         return {
             "success": True,
             "part": "apm",
@@ -7683,3 +8906,59 @@ def status_monitor_partial(
         return {"success": True, "part": "finalize", "session_id": sid, "html": html}
 
     return {"success": False, "error": f"Unknown part: {part}", "part": part}
+
+
+def status_monitor_incremental_stream(
+    timerange: int = 1, environment: str | None = None, force_refresh: bool = False
+):
+    """
+    Whole incremental /statusmonitor/<env> load in one request, as Server-Sent Events.
+
+    Emits a "fragment" event per part (same JSON as status_monitor_partial): meta, bootstrap, then
+    sidebar_fast / sidebar_splunk / one apm per dd_env as each finishes, finalize as soon as the
+    sidebar and every env are in (Splunk may still be running), then "done". The session lives in
+    this process for the duration of the request, so nothing depends on which worker serves what.
+    """
+    kw = dict(timerange=timerange, environment=environment, force_refresh=force_refresh, share_session=False)
+    meta = status_monitor_partial("meta", **kw)
+    yield sse_event("fragment", meta)
+    if not meta.get("success"):
+        yield sse_event("done", {"success": False})
+        return
+    sid = meta["session_id"]
+    kw["session_id"] = sid
+    try:
+        yield sse_event("fragment", status_monitor_partial("bootstrap", **kw))
+        jobs = [("sidebar_fast", None), ("sidebar_splunk", None)]
+        jobs += [("apm", env) for env in meta.get("dd_environments") or []]
+        pool = ThreadPoolExecutor(
+            max_workers=min(len(jobs), _SM_INCR_STREAM_WORKERS), thread_name_prefix="sm-incr"
+        )
+        try:
+            pending = {pool.submit(status_monitor_partial, part, dd_env=env, **kw): (part, env) for part, env in jobs}
+            # finalize needs PagerDuty correlation + every env column, not Splunk
+            needed = {f for f, (part, _) in pending.items() if part != "sidebar_splunk"}
+            finalized = False
+            while pending:
+                done, _ = wait(list(pending), timeout=_SM_INCR_STREAM_KEEPALIVE_SECS, return_when=FIRST_COMPLETED)
+                if not done:
+                    yield sse_comment()
+                    continue
+                for f in done:
+                    part, env = pending.pop(f)
+                    needed.discard(f)
+                    try:
+                        payload = f.result()
+                    except Exception as e:
+                        print(f"⚠️ Incremental stream {part}{' ' + env if env else ''} failed: {e}")
+                        payload = {"success": False, "part": part, "dd_env": env, "error": str(e)}
+                    yield sse_event("fragment", payload)
+                if not needed and not finalized:
+                    finalized = True
+                    yield sse_event("fragment", status_monitor_partial("finalize", **kw))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        yield sse_event("done", {"success": True, "session_id": sid})
+    finally:
+        with _sm_incr_lock:
+            _sm_incr_sessions.pop(sid, None)
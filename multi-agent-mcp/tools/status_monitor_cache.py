@@ -0,0 +1,470 @@
+"""
+Snapshot cache backends for Status Monitor full views (wall, hub, APM wall, dashboard HTML).
+
+Values are stored with the unix time they were computed (``saved_at``) so callers can apply
+stale-while-revalidate. Every backend drops entries older than ``ttl_secs`` and keeps
+hit/miss/eviction counters.
+
+  memory — per-worker LRU bounded by serialized payload bytes (default)
+  sqlite — status_monitor_snapshots in data/metrics_history.db, shared by all workers on the host
+  redis  — any server speaking the Redis protocol (Redis, Valkey, KeyDB, a local stand-in);
+           byte budget is the server's maxmemory (use maxmemory-policy allkeys-lru)
+
+Entry freshness (``entry_is_fresh``) is shared by every status-monitor cache, including the
+SQLite API cache: each entry's soft TTL is shortened by a stable per-entry jitter, and entries are
+refreshed early with a probability that rises as expiry approaches (XFetch, scaled by how long the
+value took to compute). Entries past the soft TTL remain usable as stale fallbacks up to the hard TTL.
+
+Env:
+  STATUS_MONITOR_SNAPSHOT_CACHE=memory|sqlite|redis
+  STATUS_MONITOR_SNAPSHOT_CACHE_MAX_MB=64
+  STATUS_MONITOR_SNAPSHOT_REDIS_URL=redis://[:password@]host:6379/0  (rediss:// for TLS)
+  STATUS_MONITOR_CACHE_JITTER_PCT=15          — max per-entry soft-TTL reduction
+  STATUS_MONITOR_CACHE_EARLY_REFRESH_BETA=1.0 — XFetch beta (0 disables probabilistic refresh)
+  STATUS_MONITOR_CACHE_HARD_TTL_FACTOR=4      — hard TTL = soft TTL × factor
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import random
+import socket
+import ssl
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+from urllib.parse import unquote, urlparse
+
+
+def _float_env(name: str, default: float, lo: float, hi: float) -> float:
+    try:
+        v = float((os.getenv(name) or str(default)).strip())
+    except ValueError:
+        v = default
+    return max(lo, min(v, hi))
+
+
+def cache_jitter_pct() -> float:
+    return _float_env("STATUS_MONITOR_CACHE_JITTER_PCT", 15.0, 0.0, 50.0)
+
+
+def cache_early_refresh_beta() -> float:
+    return _float_env("STATUS_MONITOR_CACHE_EARLY_REFRESH_BETA", 1.0, 0.0, 10.0)
+
+
+def cache_hard_ttl(soft_ttl: float) -> float:
+    """Upper bound for serving an entry as a stale fallback."""
+    return float(soft_ttl) * _float_env("STATUS_MONITOR_CACHE_HARD_TTL_FACTOR", 4.0, 1.0, 50.0)
+
+
+def entry_soft_ttl(key: str, created_at: float, soft_ttl: float) -> float:
+    """
+    soft_ttl shortened by up to STATUS_MONITOR_CACHE_JITTER_PCT. Stable for one entry (same key and
+    creation time give the same value in every worker) but spread across keys and generations.
+    """
+    digest = hashlib.blake2b(f"{key}|{created_at:.3f}".encode("utf-8"), digest_size=8).digest()
+    frac = int.from_bytes(digest, "big") / float(1 << 64)
+    return float(soft_ttl) * (1.0 - cache_jitter_pct() / 100.0 * frac)
+
+
+def entry_is_fresh(
+    key: str,
+    created_at: float,
+    soft_ttl: float,
+    compute_secs: float = 0.0,
+    now: float | None = None,
+) -> bool:
+    """
+    True while the entry should be used as-is. False once past its jittered soft TTL, or earlier with
+    probability exp(-(ttl - age) / (compute_secs × beta)) — so expensive entries refresh a little
+    ahead of time and concurrent readers rarely all miss at the same instant.
+    """
+    if soft_ttl <= 0:
+        return False
+    now = time.time() if now is None else now
+    age = now - float(created_at)
+    ttl = entry_soft_ttl(key, float(created_at), soft_ttl)
+    if age >= ttl:
+        return False
+    beta = cache_early_refresh_beta()
+    if compute_secs > 0 and beta > 0:
+        # XFetch: -log(U) is Exp(1); early when age + compute×beta×Exp(1) crosses the expiry
+        return age - float(compute_secs) * beta * math.log(1.0 - random.random()) < ttl
+    return True
+
+
+def _payload_json(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+def _payload_size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value.encode("utf-8", errors="replace"))
+    return len(_payload_json(value))
+
+
+class SnapshotCache(ABC):
+    """Backend interface: get/set (value, saved_at), peek_saved_at, delete, clear, stats."""
+
+    name = "base"
+    # True when every worker sees the same entries (no cross-worker publish needed)
+    shared = False
+
+    def __init__(self, max_bytes: int, ttl_secs: float):
+        self.max_bytes = int(max_bytes)
+        self.ttl_secs = float(ttl_secs)
+        self._counter_lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expired": 0, "errors": 0}
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._counter_lock:
+            self._counters[name] += n
+
+    @abstractmethod
+    def get(self, key: str) -> tuple[Any, float] | None:
+        ...
+
+    @abstractmethod
+    def peek_saved_at(self, key: str) -> float | None:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, saved_at: float | None = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def _usage(self) -> dict:
+        return {}
+
+    def stats(self) -> dict:
+        with self._counter_lock:
+            out = dict(self._counters)
+        lookups = out["hits"] + out["misses"]
+        out["hit_ratio"] = round(out["hits"] / lookups, 3) if lookups else None
+        out.update(
+            {"backend": self.name, "shared": self.shared, "max_bytes": self.max_bytes, "ttl_secs": self.ttl_secs}
+        )
+        out.update(self._usage())
+        return out
+
+
+class MemoryLRUSnapshotCache(SnapshotCache):
+    """In-process LRU; evicts least-recently-used entries once total payload bytes exceed max_bytes."""
+
+    name = "memory"
+
+    def __init__(self, max_bytes: int, ttl_secs: float):
+        super().__init__(max_bytes, ttl_secs)
+        self._lock = threading.Lock()
+        # key -> (value, saved_at, size_bytes)
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+
+    def _drop(self, key: str) -> None:
+        ent = self._entries.pop(key, None)
+        if ent is not None:
+            self._bytes -= ent[2]
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is None:
+                self._count("misses")
+                return None
+            if time.time() - ent[1] >= self.ttl_secs:
+                self._drop(key)
+                self._count("expired")
+                self._count("misses")
+                return None
+            self._entries.move_to_end(key)
+            self._count("hits")
+            return ent[0], ent[1]
+
+    def peek_saved_at(self, key: str) -> float | None:
+        with self._lock:
+            ent = self._entries.get(key)
+            return ent[1] if ent is not None else None
+
+    def set(self, key: str, value: Any, saved_at: float | None = None) -> None:
+        size = _payload_size(value)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (value, time.time() if saved_at is None else float(saved_at), size)
+            self._bytes += size
+            self._count("sets")
+            # Always keep the newest entry, even if it alone exceeds the budget
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                old_key = next(iter(self._entries))
+                self._drop(old_key)
+                self._count("evictions")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _usage(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes}
+
+
+class SQLiteSnapshotCache(SnapshotCache):
+    """status_monitor_snapshots table (metrics_history.db); LRU by accessed_at, bounded by bytes."""
+
+    name = "sqlite"
+    shared = True
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        from tools.metrics_persistence import sm_snapshot_get
+
+        hit = sm_snapshot_get(key, self.ttl_secs)
+        self._count("hits" if hit is not None else "misses")
+        return hit
+
+    def peek_saved_at(self, key: str) -> float | None:
+        from tools.metrics_persistence import sm_snapshot_saved_at
+
+        return sm_snapshot_saved_at(key)
+
+    def set(self, key: str, value: Any, saved_at: float | None = None) -> None:
+        from tools.metrics_persistence import sm_snapshot_set
+
+        evicted = sm_snapshot_set(
+            key, _payload_json(value), time.time() if saved_at is None else float(saved_at), self.max_bytes
+        )
+        self._count("sets")
+        if evicted:
+            self._count("evictions", evicted)
+
+    def delete(self, key: str) -> None:
+        from tools.metrics_persistence import sm_snapshot_delete
+
+        sm_snapshot_delete(key)
+
+    def clear(self) -> None:
+        from tools.metrics_persistence import sm_snapshot_clear
+
+        sm_snapshot_clear()
+
+    def _usage(self) -> dict:
+        from tools.metrics_persistence import sm_snapshot_stats
+
+        return sm_snapshot_stats()
+
+
+class RedisProtocolError(Exception):
+    pass
+
+
+class _RespClient:
+    """Minimal RESP2 client (one socket per thread, reconnect after fork or socket errors)."""
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        u = urlparse(url)
+        self.host = u.hostname or "127.0.0.1"
+        self.port = u.port or 6379
+        self.password = unquote(u.password) if u.password else None
+        self.username = unquote(u.username) if u.username else None
+        self.db = int((u.path or "/0").strip("/") or 0)
+        self.tls = u.scheme == "rediss"
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        if self.tls:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=self.host)
+        f = sock.makefile("rb")
+        self._local.conn = (os.getpid(), sock, f)
+        if self.password:
+            if self.username:
+                self._send_and_read(sock, f, ("AUTH", self.username, self.password))
+            else:
+                self._send_and_read(sock, f, ("AUTH", self.password))
+        if self.db:
+            self._send_and_read(sock, f, ("SELECT", str(self.db)))
+        return sock, f
+
+    def _close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            try:
+                conn[1].close()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _encode(args) -> bytes:
+        out = [b"*%d\r\n" % len(args)]
+        for a in args:
+            b = a if isinstance(a, bytes) else str(a).encode("utf-8")
+            out.append(b"$%d\r\n%s\r\n" % (len(b), b))
+        return b"".join(out)
+
+    @classmethod
+    def _read_reply(cls, f):
+        """One reply; an error reply is returned as RedisProtocolError so the stream stays in sync."""
+        line = f.readline()
+        if not line:
+            raise ConnectionError("Redis connection closed")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode("utf-8", errors="replace")
+        if kind == b"-":
+            return RedisProtocolError(rest.decode("utf-8", errors="replace"))
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            n = int(rest)
+            if n < 0:
+                return None
+            data = f.read(n + 2)
+            return data[:-2]
+        if kind == b"*":
+            n = int(rest)
+            if n < 0:
+                return None
+            return [cls._read_reply(f) for _ in range(n)]
+        raise RedisProtocolError(f"Unexpected reply type {kind!r}")
+
+    def _send_and_read(self, sock, f, args):
+        sock.sendall(self._encode(args))
+        reply = self._read_reply(f)
+        if isinstance(reply, RedisProtocolError):
+            self._close()
+            raise reply
+        return reply
+
+    def pipeline(self, *commands):
+        """Send several commands in one write; returns their replies in order."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn[0] != os.getpid():
+            sock, f = self._connect()
+        else:
+            sock, f = conn[1], conn[2]
+        try:
+            sock.sendall(b"".join(self._encode(c) for c in commands))
+            # Read every reply before raising an error reply: one left unread would answer the
+            # next command on this connection
+            replies = [self._read_reply(f) for _ in commands]
+        except BaseException:
+            # Socket error, timeout or garbled reply: the stream position is unknown
+            self._close()
+            raise
+        for reply in replies:
+            if isinstance(reply, RedisProtocolError):
+                raise reply
+        return replies
+
+    def execute(self, *args):
+        return self.pipeline(args)[0]
+
+
+class RedisSnapshotCache(SnapshotCache):
+    """Hash per key (v = JSON payload, t = saved_at) with PEXPIRE = ttl; errors count as misses."""
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, max_bytes: int, ttl_secs: float, url: str, prefix: str = "sm:snap:"):
+        super().__init__(max_bytes, ttl_secs)
+        self.client = _RespClient(url)
+        self.prefix = prefix
+
+    def _k(self, key: str) -> str:
+        return self.prefix + key
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        try:
+            v, t = self.client.execute("HMGET", self._k(key), "v", "t")
+        except Exception as e:
+            self._count("errors")
+            self._count("misses")
+            print(f"⚠️ Snapshot cache (redis) get failed: {e}")
+            return None
+        if v is None or t is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return json.loads(v), float(t)
+
+    def peek_saved_at(self, key: str) -> float | None:
+        try:
+            t = self.client.execute("HGET", self._k(key), "t")
+        except Exception as e:
+            self._count("errors")
+            print(f"⚠️ Snapshot cache (redis) peek failed: {e}")
+            return None
+        return float(t) if t is not None else None
+
+    def set(self, key: str, value: Any, saved_at: float | None = None) -> None:
+        blob = _payload_json(value)
+        if len(blob) > self.max_bytes:
+            return
+        ts = time.time() if saved_at is None else float(saved_at)
+        try:
+            self.client.pipeline(
+                ("HSET", self._k(key), "v", blob, "t", repr(ts)),
+                ("PEXPIRE", self._k(key), str(int(self.ttl_secs * 1000))),
+            )
+            self._count("sets")
+        except Exception as e:
+            self._count("errors")
+            print(f"⚠️ Snapshot cache (redis) set failed: {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.execute("DEL", self._k(key))
+        except Exception as e:
+            self._count("errors")
+            print(f"⚠️ Snapshot cache (redis) delete failed: {e}")
+
+    def clear(self) -> None:
+        try:
+            cursor = "0"
+            while True:
+                cursor, keys = self.client.execute("SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", "500")
+                cursor = cursor.decode() if isinstance(cursor, bytes) else str(cursor)
+                if keys:
+                    self.client.execute("DEL", *keys)
+                if cursor == "0":
+                    break
+        except Exception as e:
+            self._count("errors")
+            print(f"⚠️ Snapshot cache (redis) clear failed: {e}")
+
+
+def build_snapshot_cache(ttl_secs: float) -> SnapshotCache:
+    """Backend from STATUS_MONITOR_SNAPSHOT_CACHE (falls back to memory when misconfigured)."""
+    kind = (os.getenv("STATUS_MONITOR_SNAPSHOT_CACHE") or "memory").strip().lower()
+    try:
+        max_mb = int((os.getenv("STATUS_MONITOR_SNAPSHOT_CACHE_MAX_MB") or "64").strip())
+    except ValueError:
+        max_mb = 64
+    max_bytes = max(1, min(max_mb, 4096)) * 1024 * 1024
+    if kind == "sqlite":
+        return SQLiteSnapshotCache(max_bytes, ttl_secs)
+    if kind == "redis":
+        url = (os.getenv("STATUS_MONITOR_SNAPSHOT_REDIS_URL") or "").strip()
+        if url:
+            return RedisSnapshotCache(max_bytes, ttl_secs, url)
+        print("⚠️ STATUS_MONITOR_SNAPSHOT_CACHE=redis without STATUS_MONITOR_SNAPSHOT_REDIS_URL — using memory")
+    elif kind != "memory":
+        print(f"⚠️ Unknown STATUS_MONITOR_SNAPSHOT_CACHE={kind!r} — using memory")
+    return MemoryLRUSnapshotCache(max_bytes, ttl_secs)
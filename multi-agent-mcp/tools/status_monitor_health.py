@@ -0,0 +1,207 @@
+"""
+Compact per-service health rows for the status monitor.
+
+A ``ServiceHealth`` is one (service, environment) status row. The fields a row usually carries
+are one list in HEALTH_FIELDS order (absent = a sentinel), so building a row from a dict, copying it
+and encoding it are list operations done in C rather than a Python call per key; rare decorations
+go to a small overflow dict created on first use. It is a ``MutableMapping``, so correlation,
+finalize and engineering-group code keep using ``row.get("status")`` /
+``row["pd_incident"] = True`` unchanged.
+
+Caches and snapshots store rows positionally (``to_row`` / ``ServiceHealth.load``) instead of a
+JSON object that repeats every key name per row:
+
+  ["sh1", present_bitmask, v0, v1, ..., overflow_dict_or_null]
+
+Bit i of the mask marks HEALTH_FIELDS[i] as present, so absent keys stay absent after a round trip.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any
+
+# Row layout: append only. Reordering or removing a field needs a new ROW_TAG (old rows then
+# fail to load and are simply re-fetched).
+HEALTH_FIELDS: tuple[str, ...] = (
+    "service",
+    "environment",
+    "status",
+    "requests",
+    "errors",
+    "error_rate",
+    "p95_latency",
+    "p99_latency",
+    "traffic_drop",
+    "high_latency",
+    "baseline_requests",
+    "traffic_variance",
+    "dd_monitor_override",
+    "dd_monitor_alerts",
+    "dd_monitor_alert_count",
+    "dd_monitor_alerts_suffix_ab",
+    "dd_monitor_alert_suffix_count",
+    "dd_monitor_open_count",
+    "dd_monitors_url",
+    "dd_monitors_url_all_alerts",
+    "pd_incident",
+    "pd_incident_url",
+    "eks_clusters",
+    "eks_cluster_count",
+    "wall_idle",
+    "wall_timerange_hours",
+    "wall_effective_lookback_hours",
+)
+ROW_TAG = "sh1"
+
+_FIELD_SET = frozenset(HEALTH_FIELDS)
+_INDEX = {name: i for i, name in enumerate(HEALTH_FIELDS)}
+_MISSING = object()
+_ABSENT = (_MISSING,) * len(HEALTH_FIELDS)
+_ABSENT_MAP = dict.fromkeys(HEALTH_FIELDS, _MISSING)
+_pick_fields = itemgetter(*HEALTH_FIELDS)
+
+
+class ServiceHealth(MutableMapping):
+    __slots__ = ("_values", "_extra")
+
+    def __init__(self, data: Mapping | None = None, **fields: Any):
+        if isinstance(data, ServiceHealth):
+            self._values = data._values[:]
+            self._extra = dict(data._extra) if data._extra else None
+        elif data:
+            merged = {**_ABSENT_MAP, **data}
+            self._values = list(_pick_fields(merged))
+            self._extra = None
+            if len(merged) != len(HEALTH_FIELDS):
+                self._extra = {k: merged[k] for k in merged.keys() - _FIELD_SET}
+        else:
+            self._values = list(_ABSENT)
+            self._extra = None
+        for k, v in fields.items():
+            self[k] = v
+
+    def __getitem__(self, key: str) -> Any:
+        i = _INDEX.get(key)
+        if i is not None:
+            v = self._values[i]
+            if v is _MISSING:
+                raise KeyError(key)
+            return v
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = _INDEX.get(key)
+        if i is not None:
+            v = self._values[i]
+            return default if v is _MISSING else v
+        return default if self._extra is None else self._extra.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        i = _INDEX.get(key)
+        if i is not None:
+            self._values[i] = value
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        i = _INDEX.get(key)
+        if i is not None:
+            if self._values[i] is _MISSING:
+                raise KeyError(key)
+            self._values[i] = _MISSING
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        i = _INDEX.get(key)
+        if i is not None:
+            return self._values[i] is not _MISSING
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for name, v in zip(HEALTH_FIELDS, self._values):
+            if v is not _MISSING:
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        n = len(HEALTH_FIELDS) - self._values.count(_MISSING)
+        return n + (len(self._extra) if self._extra else 0)
+
+    def __repr__(self) -> str:
+        return f"ServiceHealth({self.to_dict()!r})"
+
+    def copy(self) -> "ServiceHealth":
+        out = ServiceHealth.__new__(ServiceHealth)
+        out._values = self._values[:]
+        out._extra = dict(self._extra) if self._extra else None
+        return out
+
+    def to_dict(self) -> dict:
+        """Plain dict (``dict(row)`` works too, but goes through __getitem__ per key)."""
+        out = {k: v for k, v in zip(HEALTH_FIELDS, self._values) if v is not _MISSING}
+        if self._extra:
+            out.update(self._extra)
+        return out
+
+    def to_row(self) -> list:
+        values = self._values
+        if _MISSING not in values:
+            return [ROW_TAG, _FULL_MASK, *values, self._extra or None]
+        mask = 0
+        out = [ROW_TAG, 0]
+        for i, v in enumerate(values):
+            if v is _MISSING:
+                out.append(None)
+            else:
+                mask |= 1 << i
+                out.append(v)
+        out[1] = mask
+        out.append(self._extra or None)
+        return out
+
+    @classmethod
+    def from_row(cls, row: list) -> "ServiceHealth":
+        if len(row) != len(HEALTH_FIELDS) + 3 or row[0] != ROW_TAG:
+            raise ValueError("not a ServiceHealth row")
+        # Rows from the in-memory snapshot backend share lists with the cached copy
+        values = [list(v) if type(v) is list else v for v in row[2:-1]]
+        for i in _absent_positions(int(row[1])):
+            values[i] = _MISSING
+        out = cls.__new__(cls)
+        out._values = values
+        extra = row[-1]
+        out._extra = dict(extra) if extra else None
+        return out
+
+    @classmethod
+    def load(cls, value: Any) -> "ServiceHealth | None":
+        """Row from a cache payload: compact array, legacy dict, or an existing record. None if unusable."""
+        if isinstance(value, ServiceHealth):
+            return value
+        if isinstance(value, list):
+            try:
+                return cls.from_row(value)
+            except (TypeError, ValueError):
+                return None
+        if isinstance(value, Mapping):
+            return cls(value)
+        return None
+
+
+_FULL_MASK = (1 << len(HEALTH_FIELDS)) - 1
+
+
+@lru_cache(maxsize=256)
+def _absent_positions(mask: int) -> tuple[int, ...]:
+    """Field positions a present-bitmask leaves out (rows of one fetcher share a handful of masks)."""
+    return tuple(i for i in range(len(HEALTH_FIELDS)) if not mask >> i & 1)
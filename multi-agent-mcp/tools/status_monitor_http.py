@@ -0,0 +1,118 @@
+"""
+Conditional (ETag / 304) and compressed responses for polled status monitor JSON views.
+
+The ETag is a weak validator over the payload content and its snapshot version, so a 304 means
+the client holds this very snapshot (same tiles, same ``snapshot.version`` / ``generated_at``). The
+request-time meta fields ``snapshot.age_secs``, ``stale`` and ``refreshing`` are left out of the
+hash: on a 304 they stay as they were in the body the client kept. It is memoized per
+(request, snapshot version): dozens of wall displays polling one snapshot hash it once.
+Only GET / HEAD polls are answered 304; POST (the explicit refresh path) always gets a body.
+Bodies are compressed with brotli when the optional ``brotli`` package is installed, else gzip.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any
+
+_ETAG_MEMO_MAX = 256
+_etag_lock = threading.Lock()
+# (memo_key, snapshot version) -> etag
+_etag_memo: OrderedDict = OrderedDict()
+
+# Below this the encoding overhead outweighs the saving
+_COMPRESS_MIN_BYTES = 1024
+
+
+def compression_enabled() -> bool:
+    """STATUS_MONITOR_HTTP_COMPRESS=0 when a proxy in front already compresses."""
+    v = (os.getenv("STATUS_MONITOR_HTTP_COMPRESS") or "1").strip().lower()
+    return v not in ("0", "false", "no", "off")
+
+
+def _content_etag(payload: dict, version: Any = None) -> str:
+    stable = {k: v for k, v in payload.items() if k != "snapshot"}
+    stable["snapshot_version"] = version
+    blob = json.dumps(stable, sort_keys=True, default=str, separators=(",", ":")).encode("utf-8")
+    # Weak: the br, gzip and identity bodies share it, and a strong validator must differ per coding
+    return 'W/"' + hashlib.blake2b(blob, digest_size=16).hexdigest() + '"'
+
+
+def view_etag(payload: dict, memo_key: str) -> str:
+    """Weak ETag for a view payload; cached per snapshot version when the payload carries one."""
+    version = (payload.get("snapshot") or {}).get("version") if isinstance(payload, dict) else None
+    if version is None:
+        return _content_etag(payload)
+    key = (memo_key, version)
+    with _etag_lock:
+        etag = _etag_memo.get(key)
+        if etag is not None:
+            _etag_memo.move_to_end(key)
+            return etag
+    etag = _content_etag(payload, version)
+    with _etag_lock:
+        _etag_memo[key] = etag
+        while len(_etag_memo) > _ETAG_MEMO_MAX:
+            _etag_memo.popitem(last=False)
+    return etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for this header)."""
+    if not if_none_match:
+        return False
+    bare = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == bare:
+            return True
+    return False
+
+
+def _brotli_module():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def pick_encoding(accept_encoding: str | None) -> str | None:
+    """``br`` or ``gzip`` from an Accept-Encoding header (q=0 excluded), else None."""
+    if not accept_encoding or not compression_enabled():
+        return None
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip().lower())
+    if "br" in accepted and _brotli_module() is not None:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def encode_body(body: bytes, encoding: str | None) -> tuple[bytes, str | None]:
+    """(bytes, Content-Encoding) — identity for small bodies or when nothing was negotiated."""
+    if encoding is None or len(body) < _COMPRESS_MIN_BYTES:
+        return body, None
+    if encoding == "br":
+        brotli = _brotli_module()
+        if brotli is not None:
+            return brotli.compress(body, quality=5), "br"
+    return gzip.compress(body, compresslevel=6), "gzip"
+
+
+def json_body(payload: Any) -> bytes:
+    return json.dumps(payload, default=str, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,136 @@
+"""
+Service-universe registry for the status monitor: bundled ``lists/*.txt`` files and resolved
+per-environment service lists, loaded once instead of on every request.
+
+``list_file_names(path)`` keeps each file's names in memory and re-reads it only when its
+(mtime, size) changes (checked at most once a second). ``derived(path, tag, build)`` caches values computed from a file (sorted
+lists, normalized key sets) under the same signature, so per-tile lookups such as "is this an
+org-wall service" are set lookups. ``resolved(key, deps, build)`` memoizes a resolved list
+(which may include a Datadog APM catalog call) for the TTL its build returns, drops it early
+when any dependency file changes, and builds it once when many threads ask at the same time.
+
+Env:
+  STATUS_MONITOR_SERVICE_LIST_TTL_SECS=300  — resolved service lists (0 = resolve every call)
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable
+
+
+def _ttl_from_env() -> int:
+    try:
+        return max(0, min(86400, int(os.getenv("STATUS_MONITOR_SERVICE_LIST_TTL_SECS", "300"))))
+    except (TypeError, ValueError):
+        return 300
+
+
+SERVICE_LIST_TTL_SECS = _ttl_from_env()
+
+_lock = threading.Lock()
+# path -> (signature, names)
+_files: dict[str, tuple[tuple, tuple[str, ...]]] = {}
+# (path, tag) -> (signature, value)
+_derived: dict[tuple[str, str], tuple[tuple, Any]] = {}
+# key -> (expires_at, dep signatures, value)
+_resolved: dict[Any, tuple[float, tuple, Any]] = {}
+_resolve_locks: dict[Any, threading.Lock] = {}
+# path -> (checked_at, signature): files are stat'ed at most once a second, not once per tile
+_stat_memo: dict[str, tuple[float, tuple | None]] = {}
+_STAT_RECHECK_SECS = 1.0
+
+
+def file_signature(path: str | os.PathLike | None) -> tuple | None:
+    """(mtime_ns, size) of a file, or None when it is missing."""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _signature(path) -> tuple | None:
+    if not path:
+        return None
+    path = os.fspath(path)
+    now = time.monotonic()
+    hit = _stat_memo.get(path)
+    if hit is not None and now - hit[0] < _STAT_RECHECK_SECS:
+        return hit[1]
+    sig = file_signature(path)
+    _stat_memo[path] = (now, sig)
+    return sig
+
+
+def _read_names(path: str) -> tuple[str, ...]:
+    with open(path, encoding="utf-8") as f:
+        return tuple(s for s in (ln.strip() for ln in f) if s and not s.startswith("#"))
+
+
+def list_file_names(path: str | os.PathLike) -> tuple[str, ...]:
+    """Non-comment, non-blank lines of a list file. Raises OSError when it cannot be read."""
+    path = os.fspath(path)
+    sig = _signature(path)
+    if sig is None:
+        raise FileNotFoundError(path)
+    hit = _files.get(path)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    names = _read_names(path)
+    with _lock:
+        _files[path] = (sig, names)
+    return names
+
+
+def derived(path: str | os.PathLike, tag: str, build: Callable[[tuple[str, ...]], Any], default: Any = None) -> Any:
+    """build(names) for a list file, cached until the file changes; ``default`` if it is unreadable."""
+    path = os.fspath(path)
+    sig = _signature(path)
+    if sig is None:
+        return default
+    hit = _derived.get((path, tag))
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    try:
+        value = build(list_file_names(path))
+    except OSError:
+        return default
+    with _lock:
+        _derived[(path, tag)] = (sig, value)
+    return value
+
+
+def resolved(key: Any, deps: tuple, build: Callable[[], tuple[Any, float]]) -> Any:
+    """
+    Value of build() -> (value, ttl_secs), memoized per key for ttl_secs (not stored when <= 0)
+    and invalidated early when the signature of any path in ``deps`` changes. Concurrent callers
+    for one key share a single build.
+    """
+    sigs = tuple(_signature(p) for p in deps)
+    hit = _resolved.get(key)
+    if hit is not None and hit[0] > time.time() and hit[1] == sigs:
+        return hit[2]
+    with _lock:
+        klock = _resolve_locks.setdefault(key, threading.Lock())
+    with klock:
+        hit = _resolved.get(key)
+        if hit is not None and hit[0] > time.time() and hit[1] == sigs:
+            return hit[2]
+        value, ttl = build()
+        if ttl > 0:
+            with _lock:
+                _resolved[key] = (time.time() + ttl, sigs, value)
+    return value
+
+
+def clear() -> None:
+    """Forget every cached file and resolved list (next lookup reloads)."""
+    with _lock:
+        _files.clear()
+        _derived.clear()
+        _resolved.clear()
+        _stat_memo.clear()
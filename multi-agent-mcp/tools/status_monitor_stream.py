@@ -0,0 +1,114 @@
+"""
+Delta encoding and Server-Sent Events framing for live status walls.
+
+A wall stream carries one or more channels (``wall`` for /statuswall, one per APM env on
+/apm-services). The first event per channel is the full payload; later events are ``delta``
+ops against the previous snapshot, keyed per tile so a status flip costs one tile object
+instead of the whole wall. Ops (``p`` = path of dict keys / list indexes):
+
+  {"p": [...], "v": value}               set / replace
+  {"p": [...], "d": 1}                   delete dict key
+  {"p": [...], "t": [ids], "s": {id: tile}}  rebuild a tile list: new order by id, changed tiles only
+
+Tile ids are ``service|environment``. The event id is the stream cursor (every channel's
+snapshot version) so EventSource's automatic Last-Event-ID reconnect resumes with deltas.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Per-request metadata (age, stale flag) is sent next to the ops, never diffed
+_DELTA_SKIP_KEYS = frozenset({"snapshot"})
+
+
+def wall_tile_id(tile: dict) -> str:
+    return f"{tile.get('service') or ''}|{tile.get('environment') or ''}"
+
+
+def _tile_list_ids(items: list) -> list[str] | None:
+    """Ids when every element is a service tile with a unique id, else None."""
+    if not items:
+        return None
+    ids = []
+    for it in items:
+        if not isinstance(it, dict) or "service" not in it:
+            return None
+        ids.append(wall_tile_id(it))
+    if len(set(ids)) != len(ids):
+        return None
+    return ids
+
+
+def _diff(old: Any, new: Any, path: list, ops: list) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for k, v in new.items():
+            if not path and k in _DELTA_SKIP_KEYS:
+                continue
+            if k not in old:
+                ops.append({"p": path + [k], "v": v})
+            elif old[k] != v:
+                _diff(old[k], v, path + [k], ops)
+        for k in old:
+            if k not in new and not (not path and k in _DELTA_SKIP_KEYS):
+                ops.append({"p": path + [k], "d": 1})
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        new_ids = _tile_list_ids(new)
+        old_ids = _tile_list_ids(old)
+        if new_ids is not None and old_ids is not None:
+            old_by_id = dict(zip(old_ids, old))
+            changed = {i: t for i, t in zip(new_ids, new) if old_by_id.get(i) != t}
+            if changed or new_ids != old_ids:
+                ops.append({"p": path, "t": new_ids, "s": changed})
+            return
+        if len(old) == len(new):
+            for i, (a, b) in enumerate(zip(old, new)):
+                if a != b:
+                    _diff(a, b, path + [i], ops)
+            return
+    ops.append({"p": path, "v": new})
+
+
+def wall_delta(old: dict, new: dict) -> list[dict]:
+    """Ops turning ``old`` into ``new`` (ignoring the top-level ``snapshot`` meta)."""
+    ops: list[dict] = []
+    if old != new:
+        _diff(old, new, [], ops)
+    return ops
+
+
+def encode_cursor(versions: dict[str, float]) -> str:
+    """``chan=version|chan=version`` — stable order so identical states give identical ids."""
+    return "|".join(f"{ch}={v:.3f}" for ch, v in sorted(versions.items()))
+
+
+def decode_cursor(raw: str | None) -> dict[str, float]:
+    out: dict[str, float] = {}
+    for part in (raw or "").split("|"):
+        ch, sep, v = part.partition("=")
+        if not sep:
+            continue
+        try:
+            out[ch.strip()] = float(v)
+        except ValueError:
+            continue
+    return out
+
+
+def sse_event(event: str, data: Any, event_id: str | None = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    # Compact JSON never contains raw newlines, so one data: line suffices
+    lines.append("data: " + json.dumps(data, default=str, separators=(",", ":")))
+    return "\n".join(lines) + "\n\n"
+
+
+def sse_retry(ms: int) -> str:
+    return f"retry: {int(ms)}\n\n"
+
+
+def sse_comment(text: str = "keepalive") -> str:
+    return f": {text}\n\n"
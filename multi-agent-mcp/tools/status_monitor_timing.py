@@ -0,0 +1,137 @@
+"""
+Per-phase timers for status monitor views.
+
+``perf_phase(name, env)`` times one stage (service-list resolution, Datadog health, monitor index,
+EKS attach, PagerDuty, Splunk badges, rendering). Every sample feeds a per-worker aggregate
+(percentiles per phase and environment, see ``perf_stats``). A sample also goes to the current
+request's collector when one is active (``begin_request``), which app.py turns into a
+``Server-Timing`` header. Worker pools only see the collector if tasks are submitted through
+``submit_in_context``.
+
+Phases nest and overlap: dd_monitors runs inside dd_health, pagerduty beside it, so durations
+are not additive. Views served from a snapshot record no phases; a background refresh records
+only to the aggregate.
+
+Env:
+  STATUS_MONITOR_PERF_SAMPLES=512  — samples kept per (phase, environment)
+"""
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+def _samples_max() -> int:
+    try:
+        return max(16, min(10000, int(os.getenv("STATUS_MONITOR_PERF_SAMPLES", "512"))))
+    except (TypeError, ValueError):
+        return 512
+
+
+_SAMPLES_MAX = _samples_max()
+_lock = threading.Lock()
+# (phase, env) -> [deque of seconds, total count, total seconds]
+_agg: dict[tuple[str, str], list] = {}
+_started_at = time.time()
+
+_collector: contextvars.ContextVar = contextvars.ContextVar("sm_perf_collector", default=None)
+
+
+class _Collector:
+    __slots__ = ("lock", "samples")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples: list[tuple[str, str, float]] = []
+
+
+def perf_record(name: str, env: str | None, secs: float) -> None:
+    env = env or ""
+    secs = max(0.0, float(secs))
+    with _lock:
+        slot = _agg.get((name, env))
+        if slot is None:
+            slot = _agg[(name, env)] = [deque(maxlen=_SAMPLES_MAX), 0, 0.0]
+        slot[0].append(secs)
+        slot[1] += 1
+        slot[2] += secs
+    col = _collector.get()
+    if col is not None:
+        with col.lock:
+            col.samples.append((name, env, secs))
+
+
+@contextmanager
+def perf_phase(name: str, env: str | None = None):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        perf_record(name, env, time.perf_counter() - t0)
+
+
+def submit_in_context(executor, fn, *args, **kwargs):
+    """executor.submit that keeps the caller's request collector (contextvars do not cross threads)."""
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def begin_request():
+    """Start collecting phases for the current request; pass the token to end_request."""
+    return _collector.set(_Collector())
+
+
+def end_request(token) -> list[tuple[str, str, float]]:
+    col = _collector.get()
+    _collector.reset(token)
+    if col is None:
+        return []
+    with col.lock:
+        return list(col.samples)
+
+
+def server_timing_header(samples: list[tuple[str, str, float]], total_secs: float | None = None) -> str:
+    """``phase;dur=ms;desc="env"`` entries, one per (phase, env) summed over the request."""
+    summed: dict[tuple[str, str], float] = {}
+    for name, env, secs in samples:
+        summed[(name, env)] = summed.get((name, env), 0.0) + secs
+    parts = []
+    for (name, env), secs in summed.items():
+        item = f"{name};dur={secs * 1000:.1f}"
+        if env:
+            item += f';desc="{env}"'
+        parts.append(item)
+    if total_secs is not None:
+        parts.append(f"total;dur={total_secs * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def _pct(sorted_vals: list[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    i = min(len(sorted_vals) - 1, max(0, int(round(q * (len(sorted_vals) - 1)))))
+    return sorted_vals[i]
+
+
+def perf_stats(reset: bool = False) -> dict:
+    """{"phases": {phase: {env: {count, window, p50_ms, p90_ms, p99_ms, max_ms, mean_ms}}}} for this worker."""
+    with _lock:
+        snap = {k: (list(v[0]), v[1], v[2]) for k, v in _agg.items()}
+        if reset:
+            _agg.clear()
+    phases: dict[str, dict] = {}
+    for (name, env), (vals, count, total) in sorted(snap.items()):
+        vals.sort()
+        phases.setdefault(name, {})[env or "-"] = {
+            "count": count,
+            "window": len(vals),
+            "p50_ms": round(_pct(vals, 0.50) * 1000, 1),
+            "p90_ms": round(_pct(vals, 0.90) * 1000, 1),
+            "p99_ms": round(_pct(vals, 0.99) * 1000, 1),
+            "max_ms": round((vals[-1] if vals else 0.0) * 1000, 1),
+            "mean_ms": round(total / count * 1000, 1) if count else 0.0,
+        }
+    return {"since": _started_at, "phases": phases}